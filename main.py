@@ -4,6 +4,7 @@
 Skeleton Analyzer 출력 데이터를 인체공학적 평가 문서로 변환하는 도구
 """
 
+import multiprocessing
 import sys
 
 from PyQt6.QtWidgets import QApplication
@@ -20,4 +21,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 패키징된 실행 파일에서 프로세스 풀 작업자 실행 지원
+    multiprocessing.freeze_support()
     main()
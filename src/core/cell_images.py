@@ -0,0 +1,75 @@
+"""셀 이미지 처리 모듈
+
+엑셀 셀에 배치된 이미지를 파일로 저장하고 썸네일을 생성합니다.
+프로세스 풀 작업자에서 실행되므로 PIL 외의 무거운 모듈을 임포트하지 않습니다.
+(Pillow 대신 Pillow-SIMD를 설치하면 리샘플링이 더 빨라지며 코드 변경은 필요 없습니다.)
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PIL import Image
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def process_cell_image(
+    img_data: bytes,
+    row: int,
+    col: int,
+    images_dir: Path,
+    thumbnail_size: int,
+) -> Tuple[str, Path, Path]:
+    """단일 셀 이미지 저장 및 썸네일 생성
+
+    Args:
+        img_data: 이미지 바이트 데이터
+        row: 행 번호 (1-based)
+        col: 열 번호
+        images_dir: 이미지 저장 디렉토리
+        thumbnail_size: 썸네일 최대 크기 (px)
+
+    Returns:
+        (cell_key, 이미지 경로, 썸네일 경로)
+    """
+    cell_key = f"{row}_{col}"
+    img_path = images_dir / f"img_{row}_{col}.png"
+    thumb_path = images_dir / f"thumb_{row}_{col}.png"
+
+    # 원본 이미지 저장 (PNG는 재인코딩 없이 그대로 기록, 그 외 형식은 PNG로 변환)
+    thumb_img = Image.open(BytesIO(img_data))
+    if img_data.startswith(_PNG_SIGNATURE):
+        img_path.write_bytes(img_data)
+    else:
+        Image.open(BytesIO(img_data)).save(img_path, "PNG")
+
+    # 썸네일 생성 및 저장 (JPEG은 디코딩 단계에서 축소)
+    thumb_img.draft("RGB", (thumbnail_size * 2, thumbnail_size * 2))
+    # 수십 px 썸네일은 BILINEAR로 충분하고, 압축도 최소 수준으로 저장
+    thumb_img.thumbnail((thumbnail_size, thumbnail_size), Image.Resampling.BILINEAR)
+    thumb_img.save(thumb_path, "PNG", compress_level=1)
+
+    return cell_key, img_path, thumb_path
+
+
+def try_process_cell_image(
+    img_data: bytes,
+    row: int,
+    col: int,
+    images_dir: Path,
+    thumbnail_size: int,
+) -> Tuple[Optional[Tuple[str, Path, Path]], Optional[str]]:
+    """process_cell_image 실행 후 예외를 에러 메시지로 반환
+
+    executor.map에서 한 이미지의 실패가 나머지 결과 수집을 중단시키지 않도록 합니다.
+
+    Returns:
+        (처리 결과, None) 또는 실패 시 (None, 에러 메시지)
+    """
+    try:
+        return process_cell_image(img_data, row, col, images_dir, thumbnail_size), None
+    except Exception as e:
+        return None, str(e)
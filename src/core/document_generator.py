@@ -5,14 +5,25 @@
 
 from __future__ import annotations
 
+import re
+import string
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from jinja2 import Template as Jinja2Template
+from jinja2 import Environment, Template as Jinja2Template
 
 from src.core.template_manager import TemplateManager, Template
 from src.core.mapper import Mapper
 
+# 공용 Jinja2 환경 (Jinja2Template(...) 기본 설정과 동일)
+_JINJA_ENV = Environment()
+
+# 파일명 패턴에서 사용할 수 있는 필드
+_FILENAME_FIELDS = frozenset({"template", "row", "frame"})
+
 
 class DocumentGeneratorError(Exception):
     """문서 생성기 에러"""
@@ -26,9 +37,15 @@ class DocumentGenerator:
     템플릿과 데이터를 결합하여 HTML/PDF/이미지 문서를 생성합니다.
     """
 
+    MAX_WORKERS = 4  # 일괄 생성 병렬 스레드 수
+    TASK_PREFETCH = 8  # 스레드 풀에 미리 제출해 둘 최대 작업 수
+    WRITE_BUFFER_SIZE = 128 * 1024  # 파일 쓰기 버퍼 크기 (128KB)
+
     def __init__(self, template_manager: TemplateManager):
         self._template_manager = template_manager
         self._cancelled = False
+        # 템플릿 경로 → (수정 시각, 컴파일된 템플릿)
+        self._template_cache: Dict[str, Tuple[int, Jinja2Template]] = {}
 
     def cancel(self):
         """생성 취소"""
@@ -56,38 +73,87 @@ class DocumentGenerator:
         Returns:
             생성된 파일 경로
         """
+        template, mapper = self._prepare_template(template_name, excel_headers)
+        mapped_data = self._map_row(template, mapper, row_data)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return self._render_and_write(template, mapped_data, output_path)
+
+    def _prepare_template(
+        self,
+        template_name: str,
+        excel_headers: Optional[List[str]],
+    ) -> Tuple[Template, Optional[Mapper]]:
+        """템플릿 조회 및 매퍼 생성 (일괄 생성 시 템플릿당 1회)
+
+        Args:
+            template_name: 템플릿 이름
+            excel_headers: 엑셀 헤더 (매핑용)
+
+        Returns:
+            (템플릿, 매퍼) 튜플. 헤더가 없으면 매퍼는 None
+
+        Raises:
+            DocumentGeneratorError: 템플릿을 찾을 수 없는 경우
+        """
         template = self._template_manager.get(template_name)
         if template is None:
             raise DocumentGeneratorError(f"템플릿을 찾을 수 없습니다: {template_name}")
 
-        # 매핑 적용
+        mapper = None
         if excel_headers:
             mapper = Mapper(template.fields, excel_headers)
-            mapped_data = mapper.apply(row_data)
-        else:
-            # 헤더가 없으면 직접 매핑 시도
-            mapped_data = {}
-            for field in template.fields:
-                field_id = field["id"]
-                excel_col = field.get("excel_column", "")
-                mapped_data[field_id] = row_data.get(excel_col)
-
-        # HTML 렌더링
+            mapper.prepare()  # 작업 스레드에서 apply하기 전에 매핑 계획 생성
+        return template, mapper
+
+    def _map_row(
+        self,
+        template: Template,
+        mapper: Optional[Mapper],
+        row_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """행 데이터에 매핑 적용"""
+        if mapper is not None:
+            return mapper.apply(row_data)
+
+        # 헤더가 없으면 직접 매핑 시도
+        return {
+            field["id"]: row_data.get(field.get("excel_column", ""))
+            for field in template.fields
+        }
+
+    def _render_and_write(
+        self,
+        template: Template,
+        mapped_data: Dict[str, Any],
+        output_path: Path,
+    ) -> Path:
+        """HTML 렌더링 후 파일 저장 (출력 디렉토리는 호출 측에서 생성)"""
         html_content = self._render_html(template, mapped_data)
 
-        # 파일 저장
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html_content, encoding="utf-8")
+        # 파일 저장 (한 번에 인코딩 후 단일 write)
+        data = html_content.encode("utf-8")
+        with open(output_path, "wb", buffering=max(len(data), self.WRITE_BUFFER_SIZE)) as f:
+            f.write(data)
 
         return output_path
 
     def _render_html(self, template: Template, data: Dict[str, Any]) -> str:
         """HTML 템플릿 렌더링"""
-        with open(template.template_path, "r", encoding="utf-8") as f:
-            html_template = f.read()
+        return self._get_jinja_template(template.template_path).render(**data)
+
+    def _get_jinja_template(self, template_path: Path) -> Jinja2Template:
+        """컴파일된 Jinja2 템플릿 반환 (파일이 변경된 경우에만 다시 읽고 컴파일)"""
+        cache_key = str(template_path)
+        mtime = template_path.stat().st_mtime_ns
+        cached = self._template_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
 
-        jinja_template = Jinja2Template(html_template)
-        return jinja_template.render(**data)
+        with open(template_path, "r", encoding="utf-8") as f:
+            html_template = f.read()
+        jinja_template = _JINJA_ENV.from_string(html_template)
+        self._template_cache[cache_key] = (mtime, jinja_template)
+        return jinja_template
 
     def batch_generate_html(
         self,
@@ -114,35 +180,13 @@ class DocumentGenerator:
         self.reset()
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        generated_files = []
-        total = len(rows_data)
-
-        for i, row_data in enumerate(rows_data):
-            if self._cancelled:
-                break
-
-            # 파일명 생성
-            filename = filename_pattern.format(
-                template=template_name,
-                row=i + 1,
-                frame=row_data.get("Frame", i + 1),
-            )
-            output_path = output_dir / filename
-
-            # HTML 생성
-            self.generate_html(
-                template_name=template_name,
-                row_data=row_data,
-                output_path=output_path,
-                excel_headers=excel_headers,
-            )
-
-            generated_files.append(output_path)
+        filenames = self._format_filenames(filename_pattern, template_name, rows_data)
+        tasks = [
+            (template_name, row_data, output_dir / filename, filename)
+            for row_data, filename in zip(rows_data, filenames)
+        ]
 
-            if progress_callback:
-                progress_callback(i + 1, total, filename)
-
-        return generated_files
+        return self._generate_parallel(tasks, excel_headers, progress_callback)
 
     def batch_generate_all(
         self,
@@ -171,49 +215,152 @@ class DocumentGenerator:
         self.reset()
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        generated_files = []
-        total = len(template_names) * len(rows_data)
-        current = 0
+        # 행별 폴더는 템플릿과 무관하므로 한 번만 계산
+        if structure == "by_row":
+            row_dirs = [output_dir / f"row_{i + 1:03d}" for i in range(len(rows_data))]
 
+        tasks = []
         for template_name in template_names:
+            # 출력 경로 결정
+            if structure == "by_template":
+                sub_dirs = [output_dir / template_name] * len(rows_data)
+            elif structure == "by_row":
+                sub_dirs = row_dirs
+            else:
+                sub_dirs = [output_dir] * len(rows_data)
+
+            filenames = self._format_filenames(filename_pattern, template_name, rows_data)
+            tasks.extend(
+                (template_name, row_data, sub_dir / filename, filename)
+                for row_data, sub_dir, filename in zip(rows_data, sub_dirs, filenames)
+            )
+
+        return self._generate_parallel(tasks, excel_headers, progress_callback)
+
+    @staticmethod
+    def _format_filenames(
+        filename_pattern: str,
+        template_name: str,
+        rows_data: List[Dict[str, Any]],
+    ) -> List[str]:
+        """행별 출력 파일명 생성
+
+        Args:
+            filename_pattern: 파일명 패턴 ({template}, {row}, {frame} 사용 가능)
+            template_name: 템플릿 이름
+            rows_data: 행 데이터 목록
+
+        Returns:
+            행 순서대로의 파일명 목록
+
+        Raises:
+            DocumentGeneratorError: 패턴이 잘못되었거나 알 수 없는 필드를 사용한 경우
+        """
+        # 패턴은 배치당 1회만 파싱하여 검증하고 사용 필드 확인
+        try:
+            field_names = {
+                re.split(r"[.\[]", name, maxsplit=1)[0]
+                for _, name, _, _ in string.Formatter().parse(filename_pattern)
+                if name is not None
+            }
+        except ValueError as e:
+            raise DocumentGeneratorError(f"잘못된 파일명 패턴입니다: {filename_pattern}") from e
+
+        unknown = field_names - _FILENAME_FIELDS
+        if unknown:
+            raise DocumentGeneratorError(
+                f"파일명 패턴에 알 수 없는 필드가 있습니다: {', '.join(sorted(unknown))}"
+            )
+
+        fields = {"template": template_name}
+        use_row = "row" in field_names
+        use_frame = "frame" in field_names
+        if not (use_row or use_frame):
+            # 행과 무관한 패턴은 한 번만 포맷
+            return [filename_pattern.format_map(fields)] * len(rows_data)
+
+        filenames = []
+        for i, row_data in enumerate(rows_data, start=1):
+            if use_row:
+                fields["row"] = i
+            if use_frame:
+                fields["frame"] = row_data.get("Frame", i)
+            filenames.append(filename_pattern.format_map(fields))
+        return filenames
+
+    def _generate_parallel(
+        self,
+        tasks: List[Tuple[str, Dict[str, Any], Path, str]],
+        excel_headers: Optional[List[str]],
+        progress_callback: Optional[Callable[[int, int, str], None]],
+    ) -> List[Path]:
+        """생성 작업 병렬 실행
+
+        렌더링과 파일 저장은 스레드 풀에서 수행하고, 진행 콜백은
+        호출 스레드에서 작업 순서대로 호출합니다.
+
+        Args:
+            tasks: (템플릿 이름, 행 데이터, 출력 경로, 파일명) 목록
+            excel_headers: 엑셀 헤더
+            progress_callback: 진행 콜백 (current, total, filename)
+
+        Returns:
+            생성된 파일 경로 목록
+        """
+        generated_files = []
+        total = len(tasks)
+
+        # 출력 디렉토리는 행마다가 아니라 디렉토리당 1회만 생성
+        for directory in {task[2].parent for task in tasks}:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # 템플릿 조회와 매퍼 생성은 템플릿당 1회만 수행
+        prepared = {
+            template_name: self._prepare_template(template_name, excel_headers)
+            for template_name in dict.fromkeys(task[0] for task in tasks)
+        }
+        # 작업 스레드들이 첫 렌더링에서 같은 템플릿을 중복 컴파일하지 않도록 미리 컴파일
+        for template, _ in prepared.values():
+            self._get_jinja_template(template.template_path)
+
+        def generate(task) -> Optional[Path]:
+            template_name, row_data, output_path, _ = task
             if self._cancelled:
-                break
-
-            for i, row_data in enumerate(rows_data):
-                if self._cancelled:
-                    break
-
-                current += 1
-
-                # 출력 경로 결정
-                if structure == "by_template":
-                    sub_dir = output_dir / template_name
-                elif structure == "by_row":
-                    sub_dir = output_dir / f"row_{i + 1:03d}"
-                else:
-                    sub_dir = output_dir
-
-                sub_dir.mkdir(parents=True, exist_ok=True)
-
-                # 파일명 생성
-                filename = filename_pattern.format(
-                    template=template_name,
-                    row=i + 1,
-                    frame=row_data.get("Frame", i + 1),
-                )
-                output_path = sub_dir / filename
-
-                # HTML 생성
-                self.generate_html(
-                    template_name=template_name,
-                    row_data=row_data,
-                    output_path=output_path,
-                    excel_headers=excel_headers,
-                )
-
-                generated_files.append(output_path)
-
-                if progress_callback:
-                    progress_callback(current, total, filename)
+                return None
+            template, mapper = prepared[template_name]
+            mapped_data = self._map_row(template, mapper, row_data)
+            return self._render_and_write(template, mapped_data, output_path)
+
+        # 같은 출력 경로를 여러 작업이 쓰면(행과 무관한 파일명 패턴) 동시에 쓰다 내용이 섞이지 않도록
+        # 순차 실행하여 기존처럼 마지막 행이 남게 함
+        workers = self.MAX_WORKERS if len({task[2] for task in tasks}) == total else 1
+
+        # 작업은 TASK_PREFETCH개 단위로만 제출하여 취소/에러 시 남은 행을 처리하지 않음
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            task_iter = iter(tasks)
+            pending = deque(
+                (task, executor.submit(generate, task))
+                for task in islice(task_iter, self.TASK_PREFETCH)
+            )
+            try:
+                current = 0
+                while pending:
+                    task, future = pending.popleft()
+                    next_task = next(task_iter, None)
+                    if next_task is not None:
+                        pending.append((next_task, executor.submit(generate, next_task)))
+
+                    output_path = future.result()
+                    if self._cancelled or output_path is None:
+                        break
+
+                    current += 1
+                    generated_files.append(output_path)
+
+                    if progress_callback:
+                        progress_callback(current, total, task[3])
+            finally:
+                # 취소/에러인 경우 대기 중인 작업 정리 (에러는 정리 후 그대로 전파)
+                executor.shutdown(wait=True, cancel_futures=True)
 
         return generated_files
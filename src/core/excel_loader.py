@@ -7,20 +7,72 @@ Skeleton Analyzer에서 생성된 엑셀 파일을 로드하고 데이터를 제
 
 from __future__ import annotations
 
+import gc
+import logging
+import multiprocessing
+import posixpath
+import re
 import shutil
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import zipfile
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from datetime import date, datetime, time as dt_time
+from functools import partial
 from io import BytesIO
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Optional, List, Dict, Union, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Optional, List, Dict, Union, Tuple, Mapping
 
+import numpy as np
 import openpyxl
+from openpyxl.utils import get_column_letter, column_index_from_string
 from openpyxl.utils.exceptions import InvalidFileException
+from openpyxl.worksheet.formula import ArrayFormula, DataTableFormula
+from openpyxl.xml.functions import fromstring
 import formulas
-from PIL import Image
 
+try:
+    from python_calamine import CalamineWorkbook
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+    CalamineWorkbook = None
+
+from src.core.cell_images import try_process_cell_image
 from src.core.logger import get_logger
 
+# formulas 셀 키의 시트 접두부 패턴: '[파일명]시트명' 또는 [파일명]시트명
+_SHEET_PREFIX_PATTERN = re.compile(r"'?\[.*?\](.+?)'?$")
+
+# 이미지 셀 정수 키의 행 시프트 (엑셀 최대 열 수 16384보다 넓은 비트 폭)
+_IMAGE_ROW_SHIFT = 20
+
+# 이미지 처리 프로세스 풀의 시작 방식. 로드는 GUI 프로세스의 작업자 스레드에서 실행되므로
+# 다른 스레드가 잡고 있던 락을 복제해 자식이 멈출 수 있는 fork 대신 spawn 사용
+_PROCESS_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# 셀 주소의 행 번호 문자
+_DIGITS = "0123456789"
+
+# openpyxl이 수식 셀 값으로 반환하는 문자열 외 타입
+_FORMULA_VALUE_TYPES = (ArrayFormula, DataTableFormula)
+
+# 추가 변환 없이 그대로 사용하는 값 타입
+_PLAIN_VALUE_TYPES = frozenset((int, str, bool, type(None)))
+
+# OOXML 네임스페이스 (이미지 추출용)
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_NS_XDR = "{http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing}"
+_NS_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
 
 class ExcelLoaderError(Exception):
     """ExcelLoader 관련 에러"""
@@ -28,6 +80,109 @@ class ExcelLoaderError(Exception):
     pass
 
 
+def _from_calamine_value(value: Any) -> Any:
+    """calamine 값을 openpyxl과 같은 형태로 변환 (빈 문자열 → None, 정수 float → int, 날짜 → 자정 datetime)"""
+    if value == "":
+        return None
+    if type(value) is float and value.is_integer():
+        return int(value)
+    if type(value) is date:
+        # calamine은 시각이 없는 날짜 셀을 date로 반환하지만 openpyxl은 항상 datetime
+        return datetime.combine(value, dt_time())
+    return value
+
+
+def _read_part_rels(archive: zipfile.ZipFile, part_path: str) -> dict[str, tuple[str, str]]:
+    """파트의 관계 파일을 읽어 rId → (관계 타입, 대상 파트 경로) 매핑 반환
+
+    Args:
+        archive: 엑셀 ZIP 아카이브
+        part_path: 파트 경로 (예: xl/workbook.xml, 패키지 루트는 빈 문자열)
+
+    Returns:
+        관계 매핑 (관계 파일이 없으면 빈 dict, 외부 링크는 제외)
+    """
+    folder, name = posixpath.split(part_path)
+    rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+    try:
+        root = fromstring(archive.read(rels_path))
+    except KeyError:
+        return {}
+
+    rels = {}
+    for rel in root.iter(f"{_NS_PKG_REL}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(folder, target))
+        rels[rel.get("Id")] = (rel.get("Type", ""), target)
+    return rels
+
+
+def _read_sheet_images(archive: zipfile.ZipFile, sheet_name: str) -> list[tuple[bytes, int, int]]:
+    """워크북 전체를 열지 않고 시트에 배치된 이미지 데이터 수집
+
+    지정한 시트가 없으면 활성 시트를 사용합니다.
+
+    Args:
+        archive: 엑셀 ZIP 아카이브
+        sheet_name: 시트 이름
+
+    Returns:
+        (이미지 바이트, 행 번호 1-based, 열 번호 0-based) 목록
+    """
+    workbook_path = next(
+        (target for rel_type, target in _read_part_rels(archive, "").values()
+         if rel_type.endswith("/officeDocument")),
+        "xl/workbook.xml",
+    )
+    workbook = fromstring(archive.read(workbook_path))
+
+    sheets = [
+        (sheet.get("name"), sheet.get(f"{_NS_REL}id"))
+        for sheet in workbook.iter(f"{_NS_MAIN}sheet")
+    ]
+    if not sheets:
+        return []
+    sheet_rid = next((rid for name, rid in sheets if name == sheet_name), None)
+    if sheet_rid is None:
+        view = workbook.find(f"{_NS_MAIN}bookViews/{_NS_MAIN}workbookView")
+        active = int(view.get("activeTab", 0)) if view is not None else 0
+        sheet_rid = sheets[active if 0 <= active < len(sheets) else 0][1]
+
+    workbook_rels = _read_part_rels(archive, workbook_path)
+    if sheet_rid not in workbook_rels:
+        return []
+    sheet_path = workbook_rels[sheet_rid][1]
+
+    image_tasks = []
+    for rel_type, drawing_path in _read_part_rels(archive, sheet_path).values():
+        if not rel_type.endswith("/drawing"):
+            continue
+
+        drawing = fromstring(archive.read(drawing_path))
+        drawing_rels = _read_part_rels(archive, drawing_path)
+        for anchor in drawing:
+            # 셀 기준 앵커(twoCellAnchor, oneCellAnchor)의 그림만 대상
+            start = anchor.find(f"{_NS_XDR}from")
+            blip = anchor.find(f"{_NS_XDR}pic/{_NS_XDR}blipFill/{_NS_A}blip")
+            if start is None or blip is None:
+                continue
+
+            embed = drawing_rels.get(blip.get(f"{_NS_REL}embed"))
+            if embed is None:
+                continue
+
+            col = int(start.findtext(f"{_NS_XDR}col"))
+            row = int(start.findtext(f"{_NS_XDR}row")) + 1  # 0-based to 1-based
+            image_tasks.append((archive.read(embed[1]), row, col))
+
+    return image_tasks
+
+
 class ExcelLoader:
     """엑셀 파일 로더
 
@@ -37,18 +192,31 @@ class ExcelLoader:
     DEFAULT_SHEET_NAME = "Capture Data"
     IMAGES_DIR_NAME = ".images"
     THUMBNAIL_SIZE = 40  # 썸네일 크기
+    FORMULA_CACHE_SIZE = 4  # 수식 계산 결과를 보관할 최대 파일 수
+    IMAGE_WORKERS = 4  # 이미지 처리 병렬 작업자 수
+    PROCESS_POOL_MIN_IMAGES = 16  # 프로세스 풀을 사용할 최소 이미지 수 (적으면 스레드 풀)
+
+    # 수식 계산 결과 캐시 (경로, 수정 시각, 크기) → 계산된 값 (인스턴스 간 공유)
+    _formula_cache: dict[tuple[str, int, int], dict] = {}
 
-    def __init__(self, base_dir: Path | str | None = None):
+    def __init__(self, base_dir: Path | str | None = None, compute_formulas: bool = True):
+        """
+        Args:
+            base_dir: 이미지 디렉토리 기준 경로 (None이면 프로젝트 루트)
+            compute_formulas: False면 수식을 계산하지 않고 엑셀에 저장된 값 사용
+        """
         self._logger = get_logger("excel_loader")
+        self._compute_formulas = compute_formulas
         self._workbook = None
         self._sheet = None
         self._headers: list[str] = []
-        self._data: list[dict[str, Any]] = []
-        self._data_by_index: list[list[Any]] = []  # 인덱스 기반 데이터
+        self._columns: list[list[Any]] = []  # 컬럼별 데이터 (열 우선 저장)
+        self._row_count: int = 0
         self._file_path: Path | None = None
-        self._calculated_values: dict = {}  # 수식 계산 결과 캐시
+        self._calculated_values: dict = {}  # 수식 계산 결과 캐시 (시트명 대문자, 열 0-based, 행 1-based) → 값
         self._image_map: dict[str, Path] = {}  # 셀 주소 → 이미지 경로 매핑
         self._thumbnail_map: dict[str, Path] = {}  # 셀 주소 → 썸네일 경로 매핑
+        self._image_cells: dict[int, Path] = {}  # (행 << 20 | 열) → 이미지 경로 (셀 값 조회용)
 
         # 이미지 디렉토리 설정
         if base_dir is None:
@@ -62,9 +230,9 @@ class ExcelLoader:
         return self._images_dir
 
     @property
-    def thumbnail_map(self) -> dict[str, Path]:
-        """썸네일 경로 매핑"""
-        return self._thumbnail_map.copy()
+    def thumbnail_map(self) -> Mapping[str, Path]:
+        """썸네일 경로 매핑 (읽기 전용 뷰)"""
+        return MappingProxyType(self._thumbnail_map)
 
     def get_image_path(self, row: int, col: int) -> Path | None:
         """특정 셀의 이미지 경로 반환
@@ -113,7 +281,7 @@ class ExcelLoader:
     def row_count(self) -> int:
         """전체 행 수"""
         self._ensure_loaded()
-        return len(self._data)
+        return self._row_count
 
     def load(self, file_path: Path | str, progress_callback: callable = None) -> None:
         """엑셀 파일 로드
@@ -143,18 +311,36 @@ class ExcelLoader:
                 progress_callback(step, message)
 
         try:
-            # 1~3단계: formulas로 수식 계산
-            self._logger.info(f"수식 계산 시작: {file_path}")
-            self._calculate_formulas(file_path, update_progress)
-            self._logger.info("수식 계산 완료")
+            # 파일은 한 번만 읽고, 경로가 필요한 formulas 외에는 메모리 사본을 공유
+            file_data = file_path.read_bytes()
+
+            # 1~3단계: formulas로 수식 계산 (엑셀에 저장된 결과가 모두 있으면 생략)
+            if self._compute_formulas:
+                cached_values = self._read_cached_formula_values(file_data)
+                if cached_values is not None:
+                    update_progress(3, "값 변환 중...")
+                    self._logger.info(f"저장된 수식 결과 사용 (수식 계산 생략): {len(cached_values)}개 셀")
+                    self._calculated_values = cached_values
+                else:
+                    self._logger.info(f"수식 계산 시작: {file_path}")
+                    self._calculate_formulas(file_path, update_progress)
+                    self._logger.info("수식 계산 완료")
+            else:
+                self._logger.info("수식 계산 생략 (저장된 값 사용)")
+                self._calculated_values = {}
 
-            # 4단계: 이미지 추출 (read_only=False로 열어야 이미지 접근 가능)
+            # 4단계: 이미지 추출
             update_progress(4, "이미지 추출 중...")
-            self._extract_images(file_path)
+            self._extract_images(file_data)
 
-            # 5단계: openpyxl로 구조 로드
+            # 5단계: 구조 로드 (python-calamine이 있으면 빠른 읽기 경로 사용)
             update_progress(5, "데이터 로드 중...")
-            self._workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=False)
+            if HAS_CALAMINE:
+                self._workbook = CalamineWorkbook.from_filelike(BytesIO(file_data))
+            else:
+                self._workbook = openpyxl.load_workbook(
+                    BytesIO(file_data), read_only=True, data_only=not self._compute_formulas
+                )
         except InvalidFileException as e:
             raise ExcelLoaderError(f"잘못된 엑셀 파일 형식입니다: {e}")
         except Exception as e:
@@ -162,93 +348,43 @@ class ExcelLoader:
             raise ExcelLoaderError(f"파일 로드 실패: {e}")
 
         self._file_path = file_path
-        self._load_sheet()
+        if HAS_CALAMINE:
+            self._load_sheet_calamine()
+        else:
+            self._load_sheet()
 
-    def _process_single_image(self, img_data: bytes, row: int, col: int) -> Tuple[str, Path, Path]:
-        """단일 이미지 처리 (병렬 처리용)
+    def _extract_images(self, file_data: bytes) -> None:
+        """엑셀 파일에서 이미지 추출 (병렬 처리 + 썸네일 미리 생성)
 
         Args:
-            img_data: 이미지 바이트 데이터
-            row: 행 번호 (1-based)
-            col: 열 번호
-
-        Returns:
-            (cell_key, 이미지 경로, 썸네일 경로)
+            file_data: 엑셀 파일 내용
         """
-        cell_key = f"{row}_{col}"
-        img_path = self._images_dir / f"img_{row}_{col}.png"
-        thumb_path = self._images_dir / f"thumb_{row}_{col}.png"
-
-        # PIL로 이미지 처리 및 저장
-        pil_img = Image.open(BytesIO(img_data))
-        pil_img.save(img_path, "PNG")
-
-        # 썸네일 생성 및 저장
-        thumb_img = pil_img.copy()
-        thumb_img.thumbnail((self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE), Image.Resampling.LANCZOS)
-        thumb_img.save(thumb_path, "PNG")
-
-        return cell_key, img_path, thumb_path
-
-    def _extract_images(self, file_path: Path) -> None:
-        """엑셀 파일에서 이미지 추출 (병렬 처리 + 썸네일 미리 생성)"""
         t0 = time.time()
         self._image_map = {}
         self._thumbnail_map = {}
+        self._image_cells = {}
 
         try:
-            # read_only=False로 열어야 이미지 접근 가능
-            t_open = time.time()
-            wb = openpyxl.load_workbook(file_path, read_only=False)
-            self._logger.info(f"이미지용 워크북 열기: {time.time() - t_open:.2f}초")
-
-            # 대상 시트 선택
-            if self.DEFAULT_SHEET_NAME in wb.sheetnames:
-                sheet = wb[self.DEFAULT_SHEET_NAME]
-            else:
-                sheet = wb.active
-
-            images = sheet._images
-            if not images:
+            # 워크북 전체를 파싱하지 않고 ZIP에서 드로잉과 이미지 파트만 읽음
+            t_collect = time.time()
+            with zipfile.ZipFile(BytesIO(file_data)) as archive:
+                image_tasks = _read_sheet_images(archive, self.DEFAULT_SHEET_NAME)
+            if not image_tasks:
                 self._logger.info("이미지 없음")
-                wb.close()
                 return
+            self._logger.info(f"이미지 데이터 수집: {time.time() - t_collect:.2f}초, {len(image_tasks)}개")
 
             # 이미지 디렉토리 생성
             self._images_dir.mkdir(parents=True, exist_ok=True)
 
-            # 이미지 데이터 수집 (메인 스레드에서)
-            t_collect = time.time()
-            image_tasks = []
-            for img in images:
-                try:
-                    anchor = img.anchor
-                    if hasattr(anchor, '_from'):
-                        col = anchor._from.col
-                        row = anchor._from.row + 1  # 0-based to 1-based
-                        img_data = img._data()
-                        image_tasks.append((img_data, row, col))
-                except Exception as e:
-                    self._logger.warning(f"이미지 데이터 수집 실패: {e}")
-            wb.close()
-            self._logger.info(f"이미지 데이터 수집: {time.time() - t_collect:.2f}초, {len(image_tasks)}개")
-
-            # 병렬 이미지 처리
+            # 병렬 이미지 처리 (이미지가 많으면 프로세스 풀, 실패 시 스레드 풀로 재시도)
             t_process = time.time()
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = {
-                    executor.submit(self._process_single_image, img_data, row, col): (row, col)
-                    for img_data, row, col in image_tasks
-                }
-
-                for future in as_completed(futures):
-                    row, col = futures[future]
-                    try:
-                        cell_key, img_path, thumb_path = future.result()
-                        self._image_map[cell_key] = img_path
-                        self._thumbnail_map[cell_key] = thumb_path
-                    except Exception as e:
-                        self._logger.warning(f"이미지 처리 실패 ({row}, {col}): {e}")
+            if len(image_tasks) >= self.PROCESS_POOL_MIN_IMAGES:
+                image_tasks = self._process_images(
+                    image_tasks, partial(ProcessPoolExecutor, mp_context=_PROCESS_POOL_CONTEXT)
+                )
+            if image_tasks:
+                self._process_images(image_tasks, ThreadPoolExecutor)
 
             self._logger.info(f"이미지 처리(병렬): {time.time() - t_process:.2f}초")
             self._logger.info(f"이미지 추출 완료: {len(self._image_map)}개, 총 {time.time() - t0:.2f}초")
@@ -256,14 +392,68 @@ class ExcelLoader:
         except Exception as e:
             self._logger.warning(f"이미지 추출 중 오류: {e}")
 
+    def _process_images(
+        self,
+        image_tasks: list[tuple[bytes, int, int]],
+        executor_factory: Callable[..., Executor],
+    ) -> list[tuple[bytes, int, int]]:
+        """이미지 저장 및 썸네일 생성을 실행기에서 병렬 처리
+
+        Args:
+            image_tasks: (이미지 바이트, 행 번호, 열 번호) 목록
+            executor_factory: 실행기 생성 함수 (max_workers 키워드 인자를 받음)
+
+        Returns:
+            실행기 자체가 동작하지 않아 처리하지 못한 작업 목록
+        """
+        workers = self.IMAGE_WORKERS
+        # 프로세스 풀은 작업을 묶어서 전달하여 프로세스 간 통신 횟수를 줄임 (스레드 풀은 무시)
+        chunksize = max(1, len(image_tasks) // (workers * 4))
+        try:
+            with executor_factory(max_workers=workers) as executor:
+                img_datas, rows, cols = zip(*image_tasks)
+                results = executor.map(
+                    try_process_cell_image,
+                    img_datas,
+                    rows,
+                    cols,
+                    repeat(self._images_dir),
+                    repeat(self.THUMBNAIL_SIZE),
+                    chunksize=chunksize,
+                )
+                for row, col, (result, error) in zip(rows, cols, results):
+                    if error is not None:
+                        self._logger.warning(f"이미지 처리 실패 ({row}, {col}): {error}")
+                        continue
+                    cell_key, img_path, thumb_path = result
+                    self._image_map[cell_key] = img_path
+                    self._thumbnail_map[cell_key] = thumb_path
+                    self._image_cells[(row << _IMAGE_ROW_SHIFT) | col] = img_path
+        except (BrokenExecutor, OSError) as e:
+            self._logger.warning(f"이미지 병렬 처리 실패: {e}")
+            return [
+                task for task in image_tasks
+                if (task[1] << _IMAGE_ROW_SHIFT) | task[2] not in self._image_cells
+            ]
+
+        return []
+
     def _calculate_formulas(self, file_path: Path, update_progress: callable = None) -> None:
-        """formulas 라이브러리로 수식 계산"""
+        """formulas 라이브러리로 수식 계산 (변경되지 않은 파일은 이전 결과 재사용)"""
         import time
 
         def progress(step: int, message: str):
             if update_progress:
                 update_progress(step, message)
 
+        cache_key = self._get_formula_cache_key(file_path)
+        cached_values = self._formula_cache.get(cache_key)
+        if cached_values is not None:
+            progress(3, "값 변환 중...")
+            self._logger.info(f"수식 계산 결과 캐시 사용: 총 {len(cached_values)}개 셀")
+            self._calculated_values = cached_values
+            return
+
         try:
             t0 = time.time()
             progress(1, "엑셀 모델 로드 중...")
@@ -278,43 +468,138 @@ class ExcelLoader:
             self._logger.info(f"수식 계산 완료 ({time.time() - t1:.1f}초)")
 
             # 계산된 값을 딕셔너리로 저장
-            # key 형식: '[파일명]시트명'!A1 → 시트명!A1 로 정규화
+            # key 형식: '[파일명]시트명'!A1 → (시트명, 열 인덱스, 행 번호)
             t2 = time.time()
             progress(3, "값 변환 중...")
-            self._calculated_values = {}
+            parse_sheet_prefix = self._parse_sheet_prefix
+            parse_cell_address = self._parse_cell_address
+            extract_value = self._extract_value
+
+            # 키를 시트 접두부와 셀 주소로 분리하여 시트별로 묶음
+            # 예: "'[sample.xlsx]CAPTURE DATA'!J2" → "CAPTURE DATA", "J2"
+            # 접두부는 시트 수만큼만 존재하므로 접두부별로 한 번만 해석
+            sheet_keys: dict[str, str | None] = {}
+            cells_by_sheet: dict[str, list[tuple[str, Any]]] = {}
             for key, value in solution.items():
-                # 키에서 시트명과 셀 주소 추출
-                # 예: "'[sample.xlsx]CAPTURE DATA'!J2" → "CAPTURE DATA!J2"
-                normalized_key = self._normalize_cell_key(key)
-
-                # 값 추출 (Ranges 객체 또는 중첩 리스트)
-                actual_value = self._extract_value(value)
-
-                self._calculated_values[normalized_key] = actual_value
+                prefix, _, address = key.rpartition("!")
+                if prefix not in sheet_keys:
+                    sheet_keys[prefix] = parse_sheet_prefix(prefix)
+                sheet_key = sheet_keys[prefix]
+                if sheet_key is not None:
+                    cells_by_sheet.setdefault(sheet_key, []).append((address, value))
+
+            # 기본 시트가 있으면 해당 시트만 조회되므로 나머지 시트(참조 테이블 등)는 변환 생략
+            default_sheet_key = self.DEFAULT_SHEET_NAME.upper()
+            if default_sheet_key in cells_by_sheet:
+                cells_by_sheet = {default_sheet_key: cells_by_sheet[default_sheet_key]}
+
+            # 셀 위치 (시트명, 열 인덱스, 행 번호)와 값 추출 (범위 키 등 단일 셀이 아닌 항목은 제외)
+            calculated_values = {}
+            for sheet_key, cells in cells_by_sheet.items():
+                for address, value in cells:
+                    position = parse_cell_address(address)
+                    if position is not None:
+                        calculated_values[(sheet_key, *position)] = extract_value(value)
+            self._calculated_values = calculated_values
             self._logger.info(f"값 변환 완료 ({time.time() - t2:.1f}초), 총 {len(self._calculated_values)}개 셀")
             self._logger.info(f"전체 소요 시간: {time.time() - t0:.1f}초")
+            self._store_formula_cache(cache_key, self._calculated_values)
         except Exception as e:
             self._logger.warning(f"수식 계산 중 오류 (무시하고 진행): {e}")
             self._calculated_values = {}
+        finally:
+            # formulas 모델은 순환 참조가 많아 즉시 해제되지 않으므로,
+            # 이미지 추출과 데이터 로드 전에 수거하여 최대 메모리 사용량을 낮춤
+            xl_model = solution = cells_by_sheet = None
+            gc.collect()
+
+    def _read_cached_formula_values(self, file_data: bytes) -> dict | None:
+        """엑셀에 저장된 수식 결과 읽기
+
+        대상 시트의 모든 수식 셀에 저장된 결과가 있으면 계산 없이 사용할 수 있습니다.
+        결과가 없는 수식 셀을 만나면 즉시 중단합니다.
+
+        Args:
+            file_data: 엑셀 파일 내용
+
+        Returns:
+            (시트명 대문자, 열 인덱스, 행 번호) → 값 딕셔너리, 계산이 필요하면 None
+        """
+        formula_wb = value_wb = None
+        try:
+            formula_wb = openpyxl.load_workbook(BytesIO(file_data), read_only=True, data_only=False)
+            value_wb = openpyxl.load_workbook(BytesIO(file_data), read_only=True, data_only=True)
+            if self.DEFAULT_SHEET_NAME in formula_wb.sheetnames:
+                sheet_name = self.DEFAULT_SHEET_NAME
+            else:
+                sheet_name = formula_wb.active.title
+            sheet_key = sheet_name.upper()
+
+            cached_values = {}
+            rows = zip(formula_wb[sheet_name].iter_rows(), value_wb[sheet_name].iter_rows(values_only=True))
+            for row_idx, (formula_row, value_row) in enumerate(rows, start=1):
+                for col_idx, (cell, value) in enumerate(zip(formula_row, value_row)):
+                    if cell.data_type != 'f':
+                        continue
+                    if value is None:
+                        return None  # 저장된 결과 없음 → 수식 계산 필요
+                    cached_values[(sheet_key, col_idx, row_idx)] = self._extract_value(value)
+            return cached_values
+        except Exception as e:
+            self._logger.debug(f"저장된 수식 결과 읽기 실패: {e}")
+            return None
+        finally:
+            for workbook in (formula_wb, value_wb):
+                if workbook is not None:
+                    workbook.close()
+
+    @staticmethod
+    def _get_formula_cache_key(file_path: Path) -> tuple[str, int, int]:
+        """수식 캐시 키 생성 (경로, 수정 시각, 크기)"""
+        stat = file_path.stat()
+        return str(file_path.resolve()), stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _store_formula_cache(cls, cache_key: tuple[str, int, int], values: dict) -> None:
+        """수식 계산 결과 캐시 저장 (오래된 항목부터 제거)"""
+        cache = cls._formula_cache
+        cache.pop(cache_key, None)
+        while len(cache) >= cls.FORMULA_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[cache_key] = values
+
+    def _parse_sheet_prefix(self, prefix: str) -> str | None:
+        """셀 키의 시트 접두부 파싱: '[파일명]시트명' → 시트명 대문자
+
+        형식이 맞지 않으면 None을 반환합니다.
+        """
+        match = _SHEET_PREFIX_PATTERN.match(prefix)
+        if not match:
+            return None
+        return match.group(1).strip("'").upper()
 
-    def _normalize_cell_key(self, key: str) -> str:
-        """셀 키 정규화: '[파일명]시트명'!A1 → 시트명!A1"""
-        import re
-        # 패턴: '[파일명]시트명'!셀주소 또는 [파일명]시트명!셀주소
-        match = re.match(r"'?\[.*?\](.+?)'?!(.+)", key)
-        if match:
-            sheet_name = match.group(1).strip("'")
-            cell_addr = match.group(2)
-            return f"{sheet_name}!{cell_addr}".upper()
-        return key.upper()
+    def _parse_cell_address(self, address: str) -> tuple[int, int] | None:
+        """셀 주소 파싱: A1 → (열 인덱스 0-based, 행 번호)
+
+        정규식 없이 문자열 연산으로 열 문자와 행 번호를 분리합니다.
+        단일 셀이 아닌 주소(범위 등)는 None을 반환합니다.
+        """
+        if "$" in address:
+            address = address.replace("$", "")
+        letters = address.rstrip(_DIGITS)
+        digits = address[len(letters):]
+        if not digits or not letters.isalpha() or not letters.isascii():
+            return None
+        try:
+            col = column_index_from_string(letters) - 1
+        except ValueError:
+            return None  # 엑셀 범위를 벗어난 열
+        return col, int(digits)
 
     def _extract_value(self, value: Any) -> Any:
         """Ranges 객체, numpy 배열, 또는 중첩 리스트에서 실제 값 추출"""
-        import numpy as np
-
         # Ranges 객체인 경우 .value 속성 사용
-        if hasattr(value, 'value'):
-            value = value.value
+        value = getattr(value, "value", value)
 
         # numpy 배열인 경우 처리
         if isinstance(value, np.ndarray):
@@ -323,6 +608,13 @@ class ExcelLoader:
             else:
                 value = value.tolist()
 
+        # 대부분의 셀(1x1 범위의 스칼라)은 여기서 바로 반환
+        value_type = type(value)
+        if value_type in _PLAIN_VALUE_TYPES:
+            return value
+        if value_type is float:
+            return int(value) if value.is_integer() else value
+
         # 중첩 리스트인 경우 첫 번째 값 추출 ([[5.0]] → 5.0)
         while isinstance(value, (list, tuple)) and len(value) > 0:
             if isinstance(value[0], (list, tuple)):
@@ -347,53 +639,143 @@ class ExcelLoader:
             self._sheet = self._workbook.active
             sheet_name = self._sheet.title
 
-        # 헤더 읽기 (첫 번째 행)
-        rows = list(self._sheet.iter_rows(values_only=False))
+        # 크기 정보가 1행으로 잘못 기록된 파일(A1:A1 등)은 읽기 전용 모드에서
+        # 데이터가 잘리므로 크기 정보를 무시하고 실제 셀 기준으로 읽음
+        if self._sheet.max_row == 1 and hasattr(self._sheet, "reset_dimensions"):
+            self._sheet.reset_dimensions()
+
+        # 행 단위로 값만 스트리밍 (Cell 객체를 만들지 않음)
+        row_iter = self._sheet.iter_rows(values_only=True)
+        header_values = next(row_iter, None)
+
+        # 셀 값 가져오기 (수식인 경우 계산된 값 사용)
+        get_cell_value = self._get_cell_value
+        sheet_key = sheet_name.upper()
+        value_rows = (
+            [get_cell_value(value, sheet_key, row_idx, col_idx) for col_idx, value in enumerate(row)]
+            for row_idx, row in enumerate(row_iter, start=2)  # 엑셀은 1-based, 헤더가 1행
+        )
+        self._store_rows(header_values, value_rows)
+
+    def _load_sheet_calamine(self) -> None:
+        """python-calamine으로 시트 데이터 로드
+
+        calamine은 수식 여부를 알려주지 않으므로, 값이 비어 있는 셀
+        (캐시값 없이 저장된 수식 셀 포함)은 수식 계산 결과를 사용합니다.
+        """
+        # Capture Data 시트 또는 첫 번째 시트 선택
+        sheet_names = self._workbook.sheet_names
+        if self.DEFAULT_SHEET_NAME in sheet_names:
+            sheet_name = self.DEFAULT_SHEET_NAME
+        else:
+            sheet_name = sheet_names[0]
+        self._sheet = self._workbook.get_sheet_by_name(sheet_name)
+
+        # 사용 범위만 반환되므로 A1 기준으로 앞쪽 빈 행/열 보정
+        rows = self._sheet.to_python()
+        if rows and self._sheet.start is not None:
+            start_row, start_col = self._sheet.start
+            if start_col:
+                padding = [""] * start_col
+                rows = [padding + row for row in rows]
+            if start_row:
+                rows = [[""] * len(rows[0]) for _ in range(start_row)] + rows
+
         if not rows:
+            self._store_rows(None, ())
+            return
+
+        header_values = [_from_calamine_value(value) for value in rows[0]]
+        get_value = self._get_calamine_value
+        sheet_key = sheet_name.upper()
+        value_rows = (
+            [get_value(value, sheet_key, row_idx, col_idx) for col_idx, value in enumerate(row)]
+            for row_idx, row in enumerate(rows[1:], start=2)  # 엑셀은 1-based, 헤더가 1행
+        )
+        self._store_rows(header_values, value_rows)
+
+    def _store_rows(self, header_values: list[Any] | None, value_rows) -> None:
+        """헤더와 행 값을 컬럼별 리스트에 저장
+
+        Args:
+            header_values: 첫 번째 행 값 (None이면 빈 시트)
+            value_rows: 데이터 행 값 리스트의 반복자
+        """
+        self._columns = []
+        self._row_count = 0
+        if header_values is None:
             self._headers = []
-            self._data = []
             return
 
         # 헤더 추출 (첫 번째 행)
-        self._headers = [str(cell.value) if cell.value is not None else "" for cell in rows[0]]
-
-        # 데이터 행 읽기
-        self._data = []
-        self._data_by_index = []
-        for row_idx, row in enumerate(rows[1:], start=2):  # 엑셀은 1-based, 헤더가 1행
-            row_dict = {}
-            row_list = []
-            for col_idx, cell in enumerate(row):
-                # 셀 값 가져오기 (수식인 경우 계산된 값 사용)
-                value = self._get_cell_value(cell, sheet_name, row_idx, col_idx)
-                row_list.append(value)
-                if col_idx < len(self._headers):
-                    row_dict[self._headers[col_idx]] = value
-            self._data.append(row_dict)
-            self._data_by_index.append(row_list)
-
-    def _get_cell_value(self, cell, sheet_name: str, row: int, col: int) -> Any:
+        self._headers = [str(value) if value is not None else "" for value in header_values]
+
+        # 데이터 행 읽기 (컬럼별 리스트에 저장)
+        columns: list[list[Any]] = [[] for _ in self._headers]
+        row_count = 0
+        empty_rows = 0  # 저장을 보류한 연속 빈 행 수 (시트 끝에 남으면 버림)
+        for values in value_rows:
+            if all(value is None for value in values):
+                empty_rows += 1
+                continue
+
+            # 빈 행 뒤에 데이터가 이어지면 보류한 빈 행을 저장 (행 번호 유지)
+            if empty_rows:
+                for column in columns:
+                    column.extend([None] * empty_rows)
+                row_count += empty_rows
+                empty_rows = 0
+
+            # 헤더보다 긴 행: 이전 행은 None으로 채운 컬럼 추가
+            if len(values) > len(columns):
+                columns.extend([None] * row_count for _ in range(len(values) - len(columns)))
+
+            for column, value in zip(columns, values):
+                column.append(value)
+
+            # 짧은 행: 나머지 컬럼은 None
+            for column in columns[len(values):]:
+                column.append(None)
+            row_count += 1
+
+        self._columns = columns
+        self._row_count = row_count
+
+    def _get_cell_value(self, value: Any, sheet_key: str, row: int, col: int) -> Any:
         """셀 값 가져오기 (수식인 경우 계산된 값, 이미지인 경우 경로 사용)"""
-        from openpyxl.utils import get_column_letter
-
-        # 이미지가 있는 셀인지 확인
-        cell_key = f"{row}_{col}"
-        if cell_key in self._image_map:
-            return self._image_map[cell_key]
-
-        # 수식 셀인지 확인
-        if cell.data_type == 'f' or (isinstance(cell.value, str) and cell.value.startswith('=')):
+        # 이미지가 있는 셀인지 확인 (문자열 키 대신 정수 키로 조회)
+        if self._image_cells:
+            image_path = self._image_cells.get((row << _IMAGE_ROW_SHIFT) | col)
+            if image_path is not None:
+                return image_path
+
+        # 수식 셀인지 확인 (일반 수식은 '='로 시작하는 문자열, 배열/데이터 표 수식은 전용 객체)
+        if (isinstance(value, str) and value.startswith('=')) or isinstance(value, _FORMULA_VALUE_TYPES):
             # 계산된 값 조회
-            col_letter = get_column_letter(col + 1)  # 0-based to 1-based
-            cell_ref = f"{sheet_name}!{col_letter}{row}".upper()
-
+            cell_ref = (sheet_key, col, row)
             if cell_ref in self._calculated_values:
                 return self._calculated_values[cell_ref]
             else:
-                self._logger.debug(f"계산값 없음: {cell_ref}")
-                return cell.value  # 계산 실패 시 수식 텍스트 반환
+                # 미계산 수식 셀이 많을 수 있으므로 DEBUG가 꺼져 있으면 메시지 생성 생략
+                if self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug(f"계산값 없음: {sheet_key}!{get_column_letter(col + 1)}{row}")
+                return value  # 계산 실패 시 수식 텍스트 반환
+
+        return value
+
+    def _get_calamine_value(self, value: Any, sheet_key: str, row: int, col: int) -> Any:
+        """calamine 셀 값 가져오기 (빈 셀은 수식 계산 결과, 이미지인 경우 경로 사용)"""
+        # 이미지가 있는 셀인지 확인 (문자열 키 대신 정수 키로 조회)
+        if self._image_cells:
+            image_path = self._image_cells.get((row << _IMAGE_ROW_SHIFT) | col)
+            if image_path is not None:
+                return image_path
 
-        return cell.value
+        # 빈 셀: 캐시값 없는 수식 셀일 수 있으므로 계산된 값 조회
+        if value == "":
+            return self._calculated_values.get((sheet_key, col, row))
+
+        return _from_calamine_value(value)
 
     def _ensure_loaded(self) -> None:
         """데이터가 로드되었는지 확인"""
@@ -403,11 +785,13 @@ class ExcelLoader:
     def get_headers(self) -> list[str]:
         """헤더 목록 반환
 
+        반환된 리스트는 로더 내부 상태이므로 수정하지 않아야 합니다.
+
         Returns:
             컬럼 이름 목록
         """
         self._ensure_loaded()
-        return self._headers.copy()
+        return self._headers
 
     def get_row(self, index: int) -> dict[str, Any]:
         """특정 행 데이터 반환
@@ -416,17 +800,21 @@ class ExcelLoader:
             index: 행 인덱스 (0부터 시작)
 
         Returns:
-            {컬럼명: 값} 딕셔너리
+            {컬럼명: 값} 딕셔너리 (호출마다 새로 생성)
 
         Raises:
             ExcelLoaderError: 잘못된 인덱스인 경우
         """
         self._ensure_loaded()
 
-        if index < 0 or index >= len(self._data):
-            raise ExcelLoaderError(f"잘못된 행 인덱스입니다: {index} (범위: 0-{len(self._data) - 1})")
+        if index < 0 or index >= self._row_count:
+            raise ExcelLoaderError(f"잘못된 행 인덱스입니다: {index} (범위: 0-{self._row_count - 1})")
 
-        return self._data[index].copy()
+        return self._build_row_dict(index)
+
+    def _build_row_dict(self, index: int) -> dict[str, Any]:
+        """컬럼 데이터에서 행 딕셔너리 생성 (중복 헤더는 마지막 값 사용)"""
+        return {header: column[index] for header, column in zip(self._headers, self._columns)}
 
     def get_rows(self, indices: list[int]) -> list[dict[str, Any]]:
         """다중 행 데이터 반환
@@ -436,8 +824,19 @@ class ExcelLoader:
 
         Returns:
             딕셔너리 목록
+
+        Raises:
+            ExcelLoaderError: 잘못된 인덱스가 포함된 경우
         """
-        return [self.get_row(i) for i in indices]
+        self._ensure_loaded()
+
+        row_count = self._row_count
+        for index in indices:
+            if index < 0 or index >= row_count:
+                raise ExcelLoaderError(f"잘못된 행 인덱스입니다: {index} (범위: 0-{row_count - 1})")
+
+        build_row_dict = self._build_row_dict
+        return [build_row_dict(i) for i in indices]
 
     def get_all_rows(self) -> list[dict[str, Any]]:
         """전체 행 데이터 반환
@@ -446,23 +845,43 @@ class ExcelLoader:
             모든 행의 딕셔너리 목록
         """
         self._ensure_loaded()
-        return [row.copy() for row in self._data]
+        headers = self._headers
+        return [dict(zip(headers, row)) for row in self._iter_row_tuples()]
 
-    def get_row_by_index(self, row_index: int) -> list[Any]:
+    def get_row_by_index(self, row_index: int) -> tuple[Any, ...]:
         """인덱스 기반 행 데이터 반환 (중복 헤더 지원)
 
         Args:
             row_index: 행 인덱스 (0부터 시작)
 
         Returns:
-            값 리스트 (컬럼 인덱스로 접근)
+            값 튜플 (컬럼 인덱스로 접근, 수정이 필요하면 호출 측에서 list()로 복사)
         """
         self._ensure_loaded()
 
-        if row_index < 0 or row_index >= len(self._data_by_index):
+        if row_index < 0 or row_index >= self._row_count:
             raise ExcelLoaderError(f"잘못된 행 인덱스입니다: {row_index}")
 
-        return self._data_by_index[row_index].copy()
+        return tuple([column[row_index] for column in self._columns])
+
+    def get_column(self, col_index: int) -> list[Any]:
+        """컬럼 데이터 반환 (행 데이터를 만들지 않고 한 컬럼의 값만 조회)
+
+        Args:
+            col_index: 컬럼 인덱스 (0부터 시작)
+
+        Returns:
+            행 순서대로의 값 리스트 (읽기 전용으로 사용)
+
+        Raises:
+            ExcelLoaderError: 잘못된 컬럼 인덱스
+        """
+        self._ensure_loaded()
+
+        if col_index < 0 or col_index >= len(self._columns):
+            raise ExcelLoaderError(f"잘못된 컬럼 인덱스입니다: {col_index}")
+
+        return self._columns[col_index]
 
     def get_headers_with_index(self) -> list[tuple[int, str]]:
         """인덱스와 함께 헤더 목록 반환
@@ -473,11 +892,17 @@ class ExcelLoader:
         self._ensure_loaded()
         return [(i, h) for i, h in enumerate(self._headers)]
 
-    def get_all_rows_by_index(self) -> list[list[Any]]:
+    def get_all_rows_by_index(self) -> list[tuple[Any, ...]]:
         """전체 행 데이터 인덱스 기반 반환
 
         Returns:
-            모든 행의 리스트
+            모든 행의 값 튜플 목록 (전치 결과를 행마다 리스트로 다시 복사하지 않음)
         """
         self._ensure_loaded()
-        return [row.copy() for row in self._data_by_index]
+        return list(self._iter_row_tuples())
+
+    def _iter_row_tuples(self):
+        """컬럼 데이터를 행 단위 튜플로 전치하여 반복"""
+        if not self._columns:
+            return iter([()] * self._row_count)
+        return zip(*self._columns)
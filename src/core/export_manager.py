@@ -5,20 +5,35 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import shutil
 import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import fitz  # PyMuPDF
 
-from jinja2 import Template as Jinja2Template
+from jinja2 import Environment, Template as Jinja2Template
 
-from src.core.template_manager import TemplateManager
-from src.core.mapper import Mapper
+from src.core.template_manager import TemplateManager, Template
+from src.core.mapper import Mapper, build_img_tag, encode_image_data_url
 from src.core.pdf_converter import PdfConverter
+from src.core.pdf_raster import render_first_page_to_png
 from src.core.logger import get_logger
 
+# PNG 변환 프로세스 풀의 시작 방식. QtWebEngine과 렌더 스레드가 살아 있는 GUI 프로세스를
+# fork하면 다른 스레드가 잡고 있던 락이 복제되어 자식이 멈출 수 있으므로 spawn 사용
+_PROCESS_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# 공용 Jinja2 환경 (Jinja2Template(...) 기본 설정과 동일)
+_JINJA_ENV = Environment()
+
+# ZIP에 압축 없이 저장할 확장자 (자체 압축 형식이라 재압축 효과가 거의 없음)
+_PRECOMPRESSED_SUFFIXES = frozenset({".pdf", ".png", ".jpg", ".jpeg"})
+
 
 class ExportManager:
     """내보내기 관리자
@@ -27,6 +42,10 @@ class ExportManager:
     ZIP 아카이브 또는 단일 파일로 제공합니다.
     """
 
+    RENDER_WORKERS = 4  # HTML 렌더링 병렬 스레드 수
+    RENDER_PREFETCH = 8  # PDF 변환에 앞서 미리 렌더링해 둘 최대 문서 수
+    PNG_WORKERS = 4  # PDF → PNG 변환 병렬 프로세스 수
+
     def __init__(self, template_manager: TemplateManager, work_dir: Path):
         """
         Args:
@@ -38,6 +57,10 @@ class ExportManager:
         self._logger = get_logger("export_manager")
         self._cancelled = False
         self._pdf_converter: Optional[PdfConverter] = None
+        # 템플릿 경로 → (수정 시각, 컴파일된 템플릿)
+        self._template_cache: Dict[str, Tuple[int, Jinja2Template]] = {}
+        # (이미지 경로, 수정 시각, 크기) → img 태그 (내보내기 단위로 유지, 템플릿별 매퍼와 공유)
+        self._image_tag_cache: Dict[Tuple[str, int, int], str] = {}
 
     @staticmethod
     def cleanup_work_dir(work_dir: Path):
@@ -60,8 +83,9 @@ class ExportManager:
         self._cancelled = True
 
     def reset(self):
-        """취소 상태 초기화"""
+        """취소 상태 및 이미지 캐시 초기화"""
         self._cancelled = False
+        self._image_tag_cache.clear()
 
     def export(
         self,
@@ -109,46 +133,82 @@ class ExportManager:
             # 행별: 행1의 모든 템플릿 → 행2의 모든 템플릿 → ...
             iterations = [(t, r, row) for r, row in enumerate(rows_data) for t in template_names]
 
-        for template_name, row_idx, row_data in iterations:
-            if self._cancelled:
-                break
-
+        # 템플릿 조회, 매퍼/직접 매핑 계획 생성은 템플릿당 1회만 수행
+        # (템플릿 이름 → (템플릿, 매퍼, 헤더가 없을 때의 직접 매핑 계획))
+        prepared: Dict[str, Tuple[Template, Optional[Mapper], Optional[Tuple]]] = {}
+        for template_name in dict.fromkeys(template_names):
             template = self._template_manager.get(template_name)
             if template is None:
                 self._logger.error(f"템플릿 없음: {template_name}")
                 continue
-
-            current += 1
-            filename = f"{filename_base}_{template_name}_{row_idx + 1:03d}"
-
-            if progress_callback:
-                progress_callback(current, total, f"{filename}.pdf", row_data)
-
-            # 매핑 적용
-            row_by_index = rows_data_by_index[row_idx] if rows_data_by_index else None
+            # 작업 스레드들이 첫 렌더링에서 같은 템플릿을 중복 컴파일하지 않도록 미리 컴파일
+            self._get_jinja_template(template.template_path)
+            mapper = None
             if excel_headers:
-                mapper = Mapper(template.fields, excel_headers)
+                # 같은 이미지 컬럼을 쓰는 템플릿끼리 인코딩 결과를 공유
+                mapper = Mapper(template.fields, excel_headers, image_tag_cache=self._image_tag_cache)
+                mapper.prepare()  # 렌더 스레드에서 apply하기 전에 매핑 계획 생성
+            direct_plan = None if mapper is not None else self._build_direct_plan(template.fields)
+            prepared[template_name] = (template, mapper, direct_plan)
+
+        jobs = [job for job in iterations if job[0] in prepared]
+
+        def render(job) -> str:
+            """매핑 적용 후 HTML 렌더링 (작업 스레드에서 실행)"""
+            template_name, row_idx, row_data = job
+            template, mapper, direct_plan = prepared[template_name]
+            row_by_index = rows_data_by_index[row_idx] if rows_data_by_index else None
+            if mapper is not None:
                 mapped_data = mapper.apply(row_data, row_by_index)
             else:
-                mapped_data = self._direct_map(template.fields, row_data, row_by_index)
-
-            # HTML 렌더링
-            html_content = self._render_html(template.template_path, mapped_data)
-
-            # HTML → PDF 변환
-            pdf_path = self._work_dir / f"{filename}.pdf"
-            converter = self._get_pdf_converter()
-            success = converter.convert_html_string_to_pdf(
-                html_content=html_content,
-                output_path=pdf_path,
-                base_url=template.template_path.parent,
+                mapped_data = self._direct_map(direct_plan, row_data, row_by_index)
+            return self._render_html(template.template_path, mapped_data)
+
+        # 매핑과 HTML 렌더링은 스레드 풀에서 미리 수행하고,
+        # QWebEngine 기반 PDF 변환은 호출(GUI) 스레드에서 순서대로 실행
+        with ThreadPoolExecutor(max_workers=self.RENDER_WORKERS) as executor:
+            job_iter = iter(jobs)
+            pending = deque(
+                (job, executor.submit(render, job))
+                for job in islice(job_iter, self.RENDER_PREFETCH)
             )
 
-            if success:
-                generated_files.append(pdf_path)
-                self._logger.debug(f"PDF 생성: {pdf_path}")
-            else:
-                self._logger.error(f"PDF 변환 실패: {filename}")
+            try:
+                while pending:
+                    if self._cancelled:
+                        break
+
+                    (template_name, row_idx, row_data), future = pending.popleft()
+                    next_job = next(job_iter, None)
+                    if next_job is not None:
+                        pending.append((next_job, executor.submit(render, next_job)))
+
+                    template = prepared[template_name][0]
+                    current += 1
+                    filename = f"{filename_base}_{template_name}_{row_idx + 1:03d}"
+
+                    if progress_callback:
+                        progress_callback(current, total, f"{filename}.pdf", row_data)
+
+                    html_content = future.result()
+
+                    # HTML → PDF 변환
+                    pdf_path = self._work_dir / f"{filename}.pdf"
+                    converter = self._get_pdf_converter()
+                    success = converter.convert_html_string_to_pdf(
+                        html_content=html_content,
+                        output_path=pdf_path,
+                        base_url=template.template_path.parent,
+                    )
+
+                    if success:
+                        generated_files.append(pdf_path)
+                        self._logger.debug(f"PDF 생성: {pdf_path}")
+                    else:
+                        self._logger.error(f"PDF 변환 실패: {filename}")
+            finally:
+                # 취소/에러인 경우 대기 중인 렌더링 작업 정리 (에러는 정리 후 그대로 전파)
+                executor.shutdown(wait=True, cancel_futures=True)
 
         if self._cancelled:
             self._logger.info("내보내기 취소됨")
@@ -160,12 +220,7 @@ class ExportManager:
 
         # 2. PNG 변환 (필요한 경우)
         if output_format == "png":
-            png_files = []
-            for pdf_path in generated_files:
-                png_path = pdf_path.with_suffix(".png")
-                if self._convert_pdf_to_png(pdf_path, png_path):
-                    png_files.append(png_path)
-            generated_files = png_files
+            generated_files = self._convert_pdfs_to_png(generated_files)
 
         # 3. PDF 통합 (필요한 경우)
         if output_format == "pdf" and single_file and len(generated_files) > 1:
@@ -182,71 +237,94 @@ class ExportManager:
             zip_path = self._work_dir / f"{filename_base}.zip"
             return self._create_zip(generated_files, zip_path)
 
-    def _direct_map(self, fields: List[Dict], row_data: Dict[str, Any], row_by_index: List[Any] = None) -> Dict[str, Any]:
-        """직접 매핑 (헤더 없을 때)"""
-        import base64
-
-        mapped_data = {}
-        for field in fields:
-            field_id = field["id"]
-            excel_col = field.get("excel_column", "")
-            excel_index = field.get("excel_index")
-            field_type = field.get("type", "text")
-
-            # 인덱스 기반 데이터 우선 사용
-            if row_by_index is not None and excel_index is not None:
-                if 0 <= excel_index < len(row_by_index):
-                    value = row_by_index[excel_index]
-                else:
-                    value = None
-            else:
-                value = row_data.get(excel_col)
+    @staticmethod
+    def _build_direct_plan(
+        fields: List[Dict],
+    ) -> Tuple[List[str], List[str], List[Optional[int]], List[str]]:
+        """직접 매핑 계획 생성 (템플릿당 1회)
 
-            # 이미지 타입인 경우 img 태그로 변환
-            if field_type == "image" and value is not None:
-                value = self._convert_image_to_img_tag(value)
+        Returns:
+            (필드 ID, 엑셀 컬럼, 엑셀 인덱스 병렬 리스트, img 태그로 변환할 필드 ID 목록)
+        """
+        field_ids = [field["id"] for field in fields]
+        # 같은 ID의 필드가 여러 개면 마지막 필드의 타입을 따름 (결과 값도 마지막 필드 기준)
+        field_types = dict(zip(field_ids, (field.get("type", "text") for field in fields)))
+        return (
+            field_ids,
+            [field.get("excel_column", "") for field in fields],
+            [field.get("excel_index") for field in fields],
+            [field_id for field_id, field_type in field_types.items() if field_type == "image"],
+        )
+
+    def _direct_map(
+        self,
+        plan: Tuple[List[str], List[str], List[Optional[int]], List[str]],
+        row_data: Dict[str, Any],
+        row_by_index: List[Any] = None,
+    ) -> Dict[str, Any]:
+        """직접 매핑 (헤더 없을 때)
 
-            mapped_data[field_id] = value
+        값 추출 후 이미지 필드만 따로 변환하여, 행마다 필드 타입을 확인하지 않습니다.
+        """
+        field_ids, excel_columns, excel_indices, image_field_ids = plan
+
+        # 인덱스 기반 데이터 우선 사용
+        if row_by_index is not None:
+            row_length = len(row_by_index)
+            mapped_data = {
+                field_id: (
+                    (row_by_index[excel_index] if 0 <= excel_index < row_length else None)
+                    if excel_index is not None
+                    else row_data.get(excel_col)
+                )
+                for field_id, excel_col, excel_index in zip(field_ids, excel_columns, excel_indices)
+            }
+        else:
+            mapped_data = {
+                field_id: row_data.get(excel_col)
+                for field_id, excel_col in zip(field_ids, excel_columns)
+            }
+
+        # 이미지 타입인 경우 img 태그로 변환
+        for field_id in image_field_ids:
+            value = mapped_data[field_id]
+            if value is not None:
+                mapped_data[field_id] = self._convert_image_to_img_tag(value)
         return mapped_data
 
     def _convert_image_to_img_tag(self, image_path) -> str:
-        """이미지 경로를 완전한 img 태그로 변환"""
-        data_url = self._convert_image_to_data_url(image_path)
-        if data_url:
-            return f'<img src="{data_url}" style="width:100%;height:100%;object-fit:contain;">'
-        return ""
-
-    def _convert_image_to_data_url(self, image_path) -> str:
-        """이미지 경로를 Base64 data URL로 변환"""
-        import base64
-
+        """이미지 경로를 완전한 img 태그로 변환 (같은 이미지는 1회만 인코딩)"""
         try:
             path = Path(image_path) if not isinstance(image_path, Path) else image_path
-            if not path.exists():
-                return ""
-
-            with open(path, "rb") as f:
-                data = base64.b64encode(f.read()).decode("utf-8")
-
-            suffix = path.suffix.lower()
-            mime_types = {
-                ".png": "image/png",
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-            }
-            mime_type = mime_types.get(suffix, "image/png")
-
-            return f"data:{mime_type};base64,{data}"
-        except Exception:
+            stat = path.stat()
+        except (OSError, TypeError, ValueError):
             return ""
 
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        img_tag = self._image_tag_cache.get(cache_key)
+        if img_tag is None:
+            data_url = encode_image_data_url(path)
+            img_tag = build_img_tag(data_url) if data_url else ""
+            self._image_tag_cache[cache_key] = img_tag
+        return img_tag
+
     def _render_html(self, template_path: Path, data: Dict[str, Any]) -> str:
         """HTML 템플릿 렌더링"""
+        return self._get_jinja_template(template_path).render(**data)
+
+    def _get_jinja_template(self, template_path: Path) -> Jinja2Template:
+        """컴파일된 Jinja2 템플릿 반환 (파일이 변경된 경우에만 다시 읽고 컴파일)"""
+        cache_key = str(template_path)
+        mtime = template_path.stat().st_mtime_ns
+        cached = self._template_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         with open(template_path, "r", encoding="utf-8") as f:
             html_template = f.read()
-
-        jinja_template = Jinja2Template(html_template)
-        return jinja_template.render(**data)
+        jinja_template = _JINJA_ENV.from_string(html_template)
+        self._template_cache[cache_key] = (mtime, jinja_template)
+        return jinja_template
 
     def _convert_pdf_to_png(self, pdf_path: Path, png_path: Path, dpi: int = 300) -> bool:
         """PDF를 PNG로 변환
@@ -259,27 +337,51 @@ class ExportManager:
         Returns:
             변환 성공 여부
         """
-        try:
-            doc = fitz.open(pdf_path)
-            if len(doc) == 0:
-                self._logger.error(f"빈 PDF: {pdf_path}")
-                return False
-
-            page = doc[0]
-            # DPI를 줌 팩터로 변환 (72 DPI 기준)
-            zoom = dpi / 72
-            mat = fitz.Matrix(zoom, zoom)
-            # alpha=False로 투명 배경 제거, colorspace로 RGB 명시
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            pix.save(str(png_path))
-            doc.close()
-
-            self._logger.debug(f"PNG 변환: {png_path}")
-            return True
-        except Exception as e:
-            self._logger.error(f"PNG 변환 실패: {e}")
+        error = render_first_page_to_png(pdf_path, png_path, dpi)
+        if error:
+            self._logger.error(error)
             return False
 
+        self._logger.debug(f"PNG 변환: {png_path}")
+        return True
+
+    def _convert_pdfs_to_png(self, pdf_paths: List[Path]) -> List[Path]:
+        """여러 PDF를 PNG로 병렬 변환
+
+        PyMuPDF는 멀티스레드를 지원하지 않으므로 프로세스 풀을 사용하며,
+        프로세스 풀을 쓸 수 없으면 순차 변환으로 대체합니다.
+
+        Args:
+            pdf_paths: 입력 PDF 경로 목록
+
+        Returns:
+            변환에 성공한 PNG 경로 목록 (입력 순서 유지)
+        """
+        png_paths = [pdf_path.with_suffix(".png") for pdf_path in pdf_paths]
+
+        if len(pdf_paths) > 1:
+            try:
+                workers = min(self.PNG_WORKERS, len(pdf_paths))
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_PROCESS_POOL_CONTEXT) as executor:
+                    errors = list(executor.map(render_first_page_to_png, pdf_paths, png_paths))
+            except Exception as e:
+                self._logger.warning(f"병렬 PNG 변환 실패, 순차 변환으로 진행: {e}")
+            else:
+                png_files = []
+                for png_path, error in zip(png_paths, errors):
+                    if error:
+                        self._logger.error(error)
+                    else:
+                        self._logger.debug(f"PNG 변환: {png_path}")
+                        png_files.append(png_path)
+                return png_files
+
+        return [
+            png_path
+            for pdf_path, png_path in zip(pdf_paths, png_paths)
+            if self._convert_pdf_to_png(pdf_path, png_path)
+        ]
+
     def _merge_pdfs(self, pdf_paths: List[Path], output_path: Path) -> bool:
         """여러 PDF를 하나로 병합
 
@@ -291,14 +393,14 @@ class ExportManager:
             병합 성공 여부
         """
         try:
-            merged = fitz.open()
-            for pdf_path in pdf_paths:
-                doc = fitz.open(pdf_path)
-                merged.insert_pdf(doc)
-                doc.close()
-            # PDF 최적화: 가비지 정리, 압축, 정리
-            merged.save(str(output_path), garbage=4, deflate=True, clean=True)
-            merged.close()
+            # PyMuPDF는 멀티스레드를 지원하지 않으므로 원본은 순서대로 열어 추가
+            with fitz.open() as merged:
+                for pdf_path in pdf_paths:
+                    with fitz.open(pdf_path) as doc:
+                        merged.insert_pdf(doc)
+                # garbage=4: 같은 템플릿에서 반복되는 폰트/이미지를 하나로 합쳐 크기와 저장 시간 절감
+                # (콘텐츠 스트림 재작성(clean)은 결과 크기 차이 없이 저장 시간만 늘어나므로 생략)
+                merged.save(str(output_path), garbage=4, deflate=True)
 
             self._logger.debug(f"PDF 병합: {output_path}")
             return True
@@ -319,7 +421,12 @@ class ExportManager:
         try:
             with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
                 for file_path in files:
-                    zf.write(file_path, file_path.name)
+                    # 이미 압축된 형식은 다시 압축하지 않고 그대로 저장
+                    if file_path.suffix.lower() in _PRECOMPRESSED_SUFFIXES:
+                        compress_type = zipfile.ZIP_STORED
+                    else:
+                        compress_type = zipfile.ZIP_DEFLATED
+                    zf.write(file_path, file_path.name, compress_type=compress_type)
 
             self._logger.debug(f"ZIP 생성: {output_path}")
             return output_path
@@ -0,0 +1,83 @@
+"""JSON 입출력 모듈
+
+템플릿/매핑 JSON 파일을 바이트 단위로 읽고 씁니다.
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈을 사용합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """JSON 바이트 파싱 (UTF-8 문자열로 디코딩하지 않고 바로 파싱)
+
+    Raises:
+        json.JSONDecodeError: 잘못된 JSON 형식 (orjson 예외도 이 타입의 하위 클래스)
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """JSON을 UTF-8 바이트로 직렬화 (비ASCII 문자는 이스케이프하지 않음)
+
+    orjson 사용 여부와 관계없이 표준 json과 같게 동작하도록, 문자열이 아닌
+    키는 문자열로 변환하고 datetime 등 JSON 타입이 아닌 값은 TypeError를 발생시킵니다.
+    단, NaN/Infinity는 orjson에서는 null로, 표준 json에서는 NaN/Infinity로 기록됩니다.
+
+    Args:
+        obj: 직렬화할 객체
+        indent: True면 2칸 들여쓰기
+
+    Raises:
+        TypeError: 직렬화할 수 없는 값이 있는 경우
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def load_file(path: Path) -> Any:
+    """JSON 파일 로드
+
+    Raises:
+        OSError: 파일 읽기 실패
+        json.JSONDecodeError: 잘못된 JSON 형식
+    """
+    return loads(Path(path).read_bytes())
+
+
+def dump_file(path: Path, obj: Any, indent: bool = True) -> None:
+    """JSON 파일 저장 (기본 2칸 들여쓰기, write_file로 원자적 교체)"""
+    write_file(path, dumps(obj, indent=indent))
+
+
+def write_file(path: Path, data: bytes) -> None:
+    """직렬화된 JSON 바이트를 파일에 저장
+
+    임시 파일에 먼저 기록한 뒤 os.replace로 교체하므로
+    저장 도중 실패해도 기존 파일이 손상되지 않습니다.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
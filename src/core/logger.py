@@ -3,11 +3,14 @@
 Document Creator의 로깅 시스템을 제공합니다.
 - 2MB 파일 크기 제한
 - 최대 10개 파일 로테이션
+- 파일/콘솔 출력은 백그라운드 스레드에서 처리 (호출 스레드는 큐에 넣기만 함)
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -22,11 +25,12 @@ DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # 전역 로거 저장소
 _loggers: dict = {}
 _initialized: bool = False
+_listener: Optional[QueueListener] = None
 
 
 def _setup_logging():
     """로깅 시스템 초기화"""
-    global _initialized
+    global _initialized, _listener
     if _initialized:
         return
 
@@ -49,13 +53,21 @@ def _setup_logging():
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-    root_logger.addHandler(file_handler)
 
     # 콘솔 핸들러 (개발용)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-    root_logger.addHandler(console_handler)
+
+    # 로거에는 큐 핸들러만 연결하고, 포맷/파일 쓰기/로테이션은 리스너 스레드에서 처리
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    # 종료 시 큐에 남은 로그를 모두 기록
+    atexit.register(_listener.stop)
 
     _initialized = True
 
@@ -99,8 +111,7 @@ def set_console_level(level: int):
         level: logging.DEBUG, logging.INFO, logging.WARNING 등
     """
     _setup_logging()
-    root_logger = logging.getLogger("document_creator")
-    for handler in root_logger.handlers:
+    for handler in _listener.handlers:
         if isinstance(handler, logging.StreamHandler) and not isinstance(
             handler, RotatingFileHandler
         ):
@@ -6,15 +6,91 @@
 from __future__ import annotations
 
 import base64
-import json
-from datetime import datetime
+import mmap
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.core import json_io
 from src.core.logger import get_logger
 
 logger = get_logger("mapper")
 
+# 매핑 파일 타임스탬프 형식 (로컬 시각, 초 단위 ISO 8601)
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# 이미지 확장자 → MIME 타입
+_IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+
+def _sniff_image_mime_type(header: bytes) -> Optional[str]:
+    """파일 앞부분 시그니처로 이미지 MIME 타입 판별
+
+    Args:
+        header: 파일 앞 12바이트
+
+    Returns:
+        MIME 타입, 알 수 없는 형식이면 None
+    """
+    if header.startswith(b"\x89PNG"):
+        return "image/png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith(b"GIF8"):
+        return "image/gif"
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def encode_image_data_url(image_path) -> str:
+    """이미지 경로를 Base64 data URL로 변환
+
+    파일을 메모리 맵으로 열어 원본 바이트 사본 없이 바로 인코딩하고,
+    MIME 타입은 파일 시그니처로 판별합니다 (확장자가 잘못된 파일 대응).
+
+    Args:
+        image_path: 이미지 파일 경로 (Path 또는 str)
+
+    Returns:
+        data:image/png;base64,... 형식의 문자열, 실패시 빈 문자열
+    """
+    try:
+        path = Path(image_path) if not isinstance(image_path, Path) else image_path
+        if not path.exists():
+            return ""
+
+        with open(path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    mime_type = _sniff_image_mime_type(mm[:12])
+                    data = base64.b64encode(mm).decode("ascii")
+            except ValueError:
+                # 빈 파일은 메모리 맵 불가
+                mime_type = None
+                data = ""
+
+        if mime_type is None:
+            # 알 수 없는 시그니처는 확장자로 MIME 타입 결정
+            mime_type = _IMAGE_MIME_TYPES.get(path.suffix.lower(), "image/png")
+
+        return f"data:{mime_type};base64,{data}"
+    except Exception:
+        return ""
+
+
+def build_img_tag(data_url: str) -> str:
+    """data URL을 셀 크기에 맞춰 표시하는 img 태그로 감싸기"""
+    return f'<img src="{data_url}" style="width:100%;height:100%;object-fit:contain;">'
+
 
 class MapperError(Exception):
     """Mapper 관련 에러"""
@@ -28,31 +104,42 @@ class Mapper:
     엑셀 컬럼과 템플릿 필드 간의 매핑을 관리하고 데이터를 변환합니다.
     """
 
-    def __init__(self, template_fields: List[Dict[str, Any]], excel_headers: List[str]):
+    IMAGE_TAG_CACHE_SIZE = 256  # 인코딩된 이미지 태그 캐시 최대 항목 수
+
+    def __init__(
+        self,
+        template_fields: List[Dict[str, Any]],
+        excel_headers: List[str],
+        image_tag_cache: Optional[Dict[Tuple[str, int, int], str]] = None,
+    ):
         """
         Args:
             template_fields: 템플릿 필드 목록 [{"id": str, "excel_column": str, ...}, ...]
             excel_headers: 엑셀 헤더 목록
+            image_tag_cache: 여러 매퍼가 공유할 (경로, 수정 시각, 크기) → img 태그 캐시
+                (None이면 매퍼 전용 LRU 캐시 사용)
         """
         self._template_fields = template_fields
         self._excel_headers = excel_headers
-        self._excel_headers_lower = {h.lower(): h for h in excel_headers}
+        # 소문자 헤더 → 원본 헤더 (대소문자만 다른 중복 헤더는 마지막 헤더 사용)
+        self._excel_headers_lower = {sys.intern(h.lower()): h for h in excel_headers}
         self._manual_mappings: Dict[str, str] = {}
         self._auto_mappings: Dict[str, Optional[str]] = {}
+        # 행 변환용 매핑 계획 (필드 ID, 엑셀 컬럼, 엑셀 인덱스, 이미지 여부의 병렬 리스트)
+        self._plan: Optional[Tuple[List[str], List[Optional[str]], List[Optional[int]], List[bool]]] = None
+        self._image_field_ids: List[str] = []  # 결과에서 img 태그로 변환할 필드 ID
+        # (경로, 수정 시각, 크기) → img 태그 (여러 행이 같은 이미지를 참조하면 1회만 인코딩)
+        self._cached_img_tag = lru_cache(maxsize=self.IMAGE_TAG_CACHE_SIZE)(self._build_img_tag)
+        self._shared_img_tag_cache = image_tag_cache
         self._auto_map()
 
     def _auto_map(self) -> None:
         """자동 매핑 수행"""
+        headers_lower = self._excel_headers_lower
+        auto_mappings = self._auto_mappings
         for field in self._template_fields:
-            field_id = field["id"]
-            excel_column = field.get("excel_column", "")
-
-            # 대소문자 무시하고 매칭
-            excel_column_lower = excel_column.lower()
-            if excel_column_lower in self._excel_headers_lower:
-                self._auto_mappings[field_id] = self._excel_headers_lower[excel_column_lower]
-            else:
-                self._auto_mappings[field_id] = None
+            # 대소문자 무시하고 매칭 (조회 1회, 없으면 None)
+            auto_mappings[field["id"]] = headers_lower.get(field.get("excel_column", "").lower())
 
     def get_mapping(self) -> Dict[str, Optional[str]]:
         """현재 매핑 반환
@@ -79,6 +166,7 @@ class Mapper:
             excel_column: 엑셀 컬럼명
         """
         self._manual_mappings[field_id] = excel_column
+        self._invalidate_plan()
 
     def clear_mapping(self, field_id: str) -> None:
         """수동 매핑 제거 (자동 매핑으로 복원)
@@ -87,6 +175,45 @@ class Mapper:
             field_id: 템플릿 필드 ID
         """
         self._manual_mappings.pop(field_id, None)
+        self._invalidate_plan()
+
+    def _invalidate_plan(self) -> None:
+        """매핑 변경 시 매핑 계획 폐기 (다음 apply에서 다시 생성)"""
+        self._plan = None
+
+    def _get_plan(self) -> Tuple[List[str], List[Optional[str]], List[Optional[int]], List[bool]]:
+        """매핑 계획 반환 (없으면 생성)"""
+        return self._plan if self._plan is not None else self._build_plan()
+
+    def _build_plan(self) -> Tuple[List[str], List[Optional[str]], List[Optional[int]], List[bool]]:
+        """템플릿 필드를 한 번 순회하여 행 변환용 매핑 계획 생성
+
+        Returns:
+            (필드 ID, 엑셀 컬럼, 엑셀 인덱스, 이미지 여부) 병렬 리스트 튜플
+        """
+        mapping = self.get_mapping()
+        fields = self._template_fields
+        plan = (
+            [field["id"] for field in fields],
+            [mapping.get(field["id"]) for field in fields],
+            [field.get("excel_index") for field in fields],
+            [field.get("type", "text") == "image" for field in fields],
+        )
+        # 같은 ID의 필드가 여러 개면 마지막 필드의 타입을 따름 (결과 값도 마지막 필드 기준)
+        self._image_field_ids = [
+            field_id for field_id, is_image in dict(zip(plan[0], plan[3])).items() if is_image
+        ]
+        # 계획은 마지막에 공개: 다른 스레드가 _plan을 보면 _image_field_ids도 이미 채워져 있음
+        self._plan = plan
+        return plan
+
+    def prepare(self) -> None:
+        """매핑 계획을 미리 생성
+
+        여러 스레드에서 apply를 호출하기 전에 호출 스레드에서 한 번 실행해 두면
+        작업 스레드들이 첫 행에서 계획을 동시에 만들지 않습니다.
+        """
+        self._get_plan()
 
     def apply(self, row_data: Dict[str, Any], row_data_by_index: List[Any] = None) -> Dict[str, Any]:
         """매핑을 적용하여 데이터 변환
@@ -98,31 +225,32 @@ class Mapper:
         Returns:
             변환된 데이터 {field_id: value}
         """
-        mapping = self.get_mapping()
-        result = {}
-
-        for field in self._template_fields:
-            field_id = field["id"]
-            excel_column = mapping.get(field_id)
-            excel_index = field.get("excel_index")
-            field_type = field.get("type", "text")
+        # 매핑과 필드 속성은 행마다가 아니라 매핑 변경 시에만 계산
+        field_ids, excel_columns, excel_indices, _ = self._get_plan()
 
+        # 1단계: 값 추출만 수행하는 단순 반복
+        if row_data_by_index is not None:
             # 인덱스 기반 데이터가 있고, excel_index가 정의된 경우 우선 사용 (중복 헤더 문제 해결)
-            if row_data_by_index is not None and excel_index is not None:
-                if 0 <= excel_index < len(row_data_by_index):
-                    value = row_data_by_index[excel_index]
-                else:
-                    value = None
-            elif excel_column is not None and excel_column in row_data:
-                value = row_data[excel_column]
-            else:
-                value = None
-
-            # 이미지 타입인 경우 img 태그로 변환
-            if field_type == "image" and value is not None:
-                value = self._convert_image_to_img_tag(value)
+            row_length = len(row_data_by_index)
+            result = {
+                field_id: (
+                    (row_data_by_index[excel_index] if 0 <= excel_index < row_length else None)
+                    if excel_index is not None
+                    else (row_data.get(excel_column) if excel_column is not None else None)
+                )
+                for field_id, excel_column, excel_index in zip(field_ids, excel_columns, excel_indices)
+            }
+        else:
+            result = {
+                field_id: row_data.get(excel_column) if excel_column is not None else None
+                for field_id, excel_column in zip(field_ids, excel_columns)
+            }
 
-            result[field_id] = value
+        # 2단계: 이미지 필드만 img 태그로 변환
+        for field_id in self._image_field_ids:
+            value = result[field_id]
+            if value is not None:
+                result[field_id] = self._convert_image_to_img_tag(value)
 
         return result
 
@@ -135,53 +263,97 @@ class Mapper:
         Returns:
             <img src="data:..."> 형식의 HTML 태그, 실패시 빈 문자열
         """
-        data_url = self._convert_image_to_data_url(image_path)
-        if data_url:
-            return f'<img src="{data_url}" style="width:100%;height:100%;object-fit:contain;">'
-        return ""
+        try:
+            path = Path(image_path) if not isinstance(image_path, Path) else image_path
+            stat = path.stat()
+        except (OSError, TypeError, ValueError):
+            return ""
 
-    def _convert_image_to_data_url(self, image_path) -> str:
-        """이미지 경로를 Base64 data URL로 변환
+        # 파일이 바뀌면 수정 시각/크기가 달라져 다시 인코딩
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if self._shared_img_tag_cache is None:
+            return self._cached_img_tag(*cache_key)
 
-        Args:
-            image_path: 이미지 파일 경로 (Path 또는 str)
+        img_tag = self._shared_img_tag_cache.get(cache_key)
+        if img_tag is None:
+            img_tag = self._build_img_tag(*cache_key)
+            self._shared_img_tag_cache[cache_key] = img_tag
+        return img_tag
 
-        Returns:
-            data:image/png;base64,... 형식의 문자열, 실패시 빈 문자열
-        """
-        try:
-            path = Path(image_path) if not isinstance(image_path, Path) else image_path
-            if not path.exists():
-                return ""
-
-            with open(path, "rb") as f:
-                data = base64.b64encode(f.read()).decode("utf-8")
-
-            # 확장자로 MIME 타입 결정
-            suffix = path.suffix.lower()
-            mime_types = {
-                ".png": "image/png",
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-                ".gif": "image/gif",
-                ".webp": "image/webp",
-            }
-            mime_type = mime_types.get(suffix, "image/png")
+    def _build_img_tag(self, path: str, mtime_ns: int, size: int) -> str:
+        """이미지 파일을 인코딩하여 img 태그 생성 (수정 시각/크기는 캐시 키로만 사용)"""
+        data_url = self._convert_image_to_data_url(path)
+        if data_url:
+            return build_img_tag(data_url)
+        return ""
 
-            return f"data:{mime_type};base64,{data}"
-        except Exception:
-            return ""
+    def _convert_image_to_data_url(self, image_path) -> str:
+        """이미지 경로를 Base64 data URL로 변환 (encode_image_data_url 참고)"""
+        return encode_image_data_url(image_path)
 
     def apply_batch(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """다중 행에 매핑 적용
 
+        필드별로 컬럼 단위 변환 후 행 딕셔너리로 조립합니다.
+
         Args:
             rows: 엑셀 행 데이터 목록
 
         Returns:
             변환된 데이터 목록
         """
-        return [self.apply(row) for row in rows]
+        field_ids, excel_columns, _, is_images = self._get_plan()
+        if not field_ids:
+            return [{} for _ in rows]
+
+        columns = [
+            self._convert_image_column(
+                [row.get(excel_column) for row in rows] if excel_column is not None else [None] * len(rows),
+                is_image,
+            )
+            for excel_column, is_image in zip(excel_columns, is_images)
+        ]
+        return [dict(zip(field_ids, values)) for values in zip(*columns)]
+
+    def apply_batch_columnar(
+        self,
+        rows_by_index: List[List[Any]],
+        headers: Optional[List[str]] = None,
+    ) -> Dict[str, List[Any]]:
+        """인덱스 기반 다중 행에 매핑 적용 (필드별 컬럼 반환)
+
+        필드마다 엑셀 컬럼 인덱스를 한 번만 결정하고 해당 위치의 값만 모읍니다.
+        excel_index가 정의된 필드는 인덱스를 우선 사용합니다 (apply와 동일).
+
+        Args:
+            rows_by_index: 인덱스 기반 행 데이터 목록 [[value, ...], ...]
+            headers: 행 데이터의 헤더 목록 (None이면 생성 시 전달한 엑셀 헤더)
+
+        Returns:
+            {field_id: 행 순서대로의 값 리스트} 딕셔너리
+        """
+        if headers is None:
+            headers = self._excel_headers
+        # 중복 헤더는 행 딕셔너리와 같이 마지막 컬럼 사용
+        header_indices = {header: i for i, header in enumerate(headers)}
+        row_count = len(rows_by_index)
+
+        result = {}
+        for field_id, excel_column, excel_index, is_image in zip(*self._get_plan()):
+            index = excel_index if excel_index is not None else header_indices.get(excel_column)
+            if index is None or index < 0:
+                column = [None] * row_count
+            else:
+                column = [row[index] if index < len(row) else None for row in rows_by_index]
+            result[field_id] = self._convert_image_column(column, is_image)
+        return result
+
+    def _convert_image_column(self, column: List[Any], is_image: bool) -> List[Any]:
+        """이미지 필드 컬럼의 값을 img 태그로 변환 (이미지 필드가 아니면 그대로 반환)"""
+        if not is_image:
+            return column
+        convert = self._convert_image_to_img_tag
+        return [convert(value) if value is not None else None for value in column]
 
     def get_unmapped_fields(self) -> List[str]:
         """매핑되지 않은 필드 목록 반환
@@ -189,13 +361,16 @@ class Mapper:
         Returns:
             매핑되지 않은 필드 ID 목록
         """
-        mapping = self.get_mapping()
-        return [field_id for field_id, column in mapping.items() if column is None]
+        field_ids, excel_columns, _, _ = self._get_plan()
+        # 같은 ID의 필드가 여러 개여도 한 번만 포함
+        return list(dict.fromkeys(
+            field_id for field_id, column in zip(field_ids, excel_columns) if column is None
+        ))
 
     @property
     def is_fully_mapped(self) -> bool:
-        """모든 필드가 매핑되었는지 여부"""
-        return len(self.get_unmapped_fields()) == 0
+        """모든 필드가 매핑되었는지 여부 (미매핑 필드를 찾으면 즉시 반환)"""
+        return all(column is not None for column in self._get_plan()[1])
 
     def save_to_file(
         self, file_path: str, template_name: str, excel_file: str
@@ -208,7 +383,7 @@ class Mapper:
             excel_file: 엑셀 파일명
         """
         mapping = self.get_mapping()
-        now = datetime.now().isoformat()
+        now = time.strftime(_TIMESTAMP_FORMAT)
 
         data = {
             "version": "1.0",
@@ -222,8 +397,7 @@ class Mapper:
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        json_io.dump_file(path, data)
 
     def load_from_file(self, file_path: str) -> None:
         """파일에서 매핑 로드
@@ -240,8 +414,7 @@ class Mapper:
         if not path.exists():
             raise FileNotFoundError(f"매핑 파일을 찾을 수 없습니다: {file_path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_io.load_file(path)
 
         # 버전 확인
         if "version" not in data:
@@ -271,13 +444,17 @@ class Mapper:
         Args:
             config: {field_id: excel_column} 딕셔너리
         """
-        for field_id, excel_column in config.items():
-            if excel_column is not None:
-                self._manual_mappings[field_id] = excel_column
+        self._manual_mappings.update(
+            (field_id, excel_column)
+            for field_id, excel_column in config.items()
+            if excel_column is not None
+        )
+        self._invalidate_plan()
 
     def reset_to_auto(self) -> None:
         """모든 수동 매핑 제거 (자동 매핑으로 복원)"""
         self._manual_mappings.clear()
+        self._invalidate_plan()
 
     def get_mapping_status(self) -> Dict[str, str]:
         """각 필드의 매핑 상태 반환
@@ -287,14 +464,12 @@ class Mapper:
             status: "auto", "manual", "unmapped"
         """
         result = {}
-        mapping = self.get_mapping()
-
-        for field in self._template_fields:
-            field_id = field["id"]
+        field_ids, excel_columns, _, _ = self._get_plan()
 
+        for field_id, column in zip(field_ids, excel_columns):
             if field_id in self._manual_mappings:
                 result[field_id] = "manual"
-            elif mapping.get(field_id) is not None:
+            elif column is not None:
                 result[field_id] = "auto"
             else:
                 result[field_id] = "unmapped"
@@ -5,36 +5,66 @@ QWebEngine을 사용하여 HTML을 PDF로 변환합니다.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Callable, List, Optional
 
-from PyQt6.QtCore import QObject, QUrl, QMarginsF, pyqtSignal, QEventLoop, QTimer
+from PyQt6.QtCore import QObject, QUrl, QMarginsF, QSizeF, pyqtSignal, QEventLoop, QTimer
 from PyQt6.QtGui import QPageLayout, QPageSize
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEnginePage
 from PyQt6.QtWidgets import QApplication
 
 
+@lru_cache(maxsize=32)
+def _make_page_layout(page_width_mm: float, page_height_mm: float, margins_mm: float) -> QPageLayout:
+    """페이지 레이아웃 생성 (같은 크기/여백은 한 번만 생성, printToPdf는 복사본을 사용)"""
+    page_size = QPageSize(QPageSize.PageSizeId.A4)
+    if page_width_mm != 210 or page_height_mm != 297:
+        page_size = QPageSize(QSizeF(page_width_mm, page_height_mm), QPageSize.Unit.Millimeter)
+
+    margins = QMarginsF(margins_mm, margins_mm, margins_mm, margins_mm)
+    return QPageLayout(page_size, QPageLayout.Orientation.Portrait, margins, QPageLayout.Unit.Millimeter)
+
+
 class PdfConverter(QObject):
     """QWebEngine 기반 PDF 변환기"""
 
     conversion_finished = pyqtSignal(bool, str)  # success, path or error
 
+    POOL_SIZE = 2  # 변환기 간에 재사용하도록 보관할 유휴 WebEngineView 최대 수
+    CONVERSION_TIMEOUT_MS = 30000  # 변환 타임아웃 (30초)
+
+    # 유휴 WebEngineView 풀 (Chromium 렌더러 생성 비용을 내보내기마다 반복하지 않음)
+    _view_pool: List[QWebEngineView] = []
+    _pool_cleanup_connected = False
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._web_view: Optional[QWebEngineView] = None
         self._current_output_path: Optional[Path] = None
         self._conversion_success = False
         self._conversion_error = ""
+        self._loop: Optional[QEventLoop] = None  # 진행 중인 변환의 이벤트 루프
+        self._page_layout: Optional[QPageLayout] = None
 
     def _ensure_web_view(self):
-        """WebEngineView 초기화 (지연 생성)"""
-        if self._web_view is None:
+        """WebEngineView 준비 (풀에서 재사용하거나 지연 생성)"""
+        if self._web_view is not None:
+            return
+
+        if PdfConverter._view_pool:
+            self._web_view = PdfConverter._view_pool.pop()
+        else:
             self._web_view = QWebEngineView()
             self._web_view.setMinimumSize(1, 1)
             # 화면에 표시하지 않음
             self._web_view.hide()
 
+        # 시그널은 변환마다가 아니라 뷰를 가져올 때 한 번만 연결
+        self._web_view.loadFinished.connect(self._on_load_finished)
+        self._web_view.page().pdfPrintingFinished.connect(self._on_pdf_finished)
+
     def convert_html_to_pdf(
         self,
         html_path: Path,
@@ -55,64 +85,14 @@ class PdfConverter(QObject):
         Returns:
             변환 성공 여부
         """
-        self._ensure_web_view()
-        self._current_output_path = output_path
-        self._conversion_success = False
-        self._conversion_error = ""
-
-        # 출력 디렉토리 생성
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # 이벤트 루프 생성
-        loop = QEventLoop()
-
-        def on_load_finished(ok: bool):
-            if not ok:
-                self._conversion_error = "HTML 로드 실패"
-                self._conversion_success = False
-                loop.quit()
-                return
-
-            # 페이지 레이아웃 설정
-            page_size = QPageSize(QPageSize.PageSizeId.A4)
-            if page_width_mm != 210 or page_height_mm != 297:
-                from PyQt6.QtCore import QSizeF
-                page_size = QPageSize(QSizeF(page_width_mm, page_height_mm), QPageSize.Unit.Millimeter)
-
-            margins = QMarginsF(margins_mm, margins_mm, margins_mm, margins_mm)
-            page_layout = QPageLayout(page_size, QPageLayout.Orientation.Portrait, margins, QPageLayout.Unit.Millimeter)
-
-            # PDF 변환
-            self._web_view.page().printToPdf(str(output_path), page_layout)
-
-        def on_pdf_finished(file_path: str, success: bool):
-            self._conversion_success = success
-            if not success:
-                self._conversion_error = "PDF 변환 실패"
-            loop.quit()
-
-        # 시그널 연결
-        self._web_view.loadFinished.connect(on_load_finished)
-        self._web_view.page().pdfPrintingFinished.connect(on_pdf_finished)
-
-        # HTML 로드
         url = QUrl.fromLocalFile(str(html_path.absolute()))
-        self._web_view.load(url)
-
-        # 타임아웃 설정 (30초)
-        QTimer.singleShot(30000, loop.quit)
-
-        # 이벤트 루프 실행
-        loop.exec()
-
-        # 시그널 연결 해제
-        try:
-            self._web_view.loadFinished.disconnect(on_load_finished)
-            self._web_view.page().pdfPrintingFinished.disconnect(on_pdf_finished)
-        except TypeError:
-            pass
-
-        return self._conversion_success
+        return self._convert(
+            lambda: self._web_view.load(url),
+            output_path,
+            page_width_mm,
+            page_height_mm,
+            margins_mm,
+        )
 
     def convert_html_string_to_pdf(
         self,
@@ -133,6 +113,38 @@ class PdfConverter(QObject):
             page_height_mm: 페이지 높이 (mm)
             margins_mm: 여백 (mm)
 
+        Returns:
+            변환 성공 여부
+        """
+        if base_url:
+            base = QUrl.fromLocalFile(str(base_url.absolute()) + "/")
+        else:
+            base = QUrl()
+        return self._convert(
+            lambda: self._web_view.setHtml(html_content, base),
+            output_path,
+            page_width_mm,
+            page_height_mm,
+            margins_mm,
+        )
+
+    def _convert(
+        self,
+        load: Callable[[], None],
+        output_path: Path,
+        page_width_mm: float,
+        page_height_mm: float,
+        margins_mm: float,
+    ) -> bool:
+        """HTML 로드 후 PDF 저장이 끝날 때까지 대기
+
+        Args:
+            load: WebEngineView에 HTML을 로드하는 함수
+            output_path: 출력 PDF 파일 경로
+            page_width_mm: 페이지 너비 (mm)
+            page_height_mm: 페이지 높이 (mm)
+            margins_mm: 여백 (mm)
+
         Returns:
             변환 성공 여부
         """
@@ -140,70 +152,87 @@ class PdfConverter(QObject):
         self._current_output_path = output_path
         self._conversion_success = False
         self._conversion_error = ""
+        self._page_layout = _make_page_layout(page_width_mm, page_height_mm, margins_mm)
 
         # 출력 디렉토리 생성
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # 이벤트 루프 생성
         loop = QEventLoop()
+        self._loop = loop
 
-        def on_load_finished(ok: bool):
-            if not ok:
-                self._conversion_error = "HTML 로드 실패"
-                self._conversion_success = False
-                loop.quit()
-                return
-
-            # 페이지 레이아웃 설정
-            page_size = QPageSize(QPageSize.PageSizeId.A4)
-            if page_width_mm != 210 or page_height_mm != 297:
-                from PyQt6.QtCore import QSizeF
-                page_size = QPageSize(QSizeF(page_width_mm, page_height_mm), QPageSize.Unit.Millimeter)
-
-            margins = QMarginsF(margins_mm, margins_mm, margins_mm, margins_mm)
-            page_layout = QPageLayout(page_size, QPageLayout.Orientation.Portrait, margins, QPageLayout.Unit.Millimeter)
+        # HTML 로드
+        load()
 
-            # PDF 변환
-            self._web_view.page().printToPdf(str(output_path), page_layout)
+        # 타임아웃 설정
+        QTimer.singleShot(self.CONVERSION_TIMEOUT_MS, loop.quit)
 
-        def on_pdf_finished(file_path: str, success: bool):
-            self._conversion_success = success
-            if not success:
-                self._conversion_error = "PDF 변환 실패"
-            loop.quit()
+        # 이벤트 루프 실행
+        loop.exec()
+        self._loop = None
 
-        # 시그널 연결
-        self._web_view.loadFinished.connect(on_load_finished)
-        self._web_view.page().pdfPrintingFinished.connect(on_pdf_finished)
+        return self._conversion_success
 
-        # HTML 로드
-        if base_url:
-            base = QUrl.fromLocalFile(str(base_url.absolute()) + "/")
-        else:
-            base = QUrl()
-        self._web_view.setHtml(html_content, base)
+    def _on_load_finished(self, ok: bool):
+        """HTML 로드 완료 시 PDF 변환 시작"""
+        # 변환 중이 아닐 때(타임아웃 이후 등) 도착한 시그널은 무시
+        if self._loop is None:
+            return
 
-        # 타임아웃 설정 (30초)
-        QTimer.singleShot(30000, loop.quit)
+        if not ok:
+            self._conversion_error = "HTML 로드 실패"
+            self._conversion_success = False
+            self._loop.quit()
+            return
 
-        # 이벤트 루프 실행
-        loop.exec()
+        # PDF 변환
+        self._web_view.page().printToPdf(str(self._current_output_path), self._page_layout)
 
-        # 시그널 연결 해제
-        try:
-            self._web_view.loadFinished.disconnect(on_load_finished)
-            self._web_view.page().pdfPrintingFinished.disconnect(on_pdf_finished)
-        except TypeError:
-            pass
+    def _on_pdf_finished(self, file_path: str, success: bool):
+        """PDF 저장 완료 시 이벤트 루프 종료"""
+        # 이전 변환(타임아웃 등)의 늦은 완료 시그널은 무시
+        if self._loop is None or file_path != str(self._current_output_path):
+            return
 
-        return self._conversion_success
+        self._conversion_success = success
+        if not success:
+            self._conversion_error = "PDF 변환 실패"
+        self._loop.quit()
 
     def get_last_error(self) -> str:
         """마지막 에러 메시지 반환"""
         return self._conversion_error
 
     def cleanup(self):
-        """리소스 정리"""
-        if self._web_view:
+        """리소스 정리 (WebEngineView는 풀에 반환하여 다음 변환기에서 재사용)"""
+        if not self._web_view:
+            return
+
+        try:
+            self._web_view.loadFinished.disconnect(self._on_load_finished)
+            self._web_view.page().pdfPrintingFinished.disconnect(self._on_pdf_finished)
+        except TypeError:
+            pass
+
+        if len(PdfConverter._view_pool) < self.POOL_SIZE:
+            PdfConverter._view_pool.append(self._web_view)
+            PdfConverter._connect_pool_cleanup()
+        else:
             self._web_view.deleteLater()
-            self._web_view = None
+        self._web_view = None
+
+    @classmethod
+    def _connect_pool_cleanup(cls):
+        """앱 종료 시 풀의 WebEngineView 정리 (WebEngine 프로필보다 먼저 삭제)"""
+        if cls._pool_cleanup_connected:
+            return
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(cls.clear_pool)
+            cls._pool_cleanup_connected = True
+
+    @classmethod
+    def clear_pool(cls):
+        """유휴 WebEngineView 풀 비우기"""
+        while cls._view_pool:
+            cls._view_pool.pop().deleteLater()
@@ -0,0 +1,43 @@
+"""PDF 래스터화 모듈
+
+PDF 페이지를 PNG 이미지로 변환합니다.
+프로세스 풀 작업자에서 실행되므로 Qt 등 무거운 모듈을 임포트하지 않습니다.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import fitz  # PyMuPDF
+
+
+def render_first_page_to_png(pdf_path: Path, png_path: Path, dpi: int = 300) -> Optional[str]:
+    """PDF 첫 페이지를 PNG로 저장
+
+    Args:
+        pdf_path: 입력 PDF 경로
+        png_path: 출력 PNG 경로
+        dpi: 해상도
+
+    Returns:
+        실패 시 에러 메시지, 성공 시 None
+    """
+    try:
+        doc = fitz.open(pdf_path)
+        try:
+            if len(doc) == 0:
+                return f"빈 PDF: {pdf_path}"
+
+            page = doc[0]
+            # DPI를 줌 팩터로 변환 (72 DPI 기준)
+            zoom = dpi / 72
+            mat = fitz.Matrix(zoom, zoom)
+            # alpha=False로 투명 배경 제거
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+            pix.save(str(png_path))
+        finally:
+            doc.close()
+        return None
+    except Exception as e:
+        return f"PNG 변환 실패: {e}"
@@ -6,10 +6,14 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from src.core import json_io
+
 
 class TemplateError(Exception):
     """템플릿 관련 에러"""
@@ -19,9 +23,14 @@ class TemplateError(Exception):
 
 # 유효한 안전지표 목록 및 정렬 순서
 SAFETY_INDICATORS = ["RULA", "REBA", "OWAS", "NLE", "SI"]
+# 안전지표 → 정렬 순위 (목록에 없는 이름은 len(SAFETY_INDICATORS))
+_INDICATOR_RANK = {name: i for i, name in enumerate(SAFETY_INDICATORS)}
+
+# 템플릿 수만큼 생성되는 데이터클래스는 __slots__ 사용 (Python 3.10+에서만 지원)
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Template:
     """템플릿 정보"""
 
@@ -48,13 +57,34 @@ class Template:
             TemplateError: 매핑 파일 파싱 실패 시
         """
         try:
-            with open(mapping_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_io.load_file(mapping_path)
         except json.JSONDecodeError as e:
             raise TemplateError(f"매핑 파일 파싱 실패: {mapping_path} - {e}")
         except Exception as e:
             raise TemplateError(f"매핑 파일 읽기 실패: {mapping_path} - {e}")
 
+        return cls.from_mapping_dict(data, mapping_path)
+
+    @classmethod
+    def from_mapping_dict(
+        cls,
+        data: Dict[str, Any],
+        mapping_path: Path,
+        template_path: Optional[Path] = None,
+    ) -> "Template":
+        """이미 메모리에 있는 매핑 데이터에서 템플릿 생성 (파일을 다시 읽지 않음)
+
+        Args:
+            data: mapping.json 내용
+            mapping_path: mapping.json 파일 경로
+            template_path: 템플릿 파일 경로 (None이면 매핑 파일 폴더에서 찾음)
+
+        Returns:
+            Template 인스턴스
+
+        Raises:
+            TemplateError: 템플릿 파일을 찾을 수 없을 때
+        """
         name = data.get("name", "Unknown")
         version = data.get("version", "1.0")
         template_type = data.get("type", "html")
@@ -67,14 +97,15 @@ class Template:
             safety_indicator = None
 
         # 템플릿 파일 경로 찾기
-        template_dir = mapping_path.parent
-        if template_type == "html":
-            template_path = cls._find_file(template_dir, [".html", ".htm"])
-        else:  # image
-            template_path = cls._find_file(template_dir, [".png", ".jpg", ".jpeg"])
-
         if template_path is None:
-            raise TemplateError(f"템플릿 파일을 찾을 수 없습니다: {template_dir}")
+            template_dir = mapping_path.parent
+            if template_type == "html":
+                template_path = cls._find_file(template_dir, [".html", ".htm"])
+            else:  # image
+                template_path = cls._find_file(template_dir, [".png", ".jpg", ".jpeg"])
+
+            if template_path is None:
+                raise TemplateError(f"템플릿 파일을 찾을 수 없습니다: {template_dir}")
 
         return cls(
             name=name,
@@ -87,14 +118,54 @@ class Template:
             description=description,
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (스캔 인덱스 저장용)"""
+        return {
+            "name": self.name,
+            "version": self.version,
+            "type": self.template_type,
+            "template_path": str(self.template_path),
+            "mapping_path": str(self.mapping_path),
+            "fields": self.fields,
+            "safety_indicator": self.safety_indicator,
+            "description": self.description,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Template":
+        """딕셔너리에서 생성 (to_dict의 역변환)"""
+        return cls(
+            name=data["name"],
+            version=data["version"],
+            template_type=data["type"],
+            template_path=Path(data["template_path"]),
+            mapping_path=Path(data["mapping_path"]),
+            fields=data["fields"],
+            safety_indicator=data["safety_indicator"],
+            description=data["description"],
+        )
+
     @staticmethod
     def _find_file(directory: Path, extensions: List[str]) -> Optional[Path]:
-        """디렉토리에서 특정 확장자 파일 찾기"""
-        for ext in extensions:
-            for file in directory.glob(f"*{ext}"):
-                if not file.name.endswith(".mapping.json"):
-                    return file
-        return None
+        """디렉토리에서 특정 확장자 파일 찾기
+
+        디렉토리를 한 번만 읽고, 여러 파일이 있으면 extensions 순서가 앞선 확장자를 우선합니다.
+        """
+        priorities = {ext.lower(): i for i, ext in enumerate(extensions)}
+        found: Optional[Path] = None
+        found_priority = len(extensions)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".mapping.json") or not entry.is_file():
+                    continue
+                priority = priorities.get(os.path.splitext(name)[1].lower())
+                if priority is not None and priority < found_priority:
+                    found = Path(entry.path)
+                    found_priority = priority
+                    if priority == 0:
+                        break
+        return found
 
 
 class TemplateManager:
@@ -108,6 +179,8 @@ class TemplateManager:
 
     BUILTIN_DIR = "_builtin"
     USER_DIR = "user"
+    INDEX_FILE = ".index.json"  # 스캔 결과 캐시 파일
+    INDEX_VERSION = 1
 
     def __init__(self, templates_dir: Path):
         """
@@ -119,13 +192,24 @@ class TemplateManager:
         """
         self._templates_dir = Path(templates_dir)
         self._templates: Dict[str, Template] = {}
+        self._sorted_names: Optional[List[str]] = None  # 정렬된 템플릿 이름 (스캔 시 초기화)
+        # 매핑 파일 경로 → {"signature": [...], "template": {...}} (이전/이번 스캔 결과)
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._new_index: Dict[str, Dict[str, Any]] = {}
         self._scan_templates()
 
     def _scan_templates(self) -> None:
-        """템플릿 디렉토리 스캔 (새 구조 + 레거시 구조 지원)"""
+        """템플릿 디렉토리 스캔 (새 구조 + 레거시 구조 지원)
+
+        매핑 파일과 템플릿 폴더가 바뀌지 않은 템플릿은 인덱스 파일의 결과를 사용합니다.
+        """
+        self._sorted_names = None
         if not self._templates_dir.exists():
             return
 
+        self._index = self._load_index()
+        self._new_index = {}
+
         # 새 구조: _builtin/ 디렉토리
         builtin_dir = self._templates_dir / self.BUILTIN_DIR
         if builtin_dir.exists():
@@ -137,45 +221,114 @@ class TemplateManager:
             self._scan_directory(user_dir)
 
         # 레거시 구조: 루트 디렉토리의 템플릿 (하위 호환성)
-        for template_dir in self._templates_dir.iterdir():
-            if not template_dir.is_dir():
-                continue
-            # 특수 디렉토리 스킵
-            if template_dir.name in (self.BUILTIN_DIR, self.USER_DIR, "sample"):
-                continue
-            if template_dir.name.startswith(".") or template_dir.name.startswith("_"):
-                continue
-
-            mapping_files = list(template_dir.glob("*.mapping.json"))
-            if not mapping_files:
-                continue
+        with os.scandir(self._templates_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                # 특수 디렉토리 스킵
+                if entry.name in (self.BUILTIN_DIR, self.USER_DIR, "sample"):
+                    continue
+                if entry.name.startswith(".") or entry.name.startswith("_"):
+                    continue
 
-            try:
-                template = Template.from_mapping_file(mapping_files[0])
-                self._templates[template.name] = template
-            except TemplateError:
-                continue
+                mapping_files, _ = self._list_mapping_files(entry.path)
+                if not mapping_files:
+                    continue
+
+                self._load_template(Path(entry.path, mapping_files[0]), entry)
+
+        if self._new_index != self._index:
+            self._save_index()
 
     def _scan_directory(self, directory: Path) -> None:
         """특정 디렉토리의 템플릿 스캔"""
-        for template_dir in directory.iterdir():
-            if not template_dir.is_dir():
-                continue
-            if template_dir.name.startswith("."):
-                continue
-
-            # mapping.json 또는 *.mapping.json 찾기
-            mapping_files = list(template_dir.glob("*.mapping.json"))
-            if not mapping_files:
-                mapping_files = list(template_dir.glob("mapping.json"))
-            if not mapping_files:
-                continue
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if entry.name.startswith("."):
+                    continue
+
+                # mapping.json 또는 *.mapping.json 찾기
+                mapping_files, has_plain_mapping = self._list_mapping_files(entry.path)
+                if not mapping_files:
+                    if not has_plain_mapping:
+                        continue
+                    mapping_files = ["mapping.json"]
+
+                self._load_template(Path(entry.path, mapping_files[0]), entry)
 
+    @staticmethod
+    def _list_mapping_files(template_dir: str) -> tuple[List[str], bool]:
+        """템플릿 폴더의 매핑 파일 목록 (폴더를 한 번만 읽음)
+
+        Returns:
+            (*.mapping.json 파일명 목록, mapping.json 존재 여부)
+        """
+        mapping_files = []
+        has_plain_mapping = False
+        with os.scandir(template_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".mapping.json"):
+                    mapping_files.append(entry.name)
+                elif entry.name == "mapping.json":
+                    has_plain_mapping = True
+        return mapping_files, has_plain_mapping
+
+    def _load_template(self, mapping_path: Path, dir_entry: os.DirEntry) -> None:
+        """템플릿 로드 (인덱스에 같은 상태로 기록된 경우 매핑 파일을 다시 파싱하지 않음)
+
+        Args:
+            mapping_path: 매핑 파일 경로
+            dir_entry: 템플릿 폴더 항목 (폴더 수정 시각으로 템플릿 파일 추가/삭제 감지)
+        """
+        try:
+            mapping_stat = mapping_path.stat()
+            signature = [
+                mapping_stat.st_mtime_ns,
+                mapping_stat.st_size,
+                dir_entry.stat().st_mtime_ns,
+            ]
+        except OSError:
+            return
+
+        key = str(mapping_path)
+        template = None
+        cached = self._index.get(key)
+        if isinstance(cached, dict) and cached.get("signature") == signature:
+            try:
+                template = Template.from_dict(cached["template"])
+            except (KeyError, TypeError):
+                template = None  # 손상된 항목은 매핑 파일에서 다시 읽음
+
+        if template is None:
             try:
-                template = Template.from_mapping_file(mapping_files[0])
-                self._templates[template.name] = template
+                template = Template.from_mapping_file(mapping_path)
             except TemplateError:
-                continue
+                return
+
+        self._templates[template.name] = template
+        self._new_index[key] = {"signature": signature, "template": template.to_dict()}
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """인덱스 파일 로드 (없거나 손상/버전 불일치 시 빈 인덱스)"""
+        try:
+            data = json_io.load_file(self._templates_dir / self.INDEX_FILE)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.INDEX_VERSION:
+            return {}
+        entries = data.get("templates")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_index(self) -> None:
+        """인덱스 파일 저장 (읽기 전용 위치 등 저장 실패는 무시)"""
+        data = {"version": self.INDEX_VERSION, "templates": self._new_index}
+        try:
+            json_io.dump_file(self._templates_dir / self.INDEX_FILE, data, indent=False)
+        except OSError:
+            pass
 
     def get(self, name: str) -> Optional[Template]:
         """이름으로 템플릿 조회
@@ -199,14 +352,13 @@ class TemplateManager:
     @property
     def template_names(self) -> List[str]:
         """템플릿 이름 목록 (SAFETY_INDICATORS 순서로 정렬)"""
-        names = list(self._templates.keys())
-        # SAFETY_INDICATORS 순서대로 정렬, 목록에 없는 템플릿은 뒤로
-        def sort_key(name: str) -> int:
-            try:
-                return SAFETY_INDICATORS.index(name)
-            except ValueError:
-                return len(SAFETY_INDICATORS)
-        return sorted(names, key=sort_key)
+        if self._sorted_names is None:
+            # SAFETY_INDICATORS 순서대로 정렬, 목록에 없는 템플릿은 뒤로 (스캔 후 1회만 정렬)
+            unranked = len(SAFETY_INDICATORS)
+            self._sorted_names = sorted(
+                self._templates, key=lambda name: _INDICATOR_RANK.get(name, unranked)
+            )
+        return list(self._sorted_names)
 
     def refresh(self) -> None:
         """템플릿 목록 새로고침"""
@@ -6,17 +6,27 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from .template_manager import Template, TemplateError
+from . import json_io
+from .template_manager import DATACLASS_SLOTS, Template, TemplateError
 
+# 내보내기 ZIP에서 압축하지 않고 저장할 확장자 (이미 압축된 형식)
+_PRECOMPRESSED_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp"})
 
-@dataclass
+# ExtendedTemplate.fields를 아직 매핑 파일에서 읽지 않았음을 나타내는 값
+_FIELDS_DEFERRED = object()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TemplateMetadata:
     """템플릿 메타데이터"""
 
@@ -44,24 +54,23 @@ class TemplateMetadata:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TemplateMetadata":
-        """딕셔너리에서 생성"""
+        """딕셔너리에서 생성 (스캔마다 템플릿 수만큼 호출되므로 키를 한 번씩만 조회)"""
+        get = data.get
+        created_at = get("created_at")
+        updated_at = get("updated_at")
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", "Unknown"),
-            version=data.get("version", "1.0"),
-            description=data.get("description", ""),
-            based_on=data.get("based_on"),
-            is_active=data.get("is_active", True),
-            created_at=datetime.fromisoformat(data["created_at"])
-            if "created_at" in data
-            else datetime.now(),
-            updated_at=datetime.fromisoformat(data["updated_at"])
-            if "updated_at" in data
-            else datetime.now(),
+            id=get("id", ""),
+            name=get("name", "Unknown"),
+            version=get("version", "1.0"),
+            description=get("description", ""),
+            based_on=get("based_on"),
+            is_active=get("is_active", True),
+            created_at=datetime.fromisoformat(created_at) if created_at is not None else datetime.now(),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at is not None else datetime.now(),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExtendedTemplate(Template):
     """확장 템플릿 (메타데이터 포함)"""
 
@@ -69,6 +78,8 @@ class ExtendedTemplate(Template):
     is_builtin: bool = True
     is_readonly: bool = True
     metadata: Optional[TemplateMetadata] = None
+    # fields 실제 값 (__init__에서 fields 프로퍼티로 설정, _FIELDS_DEFERRED면 처음 접근할 때 매핑 파일에서 읽음)
+    _fields: Any = field(init=False, repr=False, compare=False)
 
     @classmethod
     def from_template(
@@ -94,6 +105,40 @@ class ExtendedTemplate(Template):
             metadata=metadata,
         )
 
+    def defer_fields(self) -> None:
+        """fields를 처음 접근할 때 매핑 파일에서 읽도록 설정 (인덱스에서 복원한 템플릿용)"""
+        self._fields = _FIELDS_DEFERRED
+
+    def _get_fields(self) -> List[Dict[str, Any]]:
+        """템플릿 필드 목록 (지연 로드 상태면 매핑 파일에서 읽어 보관)
+
+        Raises:
+            TemplateError: 매핑 파일을 읽을 수 없거나 형식이 잘못된 경우
+                (보관하지 않으므로 다음 접근 시 다시 읽음)
+        """
+        fields = self._fields
+        if fields is _FIELDS_DEFERRED:
+            try:
+                data = json_io.load_file(self.mapping_path)
+            except OSError as e:
+                raise TemplateError(f"매핑 파일 읽기 실패: {self.mapping_path} - {e}") from e
+            except ValueError as e:
+                raise TemplateError(f"매핑 파일 파싱 실패: {self.mapping_path} - {e}") from e
+            fields = data.get("fields", []) if isinstance(data, dict) else None
+            if not isinstance(fields, list):
+                raise TemplateError(f"매핑 파일 형식 오류: {self.mapping_path}")
+            self._fields = fields
+        return fields
+
+    def _set_fields(self, value: List[Dict[str, Any]]) -> None:
+        self._fields = value
+
+
+# dataclass(slots=True)는 필드 이름과 같은 클래스 속성을 제거하므로 클래스 생성 후 프로퍼티 등록
+ExtendedTemplate.fields = property(
+    ExtendedTemplate._get_fields, ExtendedTemplate._set_fields, doc=ExtendedTemplate._get_fields.__doc__
+)
+
 
 class TemplateStorage:
     """템플릿 저장소
@@ -115,6 +160,11 @@ class TemplateStorage:
 
     BUILTIN_DIR = "_builtin"
     USER_DIR = "user"
+    INDEX_FILE = ".storage_index.json"  # 스캔 결과 캐시 파일 (TemplateManager 인덱스와 별도)
+    INDEX_VERSION = 3
+    SCAN_WORKERS = 8  # 템플릿 폴더 병렬 읽기 스레드 수
+    PARALLEL_SCAN_MIN = 8  # 이 개수 이상의 폴더만 스레드 풀로 읽음
+    ZIP_DEFLATE_MIN_SIZE = 16 * 1024  # 내보내기 시 이 크기 이상의 파일만 압축
 
     def __init__(self, templates_dir: Path):
         """
@@ -131,115 +181,394 @@ class TemplateStorage:
 
         # 템플릿 캐시
         self._templates: Dict[str, ExtendedTemplate] = {}
+        # 사용자 템플릿 ID → 캐시 시점의 meta.json 수정 시각 (ns, 파일이 없으면 None)
+        self._meta_mtimes: Dict[str, Optional[int]] = {}
+        # 이름 → 템플릿 ID (첫 번째 매칭, 조회 시 생성하고 템플릿 추가/삭제/이름 변경 시 초기화)
+        self._name_index: Optional[Dict[str, str]] = None
+        # is_builtin → 해당 템플릿 목록 (조회 시 생성하고 템플릿 추가/삭제 시 초기화)
+        self._filtered_templates: Dict[bool, List[ExtendedTemplate]] = {}
+        # "{BUILTIN_DIR|USER_DIR}/{template_id}" → {"signature": [...], "template": {...}, ...}
+        # (이전 스캔 결과 / 현재 캐시 상태)
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._new_index: Dict[str, Dict[str, Any]] = {}
         self._scan_all()
 
     def _scan_all(self) -> None:
-        """모든 템플릿 스캔"""
+        """모든 템플릿 스캔
+
+        폴더와 매핑/메타 파일이 바뀌지 않은 템플릿은 인덱스 파일의 결과를 사용합니다.
+        """
         self._templates.clear()
+        self._meta_mtimes.clear()
+        self._name_index = None
+        self._filtered_templates.clear()
+        self._index = self._load_index()
+        self._new_index = {}
         self._scan_builtin_templates()
         self._scan_user_templates()
+        if self._new_index != self._index:
+            self._save_index()
 
-    def _scan_builtin_templates(self) -> None:
-        """기본 템플릿 스캔"""
-        if not self._builtin_dir.exists():
+    @staticmethod
+    def _scandir_templates(root: Path) -> Iterator[os.DirEntry]:
+        """템플릿 폴더 항목 순회 (숨김 폴더 제외, 루트가 없으면 빈 결과)
+
+        os.scandir의 DirEntry는 파일 종류 정보를 캐시하므로 항목마다 stat을 호출하지 않습니다.
+        """
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        yield entry
+        except FileNotFoundError:
             return
 
+    @staticmethod
+    def _find_mapping_file(template_dir: str) -> Optional[str]:
+        """폴더에서 첫 번째 *.mapping.json 파일 경로 찾기 (폴더를 한 번만 읽음)"""
+        with os.scandir(template_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".mapping.json"):
+                    return entry.path
+        return None
+
+    def _read_template_dirs(
+        self, read: Callable[[str, str], Any], root: Path
+    ) -> List[Tuple[str, str, Any]]:
+        """루트 아래 템플릿 폴더들을 read(template_id, template_dir)로 읽기
+
+        폴더가 많으면 파일 읽기/파싱을 스레드 풀에서 겹쳐 실행합니다.
+        read는 인스턴스 상태를 변경하지 않아야 하며, 결과 반영은 호출한 스레드에서 합니다.
+
+        Returns:
+            [(템플릿 ID, 폴더 경로, read 결과), ...]
+        """
+        entries = [(entry.name, entry.path) for entry in self._scandir_templates(root)]
+        if len(entries) < self.PARALLEL_SCAN_MIN:
+            return [(tid, path, read(tid, path)) for tid, path in entries]
+
+        with ThreadPoolExecutor(max_workers=min(self.SCAN_WORKERS, len(entries))) as executor:
+            results = executor.map(lambda item: read(*item), entries)
+            return [(tid, path, result) for (tid, path), result in zip(entries, results)]
+
+    def _scan_builtin_templates(self) -> None:
+        """기본 템플릿 스캔"""
         # 기본 템플릿 설정 로드
         builtin_settings = self._load_builtin_settings()
         active_states = builtin_settings.get("active_states", {})
         metadata_overrides = builtin_settings.get("metadata", {})
 
-        for template_dir in self._builtin_dir.iterdir():
-            if not template_dir.is_dir() or template_dir.name.startswith("."):
+        for template_id, _, loaded in self._read_template_dirs(
+            self._read_builtin_template, self._builtin_dir
+        ):
+            if loaded is None:
                 continue
+            template, from_index, signature = loaded
+            self._new_index[f"{self.BUILTIN_DIR}/{template_id}"] = {
+                "signature": signature,
+                "template": self._template_to_index(template),
+            }
 
-            mapping_files = list(template_dir.glob("*.mapping.json"))
-            if not mapping_files:
-                continue
+            # 설정 파일의 오버라이드 값 가져오기
+            overrides = metadata_overrides.get(template_id, {})
 
-            try:
-                template = Template.from_mapping_file(mapping_files[0])
-                template_id = template_dir.name  # 폴더명을 ID로 사용
-
-                # 설정 파일의 오버라이드 값 가져오기
-                overrides = metadata_overrides.get(template_id, {})
-
-                # 활성화 상태를 포함한 메타데이터 생성
-                is_active = active_states.get(template_id, True)
-                metadata = TemplateMetadata(
-                    id=template_id,
-                    name=overrides.get("name", template.name),
-                    description=overrides.get("description", template.description),
-                    is_active=is_active,
-                )
+            # 활성화 상태를 포함한 메타데이터 생성
+            is_active = active_states.get(template_id, True)
+            metadata = TemplateMetadata(
+                id=template_id,
+                name=overrides.get("name", template.name),
+                description=overrides.get("description", template.description),
+                is_active=is_active,
+            )
 
-                extended = ExtendedTemplate.from_template(
-                    template, template_id, is_builtin=True, metadata=metadata
+            extended = ExtendedTemplate.from_template(
+                template, template_id, is_builtin=True, metadata=metadata
+            )
+            if from_index:
+                extended.defer_fields()
+            # 오버라이드된 이름도 ExtendedTemplate에 반영
+            if "name" in overrides:
+                extended.name = overrides["name"]
+            self._templates[template_id] = extended
+        self._name_index = None
+        self._filtered_templates.clear()
+
+    def _read_builtin_template(
+        self, template_id: str, template_dir: str
+    ) -> Optional[Tuple[Template, bool, Optional[list]]]:
+        """기본 템플릿 폴더의 Template 읽기 (인덱스에 같은 상태로 기록된 경우 파싱 생략)
+
+        Returns:
+            (템플릿 (설정 파일 오버라이드 적용 전), 인덱스에서 복원 여부, 서명),
+            유효하지 않으면 None. 인덱스에서 복원한 템플릿의 fields는 비어 있음
+        """
+        cached = self._index.get(f"{self.BUILTIN_DIR}/{template_id}")
+        if isinstance(cached, dict):
+            try:
+                signature = self._signature(
+                    template_dir, os.path.join(template_dir, cached["template"]["mapping_file"])
                 )
-                # 오버라이드된 이름도 ExtendedTemplate에 반영
-                if "name" in overrides:
-                    extended.name = overrides["name"]
-                self._templates[template_id] = extended
-            except TemplateError:
-                continue
+                if cached["signature"] == signature:
+                    return self._template_from_index(cached["template"], template_dir), True, signature
+            except (KeyError, TypeError):
+                pass  # 손상된 항목은 매핑 파일에서 다시 읽음
+
+        mapping_path = self._find_mapping_file(template_dir)
+        if mapping_path is None:
+            return None
+        try:
+            template = Template.from_mapping_file(Path(mapping_path))
+        except TemplateError:
+            return None
+        return template, False, self._signature(template_dir, mapping_path)
 
     def _scan_user_templates(self) -> None:
         """사용자 템플릿 스캔"""
-        if not self._user_dir.exists():
-            return
+        for template_id, _, loaded in self._read_template_dirs(
+            self._read_user_template, self._user_dir
+        ):
+            if loaded is not None:
+                self._add_user_template(template_id, *loaded)
 
-        for template_dir in self._user_dir.iterdir():
-            if not template_dir.is_dir() or template_dir.name.startswith("."):
-                continue
+    def _load_user_template(self, template_id: str, template_dir: str) -> Optional[ExtendedTemplate]:
+        """사용자 템플릿 폴더 하나를 읽어 캐시에 반영
 
-            mapping_path = template_dir / "mapping.json"
-            meta_path = template_dir / "meta.json"
+        Args:
+            template_id: 템플릿 ID (폴더명)
+            template_dir: 템플릿 폴더 경로
 
-            if not mapping_path.exists():
-                continue
+        Returns:
+            로드된 템플릿, 유효하지 않으면 None (캐시에서도 제거)
+        """
+        loaded = self._read_user_template(template_id, template_dir)
+        if loaded is None:
+            self._forget_user_template(template_id)
+            return None
+        return self._add_user_template(template_id, *loaded)
+
+    def _read_user_template(
+        self, template_id: str, template_dir: str
+    ) -> Optional[Tuple[Template, Optional[TemplateMetadata], bool, Optional[list]]]:
+        """사용자 템플릿 폴더 읽기
+
+        폴더와 mapping.json/meta.json이 인덱스에 기록된 상태와 같으면 파일을 파싱하지 않습니다.
 
+        Returns:
+            (템플릿, 메타데이터, 인덱스에서 복원 여부, 서명), 유효하지 않으면 None
+        """
+        # mapping.json이 없으면 from_mapping_file이 TemplateError를 발생시킴
+        mapping_path = os.path.join(template_dir, "mapping.json")
+        meta_path = os.path.join(template_dir, "meta.json")
+        signature = self._signature(template_dir, mapping_path, meta_path)
+
+        cached = self._index.get(f"{self.USER_DIR}/{template_id}")
+        if signature is not None and isinstance(cached, dict) and cached.get("signature") == signature:
             try:
-                template = Template.from_mapping_file(mapping_path)
-                template_id = template_dir.name
+                template = self._template_from_index(cached["template"], template_dir)
+                metadata = None
+                if cached["meta"] is not None:
+                    metadata = TemplateMetadata.from_dict(cached["meta"])
+                return template, metadata, True, signature
+            except (KeyError, TypeError, ValueError):
+                pass  # 손상된 항목은 파일에서 다시 읽음
 
-                # 메타데이터 로드
+        try:
+            template = Template.from_mapping_file(Path(mapping_path))
+
+            # 메타데이터 로드 (없으면 None)
+            try:
+                metadata = TemplateMetadata.from_dict(json_io.load_file(meta_path))
+            except FileNotFoundError:
                 metadata = None
-                if meta_path.exists():
-                    with open(meta_path, "r", encoding="utf-8") as f:
-                        metadata = TemplateMetadata.from_dict(json.load(f))
+        except (TemplateError, json.JSONDecodeError):
+            return None
+        return template, metadata, False, signature
 
-                extended = ExtendedTemplate.from_template(
-                    template, template_id, is_builtin=False, metadata=metadata
-                )
-                extended.is_readonly = False
-                self._templates[template_id] = extended
-            except (TemplateError, json.JSONDecodeError):
-                continue
+    def _add_user_template(
+        self,
+        template_id: str,
+        template: Template,
+        metadata: Optional[TemplateMetadata],
+        from_index: bool,
+        signature: Optional[list],
+    ) -> ExtendedTemplate:
+        """읽은 사용자 템플릿을 캐시와 인덱스에 반영"""
+        extended = ExtendedTemplate.from_template(
+            template, template_id, is_builtin=False, metadata=metadata
+        )
+        if from_index:
+            extended.defer_fields()
+        self._templates[template_id] = extended
+        self._name_index = None
+        self._filtered_templates.clear()
+        self._remember_user_template(extended, save=False, signature=signature)
+        return extended
+
+    def _remember_user_template(
+        self, template: ExtendedTemplate, save: bool = True, signature: Optional[list] = None
+    ) -> None:
+        """사용자 템플릿의 현재 파일 상태를 meta.json 수정 시각 캐시와 인덱스에 기록
+
+        Args:
+            template: 캐시된 사용자 템플릿
+            save: True면 인덱스 파일도 저장
+            signature: 이미 계산한 서명 (None이면 파일 상태를 다시 확인)
+        """
+        if signature is None:
+            template_dir = os.path.join(self._user_dir, template.id)
+            signature = self._signature(
+                template_dir,
+                os.path.join(template_dir, "mapping.json"),
+                os.path.join(template_dir, "meta.json"),
+            )
+        self._meta_mtimes[template.id] = signature[-1][0] if signature and signature[-1] else None
+        self._new_index[f"{self.USER_DIR}/{template.id}"] = {
+            "signature": signature,
+            "template": self._template_to_index(template),
+            "meta": template.metadata.to_dict() if template.metadata else None,
+        }
+        if save:
+            self._save_index()
+
+    def _forget_user_template(self, template_id: str, save: bool = False) -> None:
+        """사용자 템플릿을 캐시와 인덱스에서 제거"""
+        self._templates.pop(template_id, None)
+        self._name_index = None
+        self._filtered_templates.clear()
+        self._meta_mtimes.pop(template_id, None)
+        if self._new_index.pop(f"{self.USER_DIR}/{template_id}", None) is not None and save:
+            self._save_index()
+
+    @staticmethod
+    def _template_to_index(template: Template) -> Optional[Dict[str, Any]]:
+        """인덱스에 기록할 템플릿 정보 (fields는 필요할 때 매핑 파일에서 읽으므로 제외)
+
+        템플릿 루트를 옮기거나 복사해도 수정 시각이 유지되어 서명이 일치하므로,
+        경로는 템플릿 폴더 기준 파일명으로만 기록하고 복원 시 현재 폴더에서 다시 만듭니다.
+
+        Returns:
+            인덱스 항목, 템플릿 파일이 매핑 파일과 다른 폴더에 있으면 None (다음 스캔에서 다시 읽음)
+        """
+        if template.template_path.parent != template.mapping_path.parent:
+            return None
+        return {
+            "name": template.name,
+            "version": template.version,
+            "type": template.template_type,
+            "template_file": template.template_path.name,
+            "mapping_file": template.mapping_path.name,
+            "safety_indicator": template.safety_indicator,
+            "description": template.description,
+        }
+
+    @staticmethod
+    def _template_from_index(data: Dict[str, Any], template_dir: str) -> Template:
+        """인덱스 항목에서 Template 복원 (경로는 현재 템플릿 폴더 기준, fields는 빈 목록)"""
+        template_dir = Path(template_dir)
+        return Template(
+            name=data["name"],
+            version=data["version"],
+            template_type=data["type"],
+            template_path=template_dir / data["template_file"],
+            mapping_path=template_dir / data["mapping_file"],
+            fields=[],
+            safety_indicator=data["safety_indicator"],
+            description=data["description"],
+        )
+
+    def _signature(self, template_dir: str, *file_paths: str) -> Optional[list]:
+        """템플릿 폴더와 파일들의 변경 감지용 서명
+
+        Returns:
+            [폴더 수정 시각, [파일 수정 시각, 크기] 또는 None(파일 없음), ...],
+            폴더가 없으면 None
+        """
+        dir_mtime = self._get_mtime_ns(template_dir)
+        if dir_mtime is None:
+            return None
+        signature: list = [dir_mtime]
+        for path in file_paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append([st.st_mtime_ns, st.st_size])
+        return signature
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """인덱스 파일 로드 (없거나 손상/버전 불일치 시 빈 인덱스)"""
+        try:
+            data = json_io.load_file(self._root / self.INDEX_FILE)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.INDEX_VERSION:
+            return {}
+        entries = data.get("templates")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_index(self) -> None:
+        """인덱스 파일 저장 (읽기 전용 위치 등 저장 실패는 무시)"""
+        data = {"version": self.INDEX_VERSION, "templates": self._new_index}
+        try:
+            json_io.dump_file(self._root / self.INDEX_FILE, data, indent=False)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _get_mtime_ns(path: str) -> Optional[int]:
+        """파일 수정 시각 (ns, 파일이 없으면 None)"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _rescan_if_stale(self, template_id: str) -> None:
+        """meta.json이 외부에서 변경된 사용자 템플릿만 다시 로드"""
+        if template_id not in self._meta_mtimes:
+            return
+        template_dir = os.path.join(self._user_dir, template_id)
+        if self._get_mtime_ns(os.path.join(template_dir, "meta.json")) != self._meta_mtimes[template_id]:
+            self._load_user_template(template_id, template_dir)
 
     # ========== Read Operations ==========
 
     def get_builtin_templates(self) -> List[ExtendedTemplate]:
         """기본 템플릿 목록 반환"""
-        return [t for t in self._templates.values() if t.is_builtin]
+        return self._get_filtered_templates(True)
 
     def get_user_templates(self) -> List[ExtendedTemplate]:
         """사용자 템플릿 목록 반환"""
-        return [t for t in self._templates.values() if not t.is_builtin]
+        return self._get_filtered_templates(False)
+
+    def _get_filtered_templates(self, is_builtin: bool) -> List[ExtendedTemplate]:
+        """기본/사용자 템플릿 목록 (캐시된 목록의 복사본)"""
+        templates = self._filtered_templates.get(is_builtin)
+        if templates is None:
+            templates = [t for t in self._templates.values() if t.is_builtin == is_builtin]
+            self._filtered_templates[is_builtin] = templates
+        return list(templates)
 
     def get_all_templates(self) -> List[ExtendedTemplate]:
         """모든 템플릿 반환"""
         return list(self._templates.values())
 
     def get_template(self, template_id: str) -> Optional[ExtendedTemplate]:
-        """ID로 템플릿 조회"""
+        """ID로 템플릿 조회 (사용자 템플릿은 meta.json이 바뀌었으면 다시 로드)"""
+        self._rescan_if_stale(template_id)
         return self._templates.get(template_id)
 
     def get_template_by_name(self, name: str) -> Optional[ExtendedTemplate]:
         """이름으로 템플릿 조회 (첫 번째 매칭)"""
-        for template in self._templates.values():
-            if template.name == name:
-                return template
-        return None
+        if self._name_index is None:
+            self._name_index = {}
+            for template_id, template in self._templates.items():
+                self._name_index.setdefault(template.name, template_id)
+        template_id = self._name_index.get(name)
+        return self._templates.get(template_id) if template_id is not None else None
 
     # ========== Create Operations ==========
 
@@ -285,8 +614,7 @@ class TemplateStorage:
                 "description": description,
                 "fields": fields,
             }
-            with open(mapping_path, "w", encoding="utf-8") as f:
-                json.dump(mapping_data, f, ensure_ascii=False, indent=2)
+            json_io.dump_file(mapping_path, mapping_data)
 
             # meta.json 저장
             now = datetime.now()
@@ -300,16 +628,18 @@ class TemplateStorage:
                 updated_at=now,
             )
             meta_path = template_dir / "meta.json"
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(metadata.to_dict(), f, ensure_ascii=False, indent=2)
+            json_io.dump_file(meta_path, metadata.to_dict())
 
-            # 캐시에 추가
-            template = Template.from_mapping_file(mapping_path)
+            # 캐시에 추가 (방금 기록한 데이터로 생성, 매핑 파일을 다시 읽지 않음)
+            template = Template.from_mapping_dict(mapping_data, mapping_path, html_path)
             extended = ExtendedTemplate.from_template(
                 template, template_id, is_builtin=False, metadata=metadata
             )
             extended.is_readonly = False
             self._templates[template_id] = extended
+            self._name_index = None
+            self._filtered_templates.clear()
+            self._remember_user_template(extended)
 
             return extended
 
@@ -386,46 +716,53 @@ class TemplateStorage:
         template_dir = self._user_dir / template_id
 
         try:
-            # HTML 업데이트
-            if html_content is not None:
-                with open(template.template_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-
-            # mapping.json 업데이트
+            # 변경 내용을 메모리에서 먼저 적용
             mapping_path = template_dir / "mapping.json"
-            with open(mapping_path, "r", encoding="utf-8") as f:
-                mapping_data = json.load(f)
-
+            mapping_data = json_io.load_file(mapping_path)
+            new_mapping_data = dict(mapping_data)
             if name is not None:
-                mapping_data["name"] = name
+                new_mapping_data["name"] = name
             if fields is not None:
-                mapping_data["fields"] = fields
+                new_mapping_data["fields"] = fields
             if description is not None:
-                mapping_data["description"] = description
+                new_mapping_data["description"] = description
 
-            with open(mapping_path, "w", encoding="utf-8") as f:
-                json.dump(mapping_data, f, ensure_ascii=False, indent=2)
-
-            # meta.json 업데이트
             meta_path = template_dir / "meta.json"
-            if meta_path.exists():
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta_data = json.load(f)
-            else:
-                meta_data = {"id": template_id}
-
+            meta_data = self._load_user_meta(meta_path, template_id)
+            new_meta_data = dict(meta_data)
             if name is not None:
-                meta_data["name"] = name
+                new_meta_data["name"] = name
             if description is not None:
-                meta_data["description"] = description
-            meta_data["updated_at"] = datetime.now().isoformat()
+                new_meta_data["description"] = description
 
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(meta_data, f, ensure_ascii=False, indent=2)
+            mapping_changed = new_mapping_data != mapping_data
+            if html_content is None and not mapping_changed and new_meta_data == meta_data:
+                # 바뀐 내용이 없으면 파일을 다시 쓰지 않음 (수정 시각도 유지)
+                return template
+            new_meta_data["updated_at"] = datetime.now().isoformat()
 
-            # 캐시 갱신
-            self._scan_user_templates()
-            return self._templates[template_id]
+            # 직렬화를 모두 마친 뒤 파일 기록
+            mapping_bytes = json_io.dumps(new_mapping_data, indent=True) if mapping_changed else None
+            meta_bytes = json_io.dumps(new_meta_data, indent=True)
+
+            if html_content is not None:
+                with open(template.template_path, "w", encoding="utf-8") as f:
+                    f.write(html_content)
+            if mapping_bytes is not None:
+                json_io.write_file(mapping_path, mapping_bytes)
+            json_io.write_file(meta_path, meta_bytes)
+            meta_data = new_meta_data
+
+            # 캐시 갱신 (다른 템플릿을 다시 읽지 않고 이 템플릿만 수정)
+            if name is not None:
+                template.name = name
+                self._name_index = None
+            if fields is not None:
+                template.fields = fields
+            if description is not None:
+                template.description = description
+            self._set_user_metadata(template, meta_data)
+            return template
 
         except Exception as e:
             raise TemplateError(f"템플릿 업데이트 실패: {e}")
@@ -441,6 +778,9 @@ class TemplateStorage:
         if template is None:
             raise TemplateError(f"템플릿을 찾을 수 없습니다: {template_id}")
 
+        if template.name == name:
+            return  # 변경 없음 (파일을 읽거나 쓰지 않음)
+
         if template.is_builtin:
             # 기본 템플릿: 별도 설정 파일에 저장
             self._update_builtin_metadata(template_id, name=name)
@@ -459,9 +799,13 @@ class TemplateStorage:
             raise TemplateError(f"템플릿을 찾을 수 없습니다: {template_id}")
 
         if template.is_builtin:
-            # 기본 템플릿: 별도 설정 파일에 저장
+            # 기본 템플릿: 별도 설정 파일에 저장 (표시 설명은 메타데이터에 있음)
+            if template.metadata is not None and template.metadata.description == description:
+                return
             self._update_builtin_metadata(template_id, description=description)
         else:
+            if template.description == description:
+                return  # 변경 없음 (파일을 읽거나 쓰지 않음)
             self.update_template(template_id, description=description)
 
     def update_template_active(self, template_id: str, is_active: bool) -> None:
@@ -475,6 +819,9 @@ class TemplateStorage:
         if template is None:
             raise TemplateError(f"템플릿을 찾을 수 없습니다: {template_id}")
 
+        if template.metadata is not None and template.metadata.is_active == is_active:
+            return  # 변경 없음 (파일을 읽거나 쓰지 않음)
+
         try:
             if template.is_builtin:
                 # 기본 템플릿: 별도 설정 파일에 저장
@@ -483,42 +830,47 @@ class TemplateStorage:
                 # 사용자 템플릿: meta.json에 저장
                 template_dir = self._user_dir / template_id
                 meta_path = template_dir / "meta.json"
-
-                if meta_path.exists():
-                    with open(meta_path, "r", encoding="utf-8") as f:
-                        meta_data = json.load(f)
-                else:
-                    meta_data = {"id": template_id}
+                meta_data = self._load_user_meta(meta_path, template_id)
 
                 meta_data["is_active"] = is_active
                 meta_data["updated_at"] = datetime.now().isoformat()
 
-                with open(meta_path, "w", encoding="utf-8") as f:
-                    json.dump(meta_data, f, ensure_ascii=False, indent=2)
+                json_io.dump_file(meta_path, meta_data)
 
                 # 캐시 갱신
-                self._scan_user_templates()
+                self._set_user_metadata(template, meta_data)
 
         except Exception as e:
             raise TemplateError(f"템플릿 활성화 상태 업데이트 실패: {e}")
 
+    @staticmethod
+    def _load_user_meta(meta_path: Path, template_id: str) -> Dict[str, Any]:
+        """meta.json 내용 로드 (파일이 없으면 ID만 있는 새 메타데이터)"""
+        try:
+            return json_io.load_file(meta_path)
+        except FileNotFoundError:
+            return {"id": template_id}
+
+    def _set_user_metadata(self, template: ExtendedTemplate, meta_data: Dict[str, Any]) -> None:
+        """저장한 meta.json 내용을 캐시된 사용자 템플릿에 반영"""
+        template.metadata = TemplateMetadata.from_dict(meta_data)
+        self._remember_user_template(template)
+
     def _get_builtin_settings_path(self) -> Path:
         """기본 템플릿 설정 파일 경로"""
         return self._root / "_builtin_settings.json"
 
     def _load_builtin_settings(self) -> Dict[str, Any]:
         """기본 템플릿 설정 로드"""
-        settings_path = self._get_builtin_settings_path()
-        if settings_path.exists():
-            with open(settings_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+        try:
+            return json_io.load_file(self._get_builtin_settings_path())
+        except FileNotFoundError:
+            return {}
 
     def _save_builtin_settings(self, settings: Dict[str, Any]) -> None:
         """기본 템플릿 설정 저장"""
         settings_path = self._get_builtin_settings_path()
-        with open(settings_path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
+        json_io.dump_file(settings_path, settings)
 
     def _update_builtin_active(self, template_id: str, is_active: bool) -> None:
         """기본 템플릿 활성화 상태 업데이트"""
@@ -529,7 +881,9 @@ class TemplateStorage:
         self._save_builtin_settings(settings)
 
         # 캐시 갱신
-        self._scan_builtin_templates()
+        metadata = self._templates[template_id].metadata
+        if metadata is not None:
+            metadata.is_active = is_active
 
     def _update_builtin_metadata(
         self,
@@ -552,7 +906,14 @@ class TemplateStorage:
         self._save_builtin_settings(settings)
 
         # 캐시 갱신
-        self._scan_builtin_templates()
+        template = self._templates[template_id]
+        if name is not None:
+            template.name = name
+            self._name_index = None
+            if template.metadata is not None:
+                template.metadata.name = name
+        if description is not None and template.metadata is not None:
+            template.metadata.description = description
 
     def get_builtin_active_state(self, template_id: str) -> bool:
         """기본 템플릿의 활성화 상태 조회"""
@@ -580,11 +941,12 @@ class TemplateStorage:
         if template.is_builtin:
             raise TemplateError("기본 템플릿은 삭제할 수 없습니다.")
 
-        template_dir = self._user_dir / template_id
-        if template_dir.exists():
-            shutil.rmtree(template_dir)
+        try:
+            shutil.rmtree(self._user_dir / template_id)
+        except FileNotFoundError:
+            pass
 
-        del self._templates[template_id]
+        self._forget_user_template(template_id, save=True)
         return True
 
     # ========== Export/Import Operations ==========
@@ -613,9 +975,20 @@ class TemplateStorage:
         if export_path.suffix.lower() != ".zip":
             export_path = export_path.with_suffix(".zip")
 
-        shutil.make_archive(
-            str(export_path.with_suffix("")), "zip", template_dir.parent, template_dir.name
-        )
+        # 이미 압축된 이미지와 작은 파일은 압축 없이 저장 (압축 이득보다 CPU 비용이 큼)
+        with zipfile.ZipFile(export_path, "w") as zf:
+            for dirpath, _, filenames in os.walk(template_dir):
+                for filename in filenames:
+                    full_path = os.path.join(dirpath, filename)
+                    arcname = os.path.relpath(full_path, template_dir.parent)
+                    if (
+                        os.path.splitext(filename)[1].lower() in _PRECOMPRESSED_SUFFIXES
+                        or os.path.getsize(full_path) < self.ZIP_DEFLATE_MIN_SIZE
+                    ):
+                        compress_type = zipfile.ZIP_STORED
+                    else:
+                        compress_type = zipfile.ZIP_DEFLATED
+                    zf.write(full_path, arcname, compress_type=compress_type)
         return True
 
     def import_template(self, import_path: Path, new_name: Optional[str] = None) -> ExtendedTemplate:
@@ -631,56 +1004,49 @@ class TemplateStorage:
         Raises:
             TemplateError: 가져오기 실패 시
         """
-        import tempfile
-        import zipfile
+        import posixpath
 
         if not import_path.exists():
             raise TemplateError(f"파일을 찾을 수 없습니다: {import_path}")
 
-        # 임시 디렉토리에 압축 해제
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            with zipfile.ZipFile(import_path, "r") as zf:
-                zf.extractall(temp_path)
-
-            # 압축 해제된 디렉토리 찾기
-            extracted_dirs = [d for d in temp_path.iterdir() if d.is_dir()]
-            if not extracted_dirs:
-                # 파일이 루트에 직접 있는 경우
-                extracted_dir = temp_path
-            else:
-                extracted_dir = extracted_dirs[0]
+        # 압축 해제 없이 ZIP 항목을 바로 읽음
+        with zipfile.ZipFile(import_path, "r") as zf:
+            names = [name for name in zf.namelist() if not name.endswith("/")]
+
+            # 템플릿 폴더 찾기 (최상위 폴더가 없으면 파일이 루트에 직접 있는 경우)
+            top_dirs = [name.split("/", 1)[0] for name in names if "/" in name]
+            base_dir = top_dirs[0] if top_dirs else ""
+            files = {
+                posixpath.basename(name): name
+                for name in names
+                if posixpath.dirname(name) == base_dir
+            }
 
             # mapping.json 찾기
-            mapping_files = list(extracted_dir.glob("*.mapping.json")) + list(
-                extracted_dir.glob("mapping.json")
-            )
-            if not mapping_files:
+            mapping_names = [n for n in files if n.endswith(".mapping.json")]
+            if "mapping.json" in files:
+                mapping_names.append("mapping.json")
+            if not mapping_names:
                 raise TemplateError("유효한 템플릿이 아닙니다: mapping.json을 찾을 수 없습니다.")
 
             # HTML 파일 찾기
-            html_files = list(extracted_dir.glob("*.html"))
-            if not html_files:
+            html_names = [n for n in files if n.endswith(".html")]
+            if not html_names:
                 raise TemplateError("유효한 템플릿이 아닙니다: HTML 파일을 찾을 수 없습니다.")
 
-            # 템플릿 생성
-            with open(html_files[0], "r", encoding="utf-8") as f:
-                html_content = f.read()
-
-            with open(mapping_files[0], "r", encoding="utf-8") as f:
-                mapping_data = json.load(f)
+            html_content = zf.read(files[html_names[0]]).decode("utf-8")
+            mapping_data = json_io.loads(zf.read(files[mapping_names[0]]))
 
-            name = new_name or mapping_data.get("name", "Imported Template")
-            fields = mapping_data.get("fields", [])
-            description = mapping_data.get("description", "")
+        name = new_name or mapping_data.get("name", "Imported Template")
+        fields = mapping_data.get("fields", [])
+        description = mapping_data.get("description", "")
 
-            return self.create_template(
-                name=name,
-                html_content=html_content,
-                fields=fields,
-                description=description,
-            )
+        return self.create_template(
+            name=name,
+            html_content=html_content,
+            fields=fields,
+            description=description,
+        )
 
     def refresh(self) -> None:
         """캐시 새로고침"""
@@ -1,5 +1,7 @@
 """라이센스 등록 다이얼로그 모듈"""
 
+import re
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QMessageBox, QFrame,
@@ -10,7 +12,13 @@ from PyQt6.QtGui import QFont
 
 from .hardware_id import get_hardware_id
 from .license_manager import LicenseManager, LicenseMode
-from .license_validator import ValidationResult
+from .license_validator import LicenseValidator, ValidationResult
+
+# 입력 중 키 형식 체크용 (XXXX-XXXX-XXXX-XXXX, 앞뒤 공백과 소문자는 등록 시 정규화)
+_KEY_INPUT_PATTERN = re.compile(r'\s*[A-Za-z0-9]{4}-[A-Za-z0-9]{4}-[A-Za-z0-9]{4}-[A-Za-z0-9]{4}\s*')
+
+# 등록 실패 원인 분석용 검증기 (상태가 없으므로 공유)
+_VALIDATOR = LicenseValidator()
 
 
 class LicenseDialog(QDialog):
@@ -195,10 +203,8 @@ class LicenseDialog(QDialog):
 
     def _on_key_changed(self, text: str):
         """키 입력 변경"""
-        # 형식 체크: XXXX-XXXX-XXXX-XXXX
-        normalized = text.strip().upper()
-        is_valid_format = len(normalized) == 19 and normalized.count('-') == 3
-        self._register_btn.setEnabled(is_valid_format)
+        # 형식 체크: XXXX-XXXX-XXXX-XXXX (키 입력마다 호출되므로 중간 문자열을 만들지 않음)
+        self._register_btn.setEnabled(_KEY_INPUT_PATTERN.fullmatch(text) is not None)
 
     def _copy_hardware_id(self):
         """하드웨어 ID 복사"""
@@ -234,10 +240,8 @@ class LicenseDialog(QDialog):
             self._update_state()
             self.accept()
         else:
-            # 실패 원인 분석
-            from .license_validator import LicenseValidator
-            validator = LicenseValidator()
-            result = validator.validate(key, get_hardware_id())
+            # 실패 원인 분석 (get_hardware_id는 모듈 단위로 캐시됨)
+            result = _VALIDATOR.validate(key, get_hardware_id())
 
             if result == ValidationResult.INVALID_FORMAT:
                 message = "라이센스 키 형식이 올바르지 않습니다.\nXXXX-XXXX-XXXX-XXXX 형식으로 입력해 주세요."
@@ -5,11 +5,24 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
-
-from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QSize
-from PyQt6.QtGui import QIcon, QPixmap, QImage
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSize,
+    QThreadPool,
+)
+from PyQt6.QtGui import QBrush, QColor, QIcon, QPixmap, QImage
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -21,7 +34,6 @@ from PyQt6.QtWidgets import (
     QHeaderView,
     QFileDialog,
     QProgressDialog,
-    QApplication,
     QDialog,
     QStyledItemDelegate,
     QStyle,
@@ -30,9 +42,47 @@ from PyQt6.QtWidgets import (
 from src.core.excel_loader import ExcelLoader, ExcelLoaderError
 from src.core.logger import get_logger
 
+_ICON_DIR = Path(__file__).parent.parent / "resources" / "icons"
+
+
+@lru_cache(maxsize=None)
+def _icon(name: str) -> QIcon:
+    """아이콘 로드 (SVG는 파일별로 한 번만 읽고 뷰어 인스턴스 간에 공유)"""
+    return QIcon(str(_ICON_DIR / name))
+
+
+# data()에서 비교하는 역할 (Qt.ItemDataRole 속성 조회를 호출마다 반복하지 않도록 모듈 수준에 바인딩)
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_CHECK_STATE_ROLE = Qt.ItemDataRole.CheckStateRole
+_DECORATION_ROLE = Qt.ItemDataRole.DecorationRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+# dataChanged에 넘기는 역할 목록 (호출마다 리스트를 만들지 않도록 불변 튜플로 공유)
+_CHECK_STATE_ROLES = (_CHECK_STATE_ROLE,)
+_BACKGROUND_ROLES = (Qt.ItemDataRole.BackgroundRole,)
+
+# 모델 페이지: (컬럼별 표시 문자열 - 아직 변환하지 않은 컬럼은 None, {(페이지 내 행, 컬럼): 이미지 경로})
+_Page = Tuple[List[Optional[List[Optional[str]]]], Dict[Tuple[int, int], Path]]
+
 
 class ImageDelegate(QStyledItemDelegate):
-    """이미지 셀을 가운데 정렬하는 delegate"""
+    """이미지 셀을 가운데 정렬하고 미리보기 행 배경을 그리는 delegate
+
+    미리보기 행 배경은 모델의 BackgroundRole 대신 여기서 행 번호만 비교해 지정하므로
+    셀마다 배경색을 묻는 data() 호출이 생기지 않습니다.
+    """
+
+    PREVIEW_BRUSH = QBrush(QColor(60, 70, 90))  # 미리보기 행 하이라이트 (다크 테마용)
+
+    def __init__(self, model: "ExcelTableModel", parent=None):
+        super().__init__(parent)
+        self._model = model
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.row() == self._model._preview_row:
+            option.backgroundBrush = self.PREVIEW_BRUSH
 
     def paint(self, painter, option, index):
         # 이미지인지 확인
@@ -44,10 +94,8 @@ class ImageDelegate(QStyledItemDelegate):
             # 배경 그리기
             if option.state & QStyle.StateFlag.State_Selected:
                 painter.fillRect(option.rect, option.palette.highlight())
-            else:
-                bg = index.data(Qt.ItemDataRole.BackgroundRole)
-                if bg:
-                    painter.fillRect(option.rect, bg)
+            elif index.row() == self._model._preview_row:
+                painter.fillRect(option.rect, self.PREVIEW_BRUSH)
 
             # 이미지 중앙 위치 계산
             x = option.rect.x() + (option.rect.width() - pixmap.width()) // 2
@@ -59,6 +107,32 @@ class ImageDelegate(QStyledItemDelegate):
             super().paint(painter, option, index)
 
 
+class _LoadSignals(QObject):
+    """백그라운드 로드 작업 시그널 (GUI 스레드로 전달)"""
+
+    progress = pyqtSignal(int, str)  # (단계, 메시지)
+    finished = pyqtSignal(object)    # 로드가 끝난 ExcelLoader
+    failed = pyqtSignal(str)         # 오류 메시지
+
+
+class _LoadTask(QRunnable):
+    """ExcelLoader.load를 QThreadPool 작업자 스레드에서 실행"""
+
+    def __init__(self, file_path: Path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _LoadSignals()
+
+    def run(self):
+        try:
+            loader = ExcelLoader()
+            loader.load(self.file_path, progress_callback=self.signals.progress.emit)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(loader)
+
+
 class ImagePreviewDialog(QDialog):
     """이미지 미리보기 다이얼로그"""
 
@@ -100,96 +174,168 @@ class ExcelTableModel(QAbstractTableModel):
     """엑셀 데이터 테이블 모델"""
 
     THUMBNAIL_SIZE = 40  # 썸네일 크기
+    PAGE_SIZE = 256  # 표시 문자열을 만드는 행 단위
+    MAX_PAGES = 16  # 유지할 최대 페이지 수 (초과 시 가장 오래 안 쓴 페이지 제거)
+    ROW_LABEL_CHUNK = 1000  # 세로 헤더 행 번호 문자열을 만드는 단위
+
+    # data()는 보이는 셀마다 호출되므로 반환 값을 미리 만들어 둠
+    _CENTER = Qt.AlignmentFlag.AlignCenter
+    _CHECKED = Qt.CheckState.Checked
+    _UNCHECKED = Qt.CheckState.Unchecked
+    # QAbstractTableModel.flags()가 유효한 셀에 반환하는 값과 동일
+    _CELL_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemNeverHasChildren
+    _CHECKBOX_FLAGS = _CELL_FLAGS | Qt.ItemFlag.ItemIsUserCheckable
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._logger = get_logger("excel_model")
         self._headers: List[str] = []
-        self._data: List[Dict[str, Any]] = []
-        self._data_by_index: List[List[Any]] = []  # 인덱스 기반 데이터
-        self._selected_rows: Set[int] = set()
+        self._nrows: int = 0
+        self._ncols: int = 1  # 체크박스 컬럼 + 데이터 컬럼
+        self._columns: Sequence[Sequence[Any]] = []  # 컬럼별 원본 값 (로더의 열 우선 데이터)
+        # 페이지 번호 -> 페이지 (가장 최근에 사용한 페이지가 뒤)
+        self._pages: OrderedDict[int, _Page] = OrderedDict()
+        # 행별 선택 여부 (1바이트/행). data()는 bytearray를 직접 인덱싱하고,
+        # 전체 선택/목록 조회 같은 일괄 처리는 같은 버퍼의 NumPy 뷰로 수행
+        self._selected = bytearray()
+        self._selected_view: np.ndarray = np.frombuffer(self._selected, dtype=np.bool_)
+        self._sorted_selection: Optional[List[int]] = None  # 정렬된 선택 행 캐시 (선택 변경 시 초기화)
         self._preview_row: int = 0
+        self._visible_columns: Optional[Tuple[int, int]] = None  # 뷰에 보이는 (첫, 마지막) 컬럼
         self._thumbnail_cache: Dict[str, QPixmap] = {}  # 썸네일 캐시
         self._thumbnail_paths: Dict[str, Path] = {}  # 미리 생성된 썸네일 경로
-
-    def load_data(self, headers: List[str], data: List[Dict[str, Any]], data_by_index: List[List[Any]] = None, thumbnail_paths: Dict[str, Path] = None):
+        # 청크 번호 -> 행 번호 문자열 (데이터와 무관하므로 다시 로드해도 유지)
+        self._row_label_chunks: Dict[int, List[str]] = {}
+
+    def load_data(
+        self,
+        headers: List[str],
+        columns: Sequence[Sequence[Any]],
+        row_count: int,
+        thumbnail_paths: Dict[str, Path] = None,
+    ):
         """데이터 로드
 
+        원본 값은 참조만 보관하고, 표시 문자열은 뷰가 요청한 셀이 속한
+        페이지(PAGE_SIZE행)의 해당 컬럼 단위로 필요할 때 만듭니다.
+
         Args:
             headers: 헤더 목록
-            data: 데이터 딕셔너리 목록
-            data_by_index: 인덱스 기반 데이터
+            columns: 컬럼별 값 시퀀스 (헤더 순서, 각 row_count개)
+            row_count: 행 수
             thumbnail_paths: 미리 생성된 썸네일 경로 (cell_key -> path)
         """
         self.beginResetModel()
         self._headers = headers
-        self._data = data
-        self._data_by_index = data_by_index or []
-        self._selected_rows.clear()
+        self._columns = columns
+        self._nrows = row_count
+        self._ncols = len(headers) + 1
+        self._pages.clear()
+        self._selected = bytearray(row_count)
+        self._selected_view = np.frombuffer(self._selected, dtype=np.bool_)
+        self._sorted_selection = None
         self._preview_row = 0
         self._thumbnail_cache.clear()  # 썸네일 캐시 초기화
         self._thumbnail_paths = thumbnail_paths or {}  # 미리 생성된 썸네일 경로
         self.endResetModel()
 
-    def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._data)
+    def _get_page(self, page_index: int) -> _Page:
+        """페이지 반환 (없으면 만들고, 최근 사용 순서 갱신)"""
+        page = self._pages.get(page_index)
+        if page is None:
+            page = self._build_page(page_index)
+            self._pages[page_index] = page
+            if len(self._pages) > self.MAX_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_index)
+        return page
 
-    def columnCount(self, parent=QModelIndex()) -> int:
-        # 체크박스 컬럼 + 데이터 컬럼
-        return len(self._headers) + 1
+    def _build_page(self, page_index: int) -> _Page:
+        """빈 페이지 생성 (컬럼별 표시 문자열은 처음 요청될 때 _page_column에서 만듦)"""
+        return [None] * len(self._headers), {}
 
-    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
+    def _page_column(self, row: int, col_index: int) -> Tuple[List[Optional[str]], Dict[Tuple[int, int], Path], int]:
+        """행이 속한 페이지의 컬럼 표시 문자열 반환 (화면에 보이지 않는 컬럼은 변환하지 않음)
+
+        Returns:
+            (컬럼 표시 문자열, 페이지 이미지 경로 맵, 페이지 내 행 위치)
+        """
+        page_index, offset = divmod(row, self.PAGE_SIZE)
+        texts, images = self._get_page(page_index)
+        column_texts = texts[col_index]
+        if column_texts is None:
+            start = page_index * self.PAGE_SIZE
+            end = min(start + self.PAGE_SIZE, self._nrows)
+            column_texts = self._stringify(col_index, start, end, images)
+            texts[col_index] = column_texts
+        return column_texts, images, offset
+
+    def _stringify(self, col_index: int, start: int, end: int, images: Dict[Tuple[int, int], Path]) -> List[Optional[str]]:
+        """컬럼 범위의 값을 표시 문자열로 변환 (이미지 셀은 None, 경로는 images에 기록)"""
+        if col_index >= len(self._columns):
+            return [""] * (end - start)
+        values = self._columns[col_index][start:end]
+        if not any(isinstance(value, Path) for value in values):
+            # 이미지가 없는 컬럼은 컴프리헨션 한 번으로 변환
+            return ["" if value is None else str(value) for value in values]
+        column_texts = []
+        for offset, value in enumerate(values):
+            if value is None:
+                column_texts.append("")
+            elif isinstance(value, Path) and value.exists():
+                # 이미지 셀 - 텍스트 없음 (DecorationRole에서 처리)
+                images[(offset, col_index)] = value
+                column_texts.append(None)
+            else:
+                column_texts.append(str(value))
+        return column_texts
+
+    def _get_image_path(self, row: int, col: int) -> Optional[Path]:
+        """이미지 셀의 경로 반환 (이미지 셀이 아니면 None)"""
+        if col == 0:
             return None
+        _, images, offset = self._page_column(row, col - 1)
+        return images.get((offset, col - 1))
 
-        row = index.row()
-        col = index.column()
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return self._nrows
 
-        # 셀 값 가져오기
-        value = None
-        if col > 0:
-            col_index = col - 1
-            if self._data_by_index and row < len(self._data_by_index):
-                row_data = self._data_by_index[row]
-                if col_index < len(row_data):
-                    value = row_data[col_index]
+    def columnCount(self, parent=QModelIndex()) -> int:
+        # 체크박스 컬럼 + 데이터 컬럼 (선택 모델이 셀마다 호출하므로 로드 시 계산한 값 반환)
+        return self._ncols
 
-        # 이미지 경로인지 확인
-        from pathlib import Path
-        is_image = isinstance(value, Path) and value.exists()
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        # 보이는 셀마다 여러 역할로 호출되므로 자주 묻는 역할부터 확인하고 바로 반환
+        if not index.isValid():
+            return None
 
-        if role == Qt.ItemDataRole.DisplayRole:
+        if role == _DISPLAY_ROLE:
+            col = index.column()
             if col == 0:
                 # 체크박스 컬럼 - 텍스트 없음
                 return None
-            elif is_image:
-                # 이미지 셀 - 텍스트 없음 (DecorationRole에서 처리)
-                return None
-            else:
-                return str(value) if value is not None else ""
-
-        elif role == Qt.ItemDataRole.DecorationRole:
-            if is_image:
-                # 썸네일 반환
-                return self._get_thumbnail(value)
+            column_texts, _, offset = self._page_column(index.row(), col - 1)
+            return column_texts[offset]
 
-        elif role == Qt.ItemDataRole.CheckStateRole:
-            if col == 0:
-                check_state = Qt.CheckState.Checked if row in self._selected_rows else Qt.CheckState.Unchecked
-                return check_state
+        if role == _ALIGNMENT_ROLE:
+            return self._CENTER
 
-        elif role == Qt.ItemDataRole.BackgroundRole:
-            if row == self._preview_row:
-                from PyQt6.QtGui import QColor
-                return QColor(60, 70, 90)  # 미리보기 행 하이라이트 (다크 테마용)
+        if role == _CHECK_STATE_ROLE:
+            if index.column() == 0:
+                return self._CHECKED if self._selected[index.row()] else self._UNCHECKED
+            return None
 
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignCenter
+        if role == _DECORATION_ROLE:
+            image_path = self._get_image_path(index.row(), index.column())
+            if image_path is not None:
+                # 썸네일 반환
+                return self._get_thumbnail(image_path)
+            return None
 
-        elif role == Qt.ItemDataRole.UserRole:
+        if role == _USER_ROLE:
             # 이미지 경로 반환 (클릭 시 미리보기용)
-            if is_image:
-                return value
+            return self._get_image_path(index.row(), index.column())
 
         return None
 
@@ -224,14 +370,27 @@ class ExcelTableModel(QAbstractTableModel):
             elif section - 1 < len(self._headers):
                 return self._headers[section - 1]
         elif orientation == Qt.Orientation.Vertical and role == Qt.ItemDataRole.DisplayRole:
-            return str(section + 1)
+            return self._row_label(section)
         return None
 
+    def _row_label(self, section: int) -> str:
+        """행 번호 문자열 (1부터 시작, ROW_LABEL_CHUNK 단위로 한 번만 생성해 재사용)"""
+        chunk_index, offset = divmod(section, self.ROW_LABEL_CHUNK)
+        chunk = self._row_label_chunks.get(chunk_index)
+        if chunk is None:
+            start = chunk_index * self.ROW_LABEL_CHUNK + 1
+            chunk = list(map(str, range(start, start + self.ROW_LABEL_CHUNK)))
+            self._row_label_chunks[chunk_index] = chunk
+        return chunk[offset]
+
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:
-        flags = super().flags(index)
-        if index.column() == 0:
-            flags |= Qt.ItemFlag.ItemIsUserCheckable
-        return flags
+        # 선택 모델이 셀마다 호출하므로 기본 구현을 거치지 않고 미리 계산한 값 반환
+        col = index.column()
+        if col == 0:
+            return self._CHECKBOX_FLAGS
+        if col > 0:
+            return self._CELL_FLAGS
+        return Qt.ItemFlag.NoItemFlags  # 유효하지 않은 인덱스
 
     def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
         if index.column() == 0 and role == Qt.ItemDataRole.CheckStateRole:
@@ -243,69 +402,126 @@ class ExcelTableModel(QAbstractTableModel):
             
             self._logger.debug(f"setData() 체크박스 토글: row={row}, is_checked={is_checked}")
             
-            if is_checked:
-                self._selected_rows.add(row)
-            else:
-                self._selected_rows.discard(row)
+            self._selected[row] = is_checked
+            self._update_sorted_selection(row, is_checked)
             
-            self.dataChanged.emit(index, index, [role])
+            self.dataChanged.emit(index, index, _CHECK_STATE_ROLES)
             return True
         return False
 
     def get_selected_rows(self) -> List[int]:
-        """선택된 행 인덱스 목록"""
-        return sorted(list(self._selected_rows))
+        """선택된 행 인덱스 목록 (선택이 바뀔 때까지 결과를 재사용)"""
+        if self._sorted_selection is None:
+            self._sorted_selection = np.flatnonzero(self._selected_view).tolist()
+        return list(self._sorted_selection)
+
+    def _update_sorted_selection(self, row: int, selected: bool):
+        """한 행의 선택 변경을 정렬 캐시에 반영 (전체를 다시 정렬하지 않음)"""
+        cache = self._sorted_selection
+        if cache is None:
+            return
+        pos = bisect_left(cache, row)
+        present = pos < len(cache) and cache[pos] == row
+        if selected and not present:
+            cache.insert(pos, row)
+        elif not selected and present:
+            del cache[pos]
+
+    def selected_count(self) -> int:
+        """선택된 행 수 (목록을 만들지 않고 계산)"""
+        return int(np.count_nonzero(self._selected_view))
 
     def set_selected_rows(self, rows: Set[int]):
-        """선택 행 설정"""
-        self._selected_rows = rows
+        """선택 행 설정 (범위를 벗어난 행은 무시)"""
+        self._selected_view.fill(False)
+        self._selected_view[[row for row in rows if 0 <= row < self._nrows]] = True
+        self._sorted_selection = None
         self.dataChanged.emit(
             self.index(0, 0),
             self.index(self.rowCount() - 1, 0),
-            [Qt.ItemDataRole.CheckStateRole]
+            _CHECK_STATE_ROLES
         )
 
     def select_all(self):
         """모든 행 선택"""
-        self._selected_rows = set(range(len(self._data)))
+        self._selected_view.fill(True)
+        self._sorted_selection = None
         self.dataChanged.emit(
             self.index(0, 0),
             self.index(self.rowCount() - 1, 0),
-            [Qt.ItemDataRole.CheckStateRole]
+            _CHECK_STATE_ROLES
         )
 
     def deselect_all(self):
         """모든 선택 해제"""
-        self._selected_rows.clear()
+        self._selected_view.fill(False)
+        self._sorted_selection = None
         self.dataChanged.emit(
             self.index(0, 0),
             self.index(self.rowCount() - 1, 0),
-            [Qt.ItemDataRole.CheckStateRole]
+            _CHECK_STATE_ROLES
         )
 
     def toggle_row(self, row: int):
         """행 선택 토글"""
-        if row in self._selected_rows:
-            self._selected_rows.discard(row)
-        else:
-            self._selected_rows.add(row)
+        selected = not self._selected[row]
+        self._selected[row] = selected
+        self._update_sorted_selection(row, selected)
         index = self.index(row, 0)
-        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.dataChanged.emit(index, index, _CHECK_STATE_ROLES)
+
+    def set_rows_checked(self, rows: Iterable[int], checked: bool):
+        """여러 행의 선택 상태를 한 번에 변경
+
+        행마다 setData/toggle_row를 호출하면 행 수만큼 dataChanged가 발생하므로,
+        선택 상태를 한 번에 갱신하고 변경 범위에 대해 한 번만 알립니다.
+
+        Args:
+            rows: 행 인덱스 목록 (범위를 벗어난 행은 무시)
+            checked: True면 선택, False면 선택 해제
+        """
+        rows = [row for row in rows if 0 <= row < self._nrows]
+        if not rows:
+            return
+
+        self._selected_view[rows] = checked
+        self._sorted_selection = None
+        self.dataChanged.emit(
+            self.index(min(rows), 0),
+            self.index(max(rows), 0),
+            _CHECK_STATE_ROLES
+        )
 
     def set_preview_row(self, row: int):
         """미리보기 행 설정"""
         old_row = self._preview_row
+        if row == old_row:
+            return
         self._preview_row = row
         # 이전 행과 새 행 업데이트
+        self._emit_row_background_changed(old_row)
+        self._emit_row_background_changed(row)
+
+    def set_visible_columns(self, first: int, last: int):
+        """뷰에 보이는 컬럼 범위 설정 (행 배경 변경 알림 범위를 줄이는 데 사용)"""
+        self._visible_columns = (first, last)
+
+    def _emit_row_background_changed(self, row: int):
+        """행 배경 변경 알림 (보이는 컬럼 범위가 알려져 있으면 그 범위만)
+
+        배경은 ImageDelegate가 그리므로 데이터는 바뀌지 않지만, 뷰가 해당 셀을 다시 그리도록 알립니다.
+        """
+        if not 0 <= row < self._nrows:
+            return
+        last_column = self.columnCount() - 1
+        first, last = self._visible_columns or (0, last_column)
+        last = min(last, last_column)
+        if first > last:
+            return
         self.dataChanged.emit(
-            self.index(old_row, 0),
-            self.index(old_row, self.columnCount() - 1),
-            [Qt.ItemDataRole.BackgroundRole]
-        )
-        self.dataChanged.emit(
-            self.index(row, 0),
-            self.index(row, self.columnCount() - 1),
-            [Qt.ItemDataRole.BackgroundRole]
+            self.index(row, first),
+            self.index(row, last),
+            _BACKGROUND_ROLES
         )
 
     def get_preview_row(self) -> int:
@@ -319,6 +535,7 @@ class ExcelViewer(QWidget):
     preview_row_changed = pyqtSignal(int)  # 미리보기 행 변경
     selection_changed = pyqtSignal(list)   # 선택 변경 (행 인덱스 리스트)
     file_loaded = pyqtSignal(str, int)     # 파일 로드 완료 (파일명, 행 수)
+    load_failed = pyqtSignal(str, str)     # 파일 로드 실패 (파일 경로, 오류 메시지)
 
     # 버튼 색상 정의 (스켈레톤 분석기와 동일)
     BUTTON_COLORS = {
@@ -332,11 +549,14 @@ class ExcelViewer(QWidget):
         super().__init__(parent)
         self._logger = get_logger("excel_viewer")
         self._loader: Optional[ExcelLoader] = None
+        self._load_task: Optional[_LoadTask] = None  # 진행 중인 백그라운드 로드
         self._setup_ui()
 
-    def _get_button_style(self, color_key: str) -> str:
-        """버튼 스타일 생성 (스켈레톤 분석기와 동일)"""
-        colors = self.BUTTON_COLORS.get(color_key, self.BUTTON_COLORS['open'])
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_button_style(cls, color_key: str) -> str:
+        """버튼 스타일 생성 (스켈레톤 분석기와 동일, 색상 키별로 한 번만 생성)"""
+        colors = cls.BUTTON_COLORS.get(color_key, cls.BUTTON_COLORS['open'])
         base, dark, light = colors
 
         return f"""
@@ -374,9 +594,8 @@ class ExcelViewer(QWidget):
         toolbar.setContentsMargins(10, 8, 10, 8)  # 메인 툴바와 동일한 여백
 
         # 엑셀 파일 열기 버튼
-        icon_path = Path(__file__).parent.parent / "resources" / "icons"
         self._open_button = QPushButton(" 엑셀 파일 열기")
-        self._open_button.setIcon(QIcon(str(icon_path / "excel.svg")))
+        self._open_button.setIcon(_icon("excel.svg"))
         self._open_button.setIconSize(QSize(14, 14))
         self._open_button.setFixedHeight(28)
         self._open_button.setStyleSheet(self._get_button_style('open'))
@@ -387,8 +606,7 @@ class ExcelViewer(QWidget):
 
         # 전체 선택 / 해제 버튼
         self._select_all_button = QPushButton(" 전체 선택")
-        icon_path = Path(__file__).parent.parent / "resources" / "icons"
-        self._select_all_button.setIcon(QIcon(str(icon_path / "select_all.svg")))
+        self._select_all_button.setIcon(_icon("select_all.svg"))
         self._select_all_button.setIconSize(QSize(14, 14))
         self._select_all_button.setFixedHeight(28)
         self._select_all_button.setStyleSheet(self._get_button_style('select'))
@@ -397,7 +615,7 @@ class ExcelViewer(QWidget):
         toolbar.addWidget(self._select_all_button)
 
         self._deselect_all_button = QPushButton(" 선택 해제")
-        self._deselect_all_button.setIcon(QIcon(str(icon_path / "deselect.svg")))
+        self._deselect_all_button.setIcon(_icon("deselect.svg"))
         self._deselect_all_button.setIconSize(QSize(14, 14))
         self._deselect_all_button.setFixedHeight(28)
         self._deselect_all_button.setStyleSheet(self._get_button_style('deselect'))
@@ -441,7 +659,7 @@ class ExcelViewer(QWidget):
         self._table_view = QTableView()
         self._model = ExcelTableModel(self)
         self._table_view.setModel(self._model)
-        self._table_view.setItemDelegate(ImageDelegate(self))  # 이미지 가운데 정렬
+        self._table_view.setItemDelegate(ImageDelegate(self._model, self))  # 이미지 가운데 정렬 + 미리보기 행 배경
         self._table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self._table_view.setAlternatingRowColors(True)
         self._table_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
@@ -491,6 +709,13 @@ class ExcelViewer(QWidget):
         # 모델 데이터 변경 시 선택 상태 업데이트
         self._model.dataChanged.connect(self._on_model_data_changed)
 
+        # 보이는 컬럼 범위 추적 (스크롤/컬럼 크기 변경/뷰 크기 변경 시)
+        header = self._table_view.horizontalHeader()
+        self._table_view.horizontalScrollBar().valueChanged.connect(self._update_visible_columns)
+        header.sectionResized.connect(self._update_visible_columns)
+        header.geometriesChanged.connect(self._update_visible_columns)
+        self._model.modelReset.connect(self._update_visible_columns)
+
         layout.addWidget(self._table_view)
 
         # 하단 상태바
@@ -514,7 +739,11 @@ class ExcelViewer(QWidget):
             self.load_file(Path(file_path))
 
     def load_file(self, file_path: Path):
-        """파일 로드"""
+        """파일 로드 (백그라운드 스레드에서 읽고, 완료되면 file_loaded 또는 load_failed 발생)
+
+        로드 중에도 이벤트 루프가 계속 돌도록 ExcelLoader.load는 QThreadPool 작업자에서 실행합니다.
+        완료 전까지는 이전 파일의 데이터가 그대로 유지됩니다.
+        """
         # 프로그레스 다이얼로그 표시 (5단계)
         progress = QProgressDialog("준비 중...", None, 0, 5, self)
         progress.setWindowTitle("파일 로드")
@@ -523,45 +752,82 @@ class ExcelViewer(QWidget):
         progress.setMinimumSize(400, 100)
         progress.setValue(0)
         progress.show()
-        QApplication.processEvents()
-
-        def on_progress(step: int, message: str):
-            progress.setValue(step)
-            progress.setLabelText(message)
-            QApplication.processEvents()
 
-        try:
-            self._loader = ExcelLoader()
-            self._loader.load(file_path, progress_callback=on_progress)
-
-            headers = self._loader.get_headers()
-            data = self._loader.get_all_rows()
-            data_by_index = self._loader.get_all_rows_by_index()
-
-            self._model.load_data(headers, data, data_by_index)
-
-            # UI 업데이트
-            self._select_all_button.setEnabled(True)
-            self._deselect_all_button.setEnabled(True)
-            self._preview_row_spinbox.setEnabled(True)
-            self._preview_row_spinbox.setMaximum(len(data))
-            self._preview_row_spinbox.setValue(1)
-            self._row_count_label.setText(f"/ {len(data)}")
-            self._update_selection_count()
-
-            # 첫 번째 컬럼(체크박스) 너비 조정
-            self._table_view.setColumnWidth(0, 50)
-
-            # 이미지가 있으면 행 높이 및 이미지 컬럼 너비 조절
-            if self._loader.images_dir.exists():
-                self._table_view.verticalHeader().setDefaultSectionSize(50)
-                # 이미지 컬럼 너비 조절 (Frame=1, Skeleton=2)
-                self._table_view.setColumnWidth(1, 60)  # Frame
-                self._table_view.setColumnWidth(2, 60)  # Skeleton
+        task = _LoadTask(Path(file_path))
+        task.signals.progress.connect(progress.setValue)
+        task.signals.progress.connect(lambda step, message: progress.setLabelText(message))
+        task.signals.finished.connect(lambda loader: self._on_load_finished(task, progress, loader))
+        task.signals.failed.connect(lambda message: self._on_load_failed(task, progress, message))
+
+        # 로드가 끝날 때까지 다른 파일을 열지 않도록 버튼 비활성화
+        self._open_button.setEnabled(False)
+        self._load_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def is_loading(self) -> bool:
+        """파일 로드 진행 중 여부"""
+        return self._load_task is not None
+
+    def _finish_load_task(self, task: "_LoadTask", progress: QProgressDialog) -> bool:
+        """로드 작업 종료 처리 (가장 최근 작업이면 True)"""
+        progress.close()
+        if task is not self._load_task:
+            return False  # 이후에 시작된 로드가 있으면 이전 결과는 버림
+        self._load_task = None
+        self._open_button.setEnabled(True)
+        return True
+
+    def _on_load_failed(self, task: "_LoadTask", progress: QProgressDialog, message: str):
+        """백그라운드 로드 실패"""
+        if not self._finish_load_task(task, progress):
+            return
+        self._logger.error(f"파일 로드 실패: {task.file_path}, 오류: {message}")
+        self.load_failed.emit(str(task.file_path), message)
 
-            self.file_loaded.emit(file_path.name, len(data))
-        finally:
-            progress.close()
+    def _on_load_finished(self, task: "_LoadTask", progress: QProgressDialog, loader: ExcelLoader):
+        """백그라운드 로드 완료 - 모델과 UI 갱신 (GUI 스레드)"""
+        if not self._finish_load_task(task, progress):
+            return
+        self._loader = loader
+
+        headers = self._loader.get_headers()
+        row_count = self._loader.row_count
+        # 행 데이터를 만들지 않고 로더의 컬럼 데이터를 그대로 넘김 (표시 문자열은 모델이 페이지 단위로 생성)
+        columns = [self._loader.get_column(i) for i in range(len(headers))]
+
+        self._model.load_data(headers, columns, row_count)
+
+        # UI 업데이트
+        self._select_all_button.setEnabled(True)
+        self._deselect_all_button.setEnabled(True)
+        self._preview_row_spinbox.setEnabled(True)
+        self._preview_row_spinbox.setMaximum(row_count)
+        self._preview_row_spinbox.setValue(1)
+        self._row_count_label.setText(f"/ {row_count}")
+        self._update_selection_count()
+
+        # 첫 번째 컬럼(체크박스) 너비 조정
+        self._table_view.setColumnWidth(0, 50)
+
+        # 이미지가 있으면 행 높이 및 이미지 컬럼 너비 조절
+        if self._loader.images_dir.exists():
+            self._table_view.verticalHeader().setDefaultSectionSize(50)
+            # 이미지 컬럼 너비 조절 (Frame=1, Skeleton=2)
+            self._table_view.setColumnWidth(1, 60)  # Frame
+            self._table_view.setColumnWidth(2, 60)  # Skeleton
+
+        self.file_loaded.emit(task.file_path.name, row_count)
+
+    def _update_visible_columns(self, *args):
+        """모델에 현재 뷰포트에 보이는 컬럼 범위 전달"""
+        header = self._table_view.horizontalHeader()
+        first = header.logicalIndexAt(0)
+        if first < 0:
+            return
+        last = header.logicalIndexAt(self._table_view.viewport().width() - 1)
+        if last < 0:
+            last = self._model.columnCount() - 1  # 마지막 컬럼 오른쪽이 비어 있음
+        self._model.set_visible_columns(first, last)
 
     def _on_preview_row_changed(self, value: int):
         """미리보기 행 스핀박스 변경"""
@@ -598,13 +864,13 @@ class ExcelViewer(QWidget):
     def _on_model_data_changed(self, topLeft, bottomRight, roles):
         """모델 데이터 변경"""
         if Qt.ItemDataRole.CheckStateRole in roles:
-            self._logger.debug(f"선택 변경: {len(self._model._selected_rows)}행 선택됨")
+            self._logger.debug(f"선택 변경: {self._model.selected_count()}행 선택됨")
             self._update_selection_count()
             self.selection_changed.emit(self.get_selected_rows())
 
     def _update_selection_count(self):
         """선택 행 수 업데이트"""
-        count = len(self._model.get_selected_rows())
+        count = self._model.selected_count()
         self._selection_count_label.setText(f"선택됨: {count}행")
 
     def select_all(self):
@@ -619,6 +885,10 @@ class ExcelViewer(QWidget):
         """행 선택 토글"""
         self._model.toggle_row(row)
 
+    def set_rows_selection(self, rows: Iterable[int], selected: bool):
+        """여러 행 선택 상태 일괄 변경 (selection_changed는 1회만 발생)"""
+        self._model.set_rows_checked(rows, selected)
+
     def get_selected_rows(self) -> List[int]:
         """선택된 행 인덱스 목록"""
         return self._model.get_selected_rows()
@@ -636,6 +906,13 @@ class ExcelViewer(QWidget):
         """전체 행 수"""
         return self._model.rowCount()
 
+    @property
+    def file_path(self) -> Optional[Path]:
+        """로드된 파일 경로"""
+        if self._loader:
+            return self._loader.file_path
+        return None
+
     def get_row_data(self, row: int) -> Optional[Dict[str, Any]]:
         """특정 행 데이터 반환"""
         if self._loader:
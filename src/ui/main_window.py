@@ -262,6 +262,7 @@ class MainWindow(QMainWindow):
 
         self._excel_viewer = ExcelViewer()
         self._excel_viewer.file_loaded.connect(self._on_file_loaded)
+        self._excel_viewer.load_failed.connect(self._on_file_load_failed)
         self._excel_viewer.preview_row_changed.connect(self._on_preview_row_changed)
         self._excel_viewer.selection_changed.connect(self._on_selection_changed)
         excel_layout.addWidget(self._excel_viewer)
@@ -614,19 +615,20 @@ class MainWindow(QMainWindow):
             self._load_file(Path(file_path))
 
     def _load_file(self, file_path: Path):
-        """파일 로드"""
+        """파일 로드 (백그라운드에서 진행, 결과는 _on_file_loaded/_on_file_load_failed에서 처리)"""
         self._logger.info(f"파일 로드 시작: {file_path}")
-        try:
-            self._excel_viewer.load_file(file_path)
-            self._current_file = file_path
-            self._logger.info(f"파일 로드 완료: {file_path}")
-            self.setWindowTitle(f"Document Creator - {file_path.name}")
-        except Exception as e:
-            self._logger.error(f"파일 로드 실패: {file_path}, 오류: {e}")
-            QMessageBox.critical(self, "오류", f"파일을 열 수 없습니다:\n{e}")
+        self._excel_viewer.load_file(file_path)
+
+    def _on_file_load_failed(self, file_path: str, message: str):
+        """파일 로드 실패"""
+        self._logger.error(f"파일 로드 실패: {file_path}, 오류: {message}")
+        QMessageBox.critical(self, "오류", f"파일을 열 수 없습니다:\n{message}")
 
     def _on_file_loaded(self, filename: str, row_count: int):
         """파일 로드 완료"""
+        self._current_file = self._excel_viewer.file_path
+        self._logger.info(f"파일 로드 완료: {self._current_file}")
+        self.setWindowTitle(f"Document Creator - {filename}")
         self.statusBar().showMessage(f"파일 로드됨: {filename} ({row_count}행)")
 
         # 엑셀 파일 경고 숨김
@@ -175,3 +175,153 @@ class TestDocumentGenerator:
 
         # 취소되어 1개만 생성
         assert len(files) <= 2
+
+    def test_error_stops_remaining_tasks(self, document_generator, tmp_path, monkeypatch):
+        """작업 중 에러가 나면 남은 작업을 제출하지 않고 에러 전파"""
+        from src.core.document_generator import DocumentGenerator
+
+        rows = [{"Frame": i, "Score": i} for i in range(1, 201)]
+        written = []
+
+        def failing_write(template, mapped_data, output_path):
+            written.append(output_path)
+            raise OSError("disk full")
+
+        monkeypatch.setattr(document_generator, "_render_and_write", failing_write)
+
+        with pytest.raises(OSError, match="disk full"):
+            document_generator.batch_generate_html(
+                template_name="Test",
+                rows_data=rows,
+                output_dir=tmp_path / "output",
+            )
+
+        assert len(written) <= DocumentGenerator.TASK_PREFETCH + 1
+
+    def test_shared_output_path_written_sequentially(self, document_generator, tmp_path, monkeypatch):
+        """행과 무관한 파일명 패턴이면 같은 파일을 동시에 쓰지 않고 마지막 행이 남음"""
+        import threading
+        import time
+
+        rows = [{"Frame": i, "Score": i} for i in range(1, 21)]
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+        original_write = document_generator._render_and_write
+
+        def tracking_write(template, mapped_data, output_path):
+            with lock:
+                active.append(output_path)
+                overlaps.append(len(active))
+            time.sleep(0.002)
+            try:
+                return original_write(template, mapped_data, output_path)
+            finally:
+                with lock:
+                    active.remove(output_path)
+
+        monkeypatch.setattr(document_generator, "_render_and_write", tracking_write)
+
+        files = document_generator.batch_generate_html(
+            template_name="Test",
+            rows_data=rows,
+            output_dir=tmp_path / "output",
+            filename_pattern="{template}.html",
+        )
+
+        assert len(files) == len(rows)
+        assert max(overlaps) == 1
+        assert "Frame: 20" in files[-1].read_text()
+
+    def test_template_compiled_once_until_modified(self, document_generator, sample_rows, test_template_dir, tmp_path, monkeypatch):
+        """템플릿은 파일이 변경될 때만 다시 컴파일"""
+        import os
+        from src.core import document_generator as module
+
+        compile_count = [0]
+        original_from_string = module._JINJA_ENV.from_string
+
+        def counting_from_string(source):
+            compile_count[0] += 1
+            return original_from_string(source)
+
+        monkeypatch.setattr(module._JINJA_ENV, "from_string", counting_from_string)
+
+        document_generator.batch_generate_html(
+            template_name="Test",
+            rows_data=sample_rows,
+            output_dir=tmp_path / "output",
+        )
+        document_generator.batch_generate_html(
+            template_name="Test",
+            rows_data=sample_rows,
+            output_dir=tmp_path / "output",
+        )
+
+        assert compile_count[0] == 1
+
+        # 템플릿 수정 시 새 내용으로 다시 컴파일
+        template_path = test_template_dir / "test" / "test.html"
+        template_path.write_text("<p>Updated {{ frame }}</p>")
+        stat = template_path.stat()
+        os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        output_path = tmp_path / "updated.html"
+        document_generator.generate_html(
+            template_name="Test",
+            row_data=sample_rows[0],
+            output_path=output_path,
+        )
+
+        assert compile_count[0] == 2
+        assert output_path.read_text() == "<p>Updated 1</p>"
+
+    def test_mapper_created_once_per_template(self, document_generator, sample_rows, tmp_path, monkeypatch):
+        """일괄 생성 시 매퍼는 템플릿당 1회만 생성"""
+        from src.core import document_generator as module
+
+        created = []
+        original_mapper = module.Mapper
+
+        def counting_mapper(*args, **kwargs):
+            created.append(args)
+            return original_mapper(*args, **kwargs)
+
+        monkeypatch.setattr(module, "Mapper", counting_mapper)
+
+        files = document_generator.batch_generate_html(
+            template_name="Test",
+            rows_data=sample_rows,
+            output_dir=tmp_path / "output",
+            excel_headers=["Frame", "Score", "Time"],
+        )
+
+        assert len(files) == len(sample_rows)
+        assert len(created) == 1
+        assert "Frame: 3" in files[2].read_text()
+
+    def test_output_structure_by_row(self, document_generator, sample_rows, tmp_path):
+        """행별 폴더 구조"""
+        files = document_generator.batch_generate_all(
+            template_names=["Test"],
+            rows_data=sample_rows,
+            output_dir=tmp_path / "output",
+            structure="by_row"
+        )
+
+        assert [f.parent.name for f in files] == ["row_001", "row_002", "row_003"]
+        assert all(f.exists() for f in files)
+
+    def test_invalid_filename_pattern_raises_error(self, document_generator, sample_rows, tmp_path):
+        """알 수 없는 필드를 쓴 파일명 패턴은 생성 전에 에러"""
+        from src.core.document_generator import DocumentGeneratorError
+
+        with pytest.raises(DocumentGeneratorError):
+            document_generator.batch_generate_html(
+                template_name="Test",
+                rows_data=sample_rows,
+                output_dir=tmp_path / "output",
+                filename_pattern="{template}_{unknown}.html"
+            )
+
+        assert not list((tmp_path / "output").glob("*.html"))
@@ -158,3 +158,201 @@ class TestExcelLoader:
         loader.load(sample_xlsx)
 
         assert loader.file_path == sample_xlsx
+
+    def test_formula_results_reused_for_unchanged_file(self, sample_xlsx, tmp_path, monkeypatch):
+        """변경되지 않은 파일은 수식 계산 결과 재사용"""
+        from src.core import excel_loader
+        from src.core.excel_loader import ExcelLoader
+
+        first = ExcelLoader(base_dir=tmp_path)
+        first.load(sample_xlsx)
+
+        def fail_loads(*args, **kwargs):
+            raise AssertionError("수식 재계산이 발생하면 안 됨")
+
+        monkeypatch.setattr(excel_loader.formulas, "ExcelModel", fail_loads)
+
+        second = ExcelLoader(base_dir=tmp_path)
+        second.load(sample_xlsx)
+
+        assert second.get_all_rows_by_index() == first.get_all_rows_by_index()
+
+    def test_compute_formulas_disabled_skips_formula_engine(self, sample_xlsx, tmp_path, monkeypatch):
+        """compute_formulas=False면 수식 계산 생략"""
+        from src.core.excel_loader import ExcelLoader
+
+        def fail_calculate(*args, **kwargs):
+            raise AssertionError("수식 계산이 실행되면 안 됨")
+
+        monkeypatch.setattr(ExcelLoader, "_calculate_formulas", fail_calculate)
+
+        loader = ExcelLoader(base_dir=tmp_path, compute_formulas=False)
+        loader.load(sample_xlsx)
+
+        assert loader.row_count > 0
+        assert "Frame" in loader.get_headers()
+
+    def test_cached_formula_values_skip_formula_engine(self, tmp_path, monkeypatch):
+        """엑셀에 저장된 수식 결과가 있으면 수식 계산 생략"""
+        import zipfile
+
+        import openpyxl
+        from src.core.excel_loader import ExcelLoader
+
+        # 저장된 결과(<v>4</v>)가 있는 수식 셀을 가진 파일 생성
+        source = tmp_path / "source.xlsx"
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Capture Data"
+        sheet.append(["Value", "Double"])
+        sheet.append([2, "=A2*2"])
+        workbook.save(source)
+
+        cached = tmp_path / "cached.xlsx"
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(cached, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = data.replace(b"<f>A2*2</f><v />", b"<f>A2*2</f><v>4</v>")
+                dst.writestr(item, data)
+
+        def fail_calculate(*args, **kwargs):
+            raise AssertionError("수식 계산이 실행되면 안 됨")
+
+        monkeypatch.setattr(ExcelLoader, "_calculate_formulas", fail_calculate)
+
+        loader = ExcelLoader(base_dir=tmp_path)
+        loader.load(cached)
+
+        assert loader.get_row(0) == {"Value": 2, "Double": 4}
+
+    def test_cell_images_extracted(self, sample_xlsx, tmp_path):
+        """셀에 배치된 이미지와 썸네일 추출"""
+        from src.core.excel_loader import ExcelLoader
+
+        loader = ExcelLoader(base_dir=tmp_path)
+        loader.load(sample_xlsx)
+
+        image_path = loader.get_image_path(0, 0)
+        thumbnail_path = loader.get_thumbnail_path(0, 1)
+
+        assert image_path is not None and image_path.exists()
+        assert thumbnail_path is not None and thumbnail_path.exists()
+        assert len(loader.thumbnail_map) == 4
+
+    def test_image_process_pool_uses_spawn(self, sample_xlsx, tmp_path, monkeypatch):
+        """이미지 프로세스 풀은 spawn 방식으로 시작 (스레드에서 fork 금지)"""
+        from concurrent.futures import ThreadPoolExecutor
+        from src.core import excel_loader
+        from src.core.excel_loader import ExcelLoader
+
+        start_methods = []
+
+        def recording_pool(max_workers=None, mp_context=None):
+            start_methods.append(mp_context.get_start_method())
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        monkeypatch.setattr(excel_loader, "ProcessPoolExecutor", recording_pool)
+        monkeypatch.setattr(ExcelLoader, "PROCESS_POOL_MIN_IMAGES", 1)
+        loader = ExcelLoader(base_dir=tmp_path)
+        loader.load(sample_xlsx)
+
+        assert start_methods == ["spawn"]
+        assert len(loader.thumbnail_map) == 4
+
+    def test_get_column_matches_rows(self, sample_xlsx, tmp_path):
+        """컬럼 조회 결과가 행 데이터와 일치"""
+        from src.core.excel_loader import ExcelLoader, ExcelLoaderError
+
+        loader = ExcelLoader(base_dir=tmp_path)
+        loader.load(sample_xlsx)
+
+        frame_index = loader.get_headers().index("Frame")
+        column = loader.get_column(frame_index)
+
+        assert len(column) == loader.row_count
+        assert column == [row[frame_index] for row in loader.get_all_rows_by_index()]
+
+        with pytest.raises(ExcelLoaderError):
+            loader.get_column(len(loader.get_headers()))
+
+    def test_trailing_empty_rows_skipped(self, tmp_path):
+        """시트 끝의 빈 행은 제외하고 중간 빈 행은 유지"""
+        import openpyxl
+        from openpyxl.styles import Font
+        from src.core.excel_loader import ExcelLoader
+
+        source = tmp_path / "trailing.xlsx"
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Capture Data"
+        sheet.append(["Frame", "Score"])
+        sheet.append([1, 5])
+        sheet.append([None, None])
+        sheet.append([3, 4])
+        # 서식만 있는 빈 행
+        for row in range(6, 9):
+            sheet.cell(row=row, column=1).font = Font(bold=True)
+        workbook.save(source)
+
+        loader = ExcelLoader(base_dir=tmp_path)
+        loader.load(source)
+
+        assert loader.get_all_rows_by_index() == [(1, 5), (None, None), (3, 4)]
+
+    def test_misdeclared_dimension_reads_all_rows(self, tmp_path):
+        """크기 정보가 A1:A1로 잘못 기록되어도 전체 데이터 로드"""
+        import zipfile
+
+        import openpyxl
+        from src.core.excel_loader import ExcelLoader
+
+        source = tmp_path / "source.xlsx"
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Capture Data"
+        sheet.append(["Frame", "Score"])
+        sheet.append([1, 5])
+        sheet.append([2, 6])
+        workbook.save(source)
+
+        broken = tmp_path / "broken.xlsx"
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(broken, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = data.replace(b'<dimension ref="A1:B3"', b'<dimension ref="A1:A1"')
+                dst.writestr(item, data)
+
+        loader = ExcelLoader(base_dir=tmp_path, compute_formulas=False)
+        loader.load(broken)
+
+        assert loader.get_headers() == ["Frame", "Score"]
+        assert loader.get_all_rows_by_index() == [(1, 5), (2, 6)]
+
+    def test_date_cells_match_openpyxl_path(self, tmp_path, monkeypatch):
+        """날짜 셀은 calamine 경로와 openpyxl 경로 모두 datetime으로 로드"""
+        from datetime import date, datetime
+
+        import openpyxl
+        from src.core import excel_loader
+        from src.core.excel_loader import ExcelLoader
+
+        source = tmp_path / "dates.xlsx"
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Capture Data"
+        sheet.append(["Day", "Stamp"])
+        sheet.append([date(2024, 3, 5), datetime(2024, 3, 5, 14, 30)])
+        sheet["A2"].number_format = "yyyy-mm-dd"
+        workbook.save(source)
+
+        rows = []
+        for has_calamine in (excel_loader.HAS_CALAMINE, False):
+            monkeypatch.setattr(excel_loader, "HAS_CALAMINE", has_calamine)
+            loader = ExcelLoader(base_dir=tmp_path / str(has_calamine), compute_formulas=False)
+            loader.load(source)
+            rows.append(loader.get_all_rows_by_index())
+
+        assert rows[0] == rows[1] == [(datetime(2024, 3, 5), datetime(2024, 3, 5, 14, 30))]
+        assert all(type(value) is datetime for value in rows[0][0])
@@ -25,12 +25,14 @@ def excel_viewer(qapp):
 
 
 @pytest.fixture
-def excel_viewer_with_data(qapp, sample_xlsx):
+def excel_viewer_with_data(qapp, qtbot, sample_xlsx):
     """데이터가 로드된 ExcelViewer"""
     from src.ui.excel_viewer import ExcelViewer
 
     viewer = ExcelViewer()
-    viewer.load_file(sample_xlsx)
+    # 로드는 백그라운드에서 진행되므로 완료 시그널까지 대기
+    with qtbot.waitSignal(viewer.file_loaded, timeout=10000):
+        viewer.load_file(sample_xlsx)
     yield viewer
     viewer.close()
 
@@ -193,3 +195,191 @@ class TestExcelViewer:
         model.setData(index, Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
         state = model.data(index, Qt.ItemDataRole.CheckStateRole)
         assert state == Qt.CheckState.Unchecked
+
+    def test_display_values_match_loader(self, excel_viewer_with_data):
+        """표시 문자열이 로더의 인덱스 기반 값과 일치"""
+        model = excel_viewer_with_data._model
+        row_values = excel_viewer_with_data.get_row_data_by_index(0)
+
+        for col_index, value in enumerate(row_values):
+            text = model.data(model.index(0, col_index + 1), Qt.ItemDataRole.DisplayRole)
+            if model.data(model.index(0, col_index + 1), Qt.ItemDataRole.UserRole) is not None:
+                assert text is None  # 이미지 셀은 텍스트 없음
+            else:
+                assert text == ("" if value is None else str(value))
+
+    def test_load_file_runs_in_background(self, excel_viewer, sample_xlsx, qtbot):
+        """로드 중에는 열기 버튼이 비활성화되고 완료 후 복구"""
+        with qtbot.waitSignal(excel_viewer.file_loaded, timeout=10000):
+            excel_viewer.load_file(sample_xlsx)
+            assert excel_viewer.is_loading()
+            assert not excel_viewer._open_button.isEnabled()
+
+        assert not excel_viewer.is_loading()
+        assert excel_viewer._open_button.isEnabled()
+        assert excel_viewer.file_path == sample_xlsx
+
+    def test_load_failed_signal(self, excel_viewer, tmp_path, qtbot):
+        """잘못된 파일 로드 시 load_failed 시그널"""
+        with qtbot.waitSignal(excel_viewer.load_failed, timeout=10000) as blocker:
+            excel_viewer.load_file(tmp_path / "missing.xlsx")
+
+        assert blocker.args[0] == str(tmp_path / "missing.xlsx")
+        assert excel_viewer.row_count == 0
+        assert excel_viewer._open_button.isEnabled()
+
+
+class TestExcelTableModel:
+    """ExcelTableModel 테스트"""
+
+    def test_pages_built_on_demand_and_evicted(self, qapp):
+        """표시 문자열은 요청된 페이지만 만들고 최대 페이지 수를 유지"""
+        from src.ui.excel_viewer import ExcelTableModel
+
+        model = ExcelTableModel()
+        row_count = ExcelTableModel.PAGE_SIZE * (ExcelTableModel.MAX_PAGES + 4)
+        model.load_data(["A", "B"], [list(range(row_count)), [None] * row_count], row_count)
+
+        assert model.rowCount() == row_count
+        assert len(model._pages) == 0
+
+        assert model.data(model.index(row_count - 1, 1)) == str(row_count - 1)
+        assert model.data(model.index(0, 2)) == ""
+        assert len(model._pages) == 2
+
+        for row in range(0, row_count, ExcelTableModel.PAGE_SIZE):
+            assert model.data(model.index(row, 1)) == str(row)
+        assert len(model._pages) == ExcelTableModel.MAX_PAGES
+
+    def test_set_rows_checked_emits_once(self, qapp):
+        """여러 행 선택 변경 시 dataChanged 1회만 발생"""
+        from src.ui.excel_viewer import ExcelTableModel
+
+        model = ExcelTableModel()
+        model.load_data(["A"], [list(range(10))], 10)
+        emitted = []
+        model.dataChanged.connect(lambda top, bottom, roles: emitted.append((top.row(), bottom.row())))
+
+        model.set_rows_checked([7, 2, 5, 99], True)
+        assert emitted == [(2, 7)]
+        assert model.get_selected_rows() == [2, 5, 7]
+        assert model.selected_count() == 3
+
+        model.set_rows_checked([5], False)
+        assert model.get_selected_rows() == [2, 7]
+        assert len(emitted) == 2
+
+    def test_columns_stringified_on_first_access(self, qapp):
+        """페이지 안에서도 요청된 컬럼만 문자열로 변환"""
+        from src.ui.excel_viewer import ExcelTableModel
+
+        model = ExcelTableModel()
+        model.load_data(["A", "B", "C"], [[1, 2], [3.5, None], ["x", "y"]], 2)
+
+        assert model.data(model.index(1, 2)) == ""
+        texts, _ = model._pages[0]
+        assert texts[0] is None and texts[2] is None
+        assert texts[1] == ["3.5", ""]
+
+        assert model.data(model.index(0, 3)) == "x"
+        assert texts[2] == ["x", "y"]
+
+    def test_toggle_keeps_sorted_selection(self, qapp):
+        """행 토글 시 정렬 캐시를 다시 만들지 않고 갱신"""
+        from src.ui.excel_viewer import ExcelTableModel
+
+        model = ExcelTableModel()
+        model.load_data(["A"], [list(range(10))], 10)
+        model.set_rows_checked([8, 1], True)
+        assert model.get_selected_rows() == [1, 8]
+        cache = model._sorted_selection
+
+        model.toggle_row(4)
+        model.setData(model.index(1, 0), Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
+        model.setData(model.index(8, 0), Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+        assert model._sorted_selection is cache
+        assert model.get_selected_rows() == [4, 8]
+
+    def test_preview_row_change_limited_to_visible_columns(self, qapp):
+        """미리보기 행 변경 알림은 보이는 컬럼 범위만, 같은 행이면 생략"""
+        from src.ui.excel_viewer import ExcelTableModel
+
+        model = ExcelTableModel()
+        model.load_data([f"H{i}" for i in range(10)], [list(range(5))] * 10, 5)
+        emitted = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles: emitted.append((top.row(), top.column(), bottom.column()))
+        )
+
+        model.set_preview_row(0)
+        assert emitted == []
+
+        model.set_visible_columns(2, 4)
+        model.set_preview_row(3)
+        assert emitted == [(0, 2, 4), (3, 2, 4)]
+
+    def test_preview_row_background_from_delegate(self, qapp):
+        """미리보기 행 배경은 모델이 아닌 delegate가 지정"""
+        from PyQt6.QtWidgets import QStyleOptionViewItem
+        from src.ui.excel_viewer import ExcelTableModel, ImageDelegate
+
+        model = ExcelTableModel()
+        model.load_data(["A"], [list(range(5))], 5)
+        model.set_preview_row(2)
+        delegate = ImageDelegate(model)
+
+        assert model.data(model.index(2, 1), Qt.ItemDataRole.BackgroundRole) is None
+
+        option = QStyleOptionViewItem()
+        delegate.initStyleOption(option, model.index(2, 1))
+        assert option.backgroundBrush == ImageDelegate.PREVIEW_BRUSH
+
+        option = QStyleOptionViewItem()
+        delegate.initStyleOption(option, model.index(1, 1))
+        assert option.backgroundBrush != ImageDelegate.PREVIEW_BRUSH
+
+    def test_selection_bitmap_bulk_operations(self, qapp):
+        """전체 선택/해제와 선택 설정이 행 목록·개수·체크 상태에 반영"""
+        from src.ui.excel_viewer import ExcelTableModel
+
+        model = ExcelTableModel()
+        model.load_data(["A"], [list(range(6))], 6)
+
+        model.select_all()
+        assert model.get_selected_rows() == list(range(6))
+        assert model.selected_count() == 6
+
+        model.set_selected_rows({4, 1, 10})
+        assert model.get_selected_rows() == [1, 4]
+        assert model.data(model.index(4, 0), Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        assert model.data(model.index(2, 0), Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked
+
+        model.deselect_all()
+        assert model.get_selected_rows() == []
+        assert model.selected_count() == 0
+
+    def test_flags(self, qapp):
+        """체크박스 컬럼만 체크 가능, 유효하지 않은 인덱스는 플래그 없음"""
+        from src.ui.excel_viewer import ExcelTableModel
+
+        model = ExcelTableModel()
+        model.load_data(["A"], [[1]], 1)
+        base = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemNeverHasChildren
+
+        assert model.flags(model.index(0, 0)) == base | Qt.ItemFlag.ItemIsUserCheckable
+        assert model.flags(model.index(0, 1)) == base
+        assert model.flags(QModelIndex()) == Qt.ItemFlag.NoItemFlags
+
+    def test_vertical_header_row_labels(self, qapp):
+        """세로 헤더 행 번호는 1부터 시작하고 청크 단위로 재사용"""
+        from src.ui.excel_viewer import ExcelTableModel
+
+        model = ExcelTableModel()
+        row_count = ExcelTableModel.ROW_LABEL_CHUNK + 5
+        model.load_data(["A"], [[None] * row_count], row_count)
+        vertical = Qt.Orientation.Vertical
+
+        assert model.headerData(0, vertical) == "1"
+        assert model.headerData(row_count - 1, vertical) == str(row_count)
+        assert model.headerData(0, vertical) is model.headerData(0, vertical)
+        assert len(model._row_label_chunks) == 2
@@ -106,13 +106,14 @@ class TestIntegration:
 
         window.close()
 
-    def test_excel_viewer_selection_flow(self, qapp, integration_setup):
+    def test_excel_viewer_selection_flow(self, qapp, qtbot, integration_setup):
         """ExcelViewer 선택 흐름"""
         from src.ui.excel_viewer import ExcelViewer
 
         setup = integration_setup
         viewer = ExcelViewer()
-        viewer.load_file(setup["sample_xlsx"])
+        with qtbot.waitSignal(viewer.file_loaded, timeout=10000):
+            viewer.load_file(setup["sample_xlsx"])
 
         # 초기 상태
         assert viewer.row_count > 0
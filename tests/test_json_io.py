@@ -0,0 +1,60 @@
+"""json_io 단위 테스트"""
+
+import importlib.util
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(True, id="orjson", marks=pytest.mark.skipif(
+            importlib.util.find_spec("orjson") is None, reason="orjson 미설치"
+        )),
+        pytest.param(False, id="json"),
+    ]
+)
+def json_io(request, monkeypatch):
+    """orjson/표준 json 경로를 각각 사용하는 json_io 모듈"""
+    from src.core import json_io
+
+    if request.param:
+        import orjson
+        monkeypatch.setattr(json_io, "orjson", orjson)
+    monkeypatch.setattr(json_io, "HAS_ORJSON", request.param)
+    return json_io
+
+
+class TestJsonIo:
+    """json_io 단위 테스트"""
+
+    def test_round_trip_keeps_non_ascii(self, json_io):
+        """비ASCII 문자는 이스케이프하지 않고 그대로 왕복"""
+        data = {"name": "보고서", "fields": [{"id": "frame", "order": 1}], "ratio": 0.5}
+
+        encoded = json_io.dumps(data, indent=True)
+
+        assert "보고서".encode("utf-8") in encoded
+        assert b'\n  "fields"' in encoded
+        assert json_io.loads(encoded) == data
+
+    def test_non_str_keys_stringified(self, json_io):
+        """문자열이 아닌 키는 표준 json처럼 문자열로 변환"""
+        encoded = json_io.dumps({1: "a", 2.5: "b", None: "c", False: "d"})
+
+        assert json_io.loads(encoded) == {"1": "a", "2.5": "b", "null": "c", "false": "d"}
+
+    def test_datetime_value_rejected(self, json_io):
+        """datetime 값은 표준 json처럼 TypeError"""
+        with pytest.raises(TypeError):
+            json_io.dumps({"saved_at": datetime(2024, 3, 5, 14, 30)})
+
+    def test_file_round_trip(self, json_io, tmp_path):
+        """dump_file로 저장한 파일을 load_file로 다시 로드"""
+        path = tmp_path / "mapping.json"
+        data = {"template": "보고서", "mappings": {"frame": "Frame", "score": None}}
+
+        json_io.dump_file(path, data)
+
+        assert json_io.load_file(path) == data
+        assert not path.with_name(path.name + ".tmp").exists()
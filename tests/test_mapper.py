@@ -175,3 +175,166 @@ class TestMapper:
         assert results[0]["upper_arm"] == 3
         assert results[1]["upper_arm"] == 4
         assert results[2]["upper_arm"] == 5
+
+    def test_apply_reflects_mapping_changes(self, template_fields, excel_headers, row_data):
+        """매핑 변경 후 apply 결과에 반영"""
+        from src.core.mapper import Mapper
+
+        mapper = Mapper(template_fields, excel_headers)
+        assert mapper.apply(row_data)["upper_arm"] == 3
+
+        mapper.set_mapping("upper_arm", "Extra Column")
+        assert mapper.apply(row_data)["upper_arm"] == "ignored"
+
+        mapper.reset_to_auto()
+        assert mapper.apply(row_data)["upper_arm"] == 3
+
+        mapper.import_config({"score": "Frame"})
+        assert mapper.apply(row_data)["score"] == 1
+
+        mapper.clear_mapping("score")
+        assert mapper.apply(row_data)["score"] == 5
+
+    def test_apply_batch_columnar_matches_apply(self, template_fields, excel_headers):
+        """컬럼 단위 일괄 매핑 결과가 행 단위 apply와 일치"""
+        from src.core.mapper import Mapper
+
+        rows_by_index = [
+            [1, "00:01.00", 3, 2, 5, "Low", "a"],
+            [2, "00:02.00", 4, 3, 6, "Medium", "b"],
+            [3, "00:03.00", 5],
+        ]
+        rows = [dict(zip(excel_headers, row)) for row in rows_by_index]
+
+        mapper = Mapper(template_fields, excel_headers)
+        mapper.set_mapping("risk", "Extra Column")
+        columns = mapper.apply_batch_columnar(rows_by_index)
+
+        assert columns["upper_arm"] == [3, 4, 5]
+        assert columns["risk"] == ["a", "b", None]
+        for i, row in enumerate(rows):
+            expected = mapper.apply(row)
+            assert {field_id: values[i] for field_id, values in columns.items()} == expected
+            assert mapper.apply_batch(rows)[i] == expected
+
+    def test_repeated_image_encoded_once(self, excel_headers, tmp_path, monkeypatch):
+        """여러 행이 같은 이미지를 참조하면 1회만 인코딩하고, 파일이 바뀌면 다시 인코딩"""
+        import os
+        from src.core.mapper import Mapper
+
+        image_path = tmp_path / "photo.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\nfirst")
+
+        fields = [{"id": "photo", "label": "Photo", "excel_column": "Frame", "type": "image"}]
+        mapper = Mapper(fields, excel_headers)
+
+        encoded = []
+        original = mapper._convert_image_to_data_url
+
+        def counting_convert(path):
+            encoded.append(path)
+            return original(path)
+
+        monkeypatch.setattr(mapper, "_convert_image_to_data_url", counting_convert)
+
+        results = mapper.apply_batch([{"Frame": image_path}, {"Frame": str(image_path)}])
+
+        assert len(encoded) == 1
+        assert results[0]["photo"] == results[1]["photo"]
+        assert results[0]["photo"].startswith('<img src="data:image/png;base64,')
+
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\nsecond!")
+        stat = image_path.stat()
+        os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert mapper.apply({"Frame": image_path})["photo"] != results[0]["photo"]
+        assert len(encoded) == 2
+
+    def test_shared_image_cache_encodes_once_across_templates(self, excel_headers, tmp_path, monkeypatch):
+        """이미지 캐시를 공유하는 매퍼들은 같은 이미지를 템플릿이 달라도 1회만 인코딩"""
+        from src.core import mapper as mapper_module
+        from src.core.mapper import Mapper
+
+        image_path = tmp_path / "photo.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\nshared")
+
+        encoded = []
+        original = mapper_module.encode_image_data_url
+
+        def counting_encode(path):
+            encoded.append(path)
+            return original(path)
+
+        monkeypatch.setattr(mapper_module, "encode_image_data_url", counting_encode)
+
+        shared_cache = {}
+        report = Mapper(
+            [{"id": "photo", "label": "Photo", "excel_column": "Frame", "type": "image"}],
+            excel_headers,
+            image_tag_cache=shared_cache,
+        )
+        summary = Mapper(
+            [
+                {"id": "thumb", "label": "Thumb", "excel_column": "Frame", "type": "image"},
+                {"id": "task", "label": "Task", "excel_column": "Task", "type": "text"},
+            ],
+            excel_headers,
+            image_tag_cache=shared_cache,
+        )
+        row = {"Frame": image_path, "Task": "Lift"}
+
+        tag = report.apply(row)["photo"]
+        assert summary.apply(row)["thumb"] == tag
+        assert len(encoded) == 1
+        assert list(shared_cache.values()) == [tag]
+
+    def test_first_apply_from_many_threads_converts_images(self, excel_headers, tmp_path):
+        """새 매퍼의 첫 apply를 여러 스레드가 동시에 호출해도 이미지 필드를 변환"""
+        import sys
+        import threading
+        from src.core.mapper import Mapper
+
+        image_path = tmp_path / "photo.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\nimage")
+        fields = [{"id": f"text{i}", "excel_column": "Frame"} for i in range(20)]
+        fields.append({"id": "photo", "excel_column": "Extra Column", "type": "image"})
+        row = {"Frame": 1, "Extra Column": image_path}
+
+        # 스레드 전환을 잦게 하여 계획 생성 도중의 경쟁을 드러냄
+        original_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            results = []
+            for _ in range(100):
+                mapper = Mapper(fields, excel_headers)
+                barrier = threading.Barrier(4)
+
+                def worker():
+                    barrier.wait()
+                    results.append(mapper.apply(row)["photo"])
+
+                threads = [threading.Thread(target=worker) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            sys.setswitchinterval(original_interval)
+
+        assert len(results) == 400
+        assert all(isinstance(tag, str) and tag.startswith("<img ") for tag in results)
+
+    def test_image_mime_type_from_signature(self, tmp_path):
+        """MIME 타입은 확장자가 아니라 파일 시그니처로 판별"""
+        import base64
+        from src.core.mapper import Mapper
+
+        content = b"\xff\xd8\xff\xe0jpeg-data"
+        mislabeled = tmp_path / "photo.png"
+        mislabeled.write_bytes(content)
+
+        mapper = Mapper([], [])
+
+        assert mapper._convert_image_to_data_url(mislabeled) == (
+            "data:image/jpeg;base64," + base64.b64encode(content).decode("ascii")
+        )
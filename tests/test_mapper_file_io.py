@@ -109,6 +109,20 @@ class TestSaveToFile:
 
         assert data["mappings"]["wrist"] is None
 
+    def test_save_overwrites_without_leaving_temp_file(self, sample_mapper, tmp_path):
+        """기존 파일을 교체하고 임시 파일은 남기지 않음"""
+        file_path = tmp_path / "test.mapping"
+        file_path.write_text("old", encoding="utf-8")
+
+        sample_mapper.set_mapping("upper_arm", "Arm Upper")
+        sample_mapper.save_to_file(str(file_path), "RULA", "test.xlsx")
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert data["mappings"]["upper_arm"] == "Arm Upper"
+        assert [p.name for p in tmp_path.iterdir()] == ["test.mapping"]
+
 
 class TestLoadFromFile:
     """load_from_file() 메서드 테스트"""
@@ -155,3 +155,48 @@ class TestTemplateManager:
         assert isinstance(names, list)
         assert "RULA" in names
         assert "OWAS" in names
+
+    def test_unchanged_templates_loaded_from_index(self, test_templates_dir, monkeypatch):
+        """변경되지 않은 템플릿은 인덱스에서 로드하고, 변경된 템플릿만 다시 파싱"""
+        import os
+        from src.core.template_manager import Template, TemplateManager
+
+        first = TemplateManager(test_templates_dir)
+        assert (test_templates_dir / TemplateManager.INDEX_FILE).exists()
+
+        parsed = []
+        original = Template.from_mapping_file.__func__
+
+        def counting_from_mapping_file(cls, mapping_path):
+            parsed.append(mapping_path.name)
+            return original(cls, mapping_path)
+
+        monkeypatch.setattr(Template, "from_mapping_file", classmethod(counting_from_mapping_file))
+
+        second = TemplateManager(test_templates_dir)
+        assert parsed == []
+        assert second.get("RULA") == first.get("RULA")
+        assert second.get("OWAS") == first.get("OWAS")
+
+        # 매핑 파일 수정 시 해당 템플릿만 다시 파싱
+        mapping_path = test_templates_dir / "rula" / "rula.mapping.json"
+        data = json.loads(mapping_path.read_text())
+        data["version"] = "2.0"
+        mapping_path.write_text(json.dumps(data))
+        stat = mapping_path.stat()
+        os.utime(mapping_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        third = TemplateManager(test_templates_dir)
+        assert parsed == ["rula.mapping.json"]
+        assert third.get("RULA").version == "2.0"
+
+    def test_find_file_prefers_extension_order(self, tmp_path):
+        """템플릿 파일 탐색 시 확장자 목록 순서 우선"""
+        from src.core.template_manager import Template
+
+        (tmp_path / "old.htm").write_text("<html></html>")
+        (tmp_path / "main.HTML").write_text("<html></html>")
+        (tmp_path / "main.mapping.json").write_text("{}")
+
+        assert Template._find_file(tmp_path, [".html", ".htm"]) == tmp_path / "main.HTML"
+        assert Template._find_file(tmp_path, [".png", ".jpg"]) is None
@@ -104,6 +104,130 @@ class TestTemplateStorageInit:
         assert templates[0].is_builtin is True
         assert templates[0].is_readonly is True
 
+    def test_scan_skips_hidden_and_incomplete_dirs(self, storage_with_builtin, temp_templates_dir):
+        """숨김 폴더와 매핑 파일이 없는 폴더는 스캔에서 제외"""
+        (temp_templates_dir / "_builtin" / "empty").mkdir()
+        hidden_dir = temp_templates_dir / "_builtin" / ".hidden"
+        hidden_dir.mkdir()
+        shutil.copy(
+            temp_templates_dir / "_builtin" / "test_template" / "test.mapping.json",
+            hidden_dir / "hidden.mapping.json",
+        )
+        (temp_templates_dir / "user" / "no_mapping").mkdir()
+
+        storage_with_builtin.refresh()
+
+        assert [t.id for t in storage_with_builtin.get_all_templates()] == ["test_template"]
+
+    def test_unchanged_templates_loaded_from_index(self, storage_with_builtin, temp_templates_dir, monkeypatch):
+        """변경되지 않은 템플릿은 인덱스에서 로드하고 변경된 템플릿만 다시 파싱"""
+        from src.core.template_manager import Template
+
+        created = storage_with_builtin.create_template(
+            name="User Template",
+            html_content="<html></html>",
+            fields=[],
+        )
+        storage_with_builtin.update_template_active(created.id, False)
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("매핑 파일을 다시 파싱하면 안 됨")
+
+        with monkeypatch.context() as m:
+            m.setattr(Template, "from_mapping_file", fail_load)
+            reloaded = TemplateStorage(temp_templates_dir)
+
+        assert reloaded.get_template("test_template").name == "Test Template"
+        assert reloaded.get_template(created.id).name == "User Template"
+        assert reloaded.get_template(created.id).metadata.is_active is False
+
+        # 매핑 파일이 바뀐 템플릿은 다시 파싱
+        mapping_path = temp_templates_dir / "_builtin" / "test_template" / "test.mapping.json"
+        mapping_path.write_text(mapping_path.read_text().replace("Test Template", "Changed"))
+
+        assert TemplateStorage(temp_templates_dir).get_template("test_template").name == "Changed"
+
+    def test_index_defers_fields_until_accessed(self, storage_with_builtin, temp_templates_dir, monkeypatch):
+        """인덱스에서 복원한 템플릿은 fields를 처음 접근할 때 매핑 파일에서 읽음"""
+        from src.core import json_io
+
+        reloaded = TemplateStorage(temp_templates_dir)
+        template = reloaded.get_template("test_template")
+
+        loaded = []
+        original_load = json_io.load_file
+
+        def counting_load(path):
+            loaded.append(path)
+            return original_load(path)
+
+        monkeypatch.setattr(json_io, "load_file", counting_load)
+
+        assert template.fields == [{"id": "title", "label": "제목", "excel_column": "Title"}]
+        assert template.fields is template.fields
+        assert loaded == [template.mapping_path]
+
+    def test_deferred_fields_error_not_cached(self, storage_with_builtin, temp_templates_dir):
+        """지연 로드한 매핑 파일을 읽을 수 없으면 빈 목록 대신 TemplateError, 복구 후 다시 읽음"""
+        template = TemplateStorage(temp_templates_dir).get_template("test_template")
+        mapping_path = template.mapping_path
+        original = mapping_path.read_text()
+
+        mapping_path.write_text("{ broken")
+        with pytest.raises(TemplateError):
+            template.fields
+
+        mapping_path.unlink()
+        with pytest.raises(TemplateError):
+            template.fields
+
+        mapping_path.write_text(original)
+        assert template.fields == [{"id": "title", "label": "제목", "excel_column": "Title"}]
+
+    @pytest.mark.parametrize("relocate", [shutil.move, shutil.copytree])
+    def test_index_paths_follow_relocated_root(self, storage_with_builtin, temp_templates_dir, tmp_path, relocate):
+        """루트를 옮기거나 복사해도 인덱스에서 복원한 경로는 새 위치를 가리킴"""
+        created = storage_with_builtin.create_template(
+            name="User Template",
+            html_content="<html>old</html>",
+            fields=[{"id": "title", "label": "제목", "excel_column": "Title"}],
+        )
+        new_root = tmp_path / "relocated"
+        relocate(str(temp_templates_dir), str(new_root))
+        temp_templates_dir.mkdir(exist_ok=True)  # fixture 정리용
+
+        storage = TemplateStorage(new_root)
+        builtin = storage.get_template("test_template")
+        user = storage.get_template(created.id)
+
+        assert builtin.template_path == new_root / "_builtin" / "test_template" / "test.html"
+        assert builtin.mapping_path.parent == builtin.template_path.parent
+        assert user.template_path == new_root / "user" / created.id / "template.html"
+        assert user.fields == [{"id": "title", "label": "제목", "excel_column": "Title"}]
+
+        storage.update_template(created.id, html_content="<html>new</html>")
+
+        assert user.template_path.read_text() == "<html>new</html>"
+        if relocate is shutil.copytree:
+            assert (temp_templates_dir / "user" / created.id / "template.html").read_text() == "<html>old</html>"
+
+    def test_scan_many_templates_in_parallel(self, storage_with_builtin, temp_templates_dir):
+        """폴더가 많으면 스레드 풀로 읽어도 모든 템플릿을 로드"""
+        count = TemplateStorage.PARALLEL_SCAN_MIN + 2
+        created = {
+            storage_with_builtin.create_template(
+                name=f"Template {i}", html_content="<html></html>", fields=[]
+            ).id: f"Template {i}"
+            for i in range(count)
+        }
+
+        for use_index in (False, True):
+            if not use_index:
+                (temp_templates_dir / TemplateStorage.INDEX_FILE).unlink()
+            reloaded = TemplateStorage(temp_templates_dir)
+            assert {t.id: t.name for t in reloaded.get_user_templates()} == created
+            assert reloaded.get_template("test_template") is not None
+
 
 class TestTemplateStorageRead:
     """TemplateStorage 읽기 테스트"""
@@ -140,6 +264,36 @@ class TestTemplateStorageRead:
         assert template is not None
         assert template.id == "test_template"
 
+    def test_filtered_lists_reflect_changes(self, storage_with_builtin):
+        """기본/사용자 목록이 생성/삭제를 반영하고 반환 목록 수정은 캐시에 영향 없음"""
+        assert storage_with_builtin.get_user_templates() == []
+        storage_with_builtin.get_builtin_templates().clear()
+        assert len(storage_with_builtin.get_builtin_templates()) == 1
+
+        created = storage_with_builtin.create_template(
+            name="User", html_content="<html></html>", fields=[]
+        )
+        assert [t.id for t in storage_with_builtin.get_user_templates()] == [created.id]
+
+        storage_with_builtin.delete_template(created.id)
+        assert storage_with_builtin.get_user_templates() == []
+
+    def test_get_template_by_name_after_changes(self, storage_with_builtin):
+        """이름 조회가 생성/이름 변경/삭제를 반영"""
+        assert storage_with_builtin.get_template_by_name("User") is None
+
+        created = storage_with_builtin.create_template(
+            name="User", html_content="<html></html>", fields=[]
+        )
+        assert storage_with_builtin.get_template_by_name("User").id == created.id
+
+        storage_with_builtin.update_template_name(created.id, "Renamed")
+        assert storage_with_builtin.get_template_by_name("User") is None
+        assert storage_with_builtin.get_template_by_name("Renamed").id == created.id
+
+        storage_with_builtin.delete_template(created.id)
+        assert storage_with_builtin.get_template_by_name("Renamed") is None
+
 
 class TestTemplateStorageCreate:
     """TemplateStorage 생성 테스트"""
@@ -171,6 +325,25 @@ class TestTemplateStorageCreate:
         assert len(user_templates) == 1
         assert user_templates[0].name == "User Template"
 
+    def test_create_template_does_not_reread_mapping(self, storage_with_builtin, monkeypatch):
+        """생성 직후 매핑 파일을 다시 읽지 않고 메모리의 데이터로 템플릿 구성"""
+        from src.core.template_manager import Template
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("매핑 파일을 다시 읽으면 안 됨")
+
+        monkeypatch.setattr(Template, "from_mapping_file", fail_load)
+
+        created = storage_with_builtin.create_template(
+            name="In Memory",
+            html_content="<html></html>",
+            fields=[{"id": "title", "label": "제목"}],
+        )
+
+        assert created.template_path.name == "template.html"
+        assert created.mapping_path.name == "mapping.json"
+        assert created.fields == [{"id": "title", "label": "제목"}]
+
 
 class TestTemplateStorageCopy:
     """TemplateStorage 복사 테스트"""
@@ -213,6 +386,106 @@ class TestTemplateStorageUpdate:
 
         assert updated.name == "Updated Name"
 
+    def test_update_does_not_rescan_other_templates(self, storage_with_builtin, monkeypatch):
+        """업데이트 시 다른 템플릿 파일을 다시 읽지 않고 캐시만 수정"""
+        template = storage_with_builtin.create_template(
+            name="Original",
+            html_content="<html></html>",
+            fields=[],
+        )
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("템플릿 재스캔이 발생하면 안 됨")
+
+        monkeypatch.setattr(
+            "src.core.template_storage.Template.from_mapping_file", fail_load
+        )
+
+        storage_with_builtin.update_template_name(template.id, "Renamed")
+        storage_with_builtin.update_template_active(template.id, False)
+        storage_with_builtin.update_template_name("test_template", "Builtin Renamed")
+
+        updated = storage_with_builtin.get_template(template.id)
+        assert updated.name == "Renamed"
+        assert updated.metadata.name == "Renamed"
+        assert updated.metadata.is_active is False
+        assert storage_with_builtin.get_template("test_template").name == "Builtin Renamed"
+
+    def test_external_meta_change_reloaded(self, storage_with_builtin):
+        """meta.json이 외부에서 변경되면 조회 시 해당 템플릿만 다시 로드"""
+        import json
+        import os
+
+        template = storage_with_builtin.create_template(
+            name="Original",
+            html_content="<html></html>",
+            fields=[],
+        )
+        meta_path = (
+            storage_with_builtin._user_dir / template.id / "meta.json"
+        )
+        meta_data = json.loads(meta_path.read_text(encoding="utf-8"))
+        meta_data["is_active"] = False
+        meta_path.write_text(json.dumps(meta_data), encoding="utf-8")
+        stat = meta_path.stat()
+        os.utime(meta_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert storage_with_builtin.get_template(template.id).metadata.is_active is False
+
+    def test_update_template_without_meta_file(self, storage_with_builtin):
+        """meta.json이 없는 사용자 템플릿도 업데이트 시 새로 생성"""
+        template = storage_with_builtin.create_template(
+            name="Original",
+            html_content="<html></html>",
+            fields=[],
+        )
+        meta_path = storage_with_builtin._user_dir / template.id / "meta.json"
+        meta_path.unlink()
+
+        storage_with_builtin.update_template_active(template.id, False)
+
+        assert meta_path.exists()
+        assert storage_with_builtin.get_template(template.id).metadata.is_active is False
+
+    def test_update_without_changes_skips_writes(self, storage_with_builtin):
+        """내용이 같으면 파일을 다시 쓰지 않음"""
+        template = storage_with_builtin.create_template(
+            name="Original",
+            html_content="<html></html>",
+            fields=[],
+            description="desc",
+        )
+        template_dir = storage_with_builtin._user_dir / template.id
+        before = {p.name: p.stat().st_mtime_ns for p in template_dir.iterdir()}
+        updated_at = template.metadata.updated_at
+
+        result = storage_with_builtin.update_template(
+            template.id, name="Original", fields=[], description="desc"
+        )
+
+        assert {p.name: p.stat().st_mtime_ns for p in template_dir.iterdir()} == before
+        assert result.metadata.updated_at == updated_at
+
+    def test_unchanged_name_description_active_skip_io(self, storage_with_builtin, monkeypatch):
+        """이름/설명/활성화 상태가 같으면 파일을 읽거나 쓰지 않음"""
+        from src.core import json_io
+
+        template = storage_with_builtin.create_template(
+            name="Same", html_content="<html></html>", fields=[], description="desc"
+        )
+
+        def fail_io(*args, **kwargs):
+            raise AssertionError("파일 입출력이 발생하면 안 됨")
+
+        monkeypatch.setattr(json_io, "load_file", fail_io)
+        monkeypatch.setattr(json_io, "write_file", fail_io)
+
+        storage_with_builtin.update_template_name(template.id, "Same")
+        storage_with_builtin.update_template_description(template.id, "desc")
+        storage_with_builtin.update_template_active(template.id, True)
+        storage_with_builtin.update_template_name("test_template", "Test Template")
+        storage_with_builtin.update_template_active("test_template", True)
+
     def test_update_builtin_template_fails(self, storage_with_builtin):
         """기본 템플릿 업데이트 실패"""
         with pytest.raises(TemplateError):
@@ -260,6 +533,31 @@ class TestTemplateStorageExportImport:
         assert result is True
         assert export_path.exists()
 
+    def test_export_template_entries(self, storage_with_builtin, temp_templates_dir, tmp_path):
+        """템플릿 폴더의 모든 파일을 폴더명 아래에 담고, 이미지와 작은 파일은 무압축 저장"""
+        import zipfile
+
+        template_dir = temp_templates_dir / "_builtin" / "test_template"
+        (template_dir / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\0" * 100_000)
+        (template_dir / "large.js").write_text("x" * 100_000)
+
+        export_path = tmp_path / "exported.zip"
+        storage_with_builtin.export_template("test_template", export_path)
+
+        with zipfile.ZipFile(export_path) as zf:
+            infos = {info.filename: info for info in zf.infolist()}
+            assert zf.read("test_template/test.html") == (template_dir / "test.html").read_bytes()
+
+        assert set(infos) == {
+            "test_template/test.html",
+            "test_template/test.mapping.json",
+            "test_template/image.png",
+            "test_template/large.js",
+        }
+        assert infos["test_template/image.png"].compress_type == zipfile.ZIP_STORED
+        assert infos["test_template/test.html"].compress_type == zipfile.ZIP_STORED
+        assert infos["test_template/large.js"].compress_type == zipfile.ZIP_DEFLATED
+
     def test_import_template(self, storage_with_builtin, tmp_path):
         """템플릿 가져오기"""
         # 먼저 내보내기
@@ -273,6 +571,24 @@ class TestTemplateStorageExportImport:
         assert imported.name == "Imported"
         assert imported.is_builtin is False
 
+    def test_import_template_with_root_files(self, storage_with_builtin, tmp_path):
+        """폴더 없이 루트에 파일이 있는 ZIP 가져오기"""
+        import zipfile
+
+        zip_path = tmp_path / "flat.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("template.html", "<html>가져오기</html>")
+            zf.writestr(
+                "mapping.json",
+                '{"name": "Flat", "fields": [{"id": "title", "label": "제목"}]}',
+            )
+
+        imported = storage_with_builtin.import_template(zip_path)
+
+        assert imported.name == "Flat"
+        assert imported.fields == [{"id": "title", "label": "제목"}]
+        assert imported.template_path.read_text(encoding="utf-8") == "<html>가져오기</html>"
+
 
 class TestTemplateStorageRefresh:
     """TemplateStorage 새로고침 테스트"""